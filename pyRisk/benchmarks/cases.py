@@ -0,0 +1,178 @@
+# benchmarks/cases.py
+
+import os
+import numpy as np
+from PIL import Image
+from typing import Tuple
+from controllers.application_controller import ApplicationController
+from models.player import Player
+from models.roll_table import RollTable
+from utils.map_cache import MapCache
+from utils.segmentation import image_to_color_ids, label_regions, luminance
+from utils.utils import flood_fill
+from benchmarks.harness import BenchmarkRunner
+
+MAP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "temp_images", "map_turn_0.png")
+FLOOD_FILL_SIZES = {"small": 200, "medium": 20000, "ocean": None}  # Target region area in pixels; None is the largest
+PLAYER_COLORS = [(230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200),
+                 (245, 130, 48), (145, 30, 180), (70, 240, 240), (240, 50, 230)]
+REGIONS_PER_TURN = 40  # Regions each player takes per simulated turn
+FILL_REGIONS = 200  # Regions repainted by the compositing benchmark
+SEED = 1234
+SHORT_ROLL_RANGE = 1000  # Rolls of up to three digits, which repeat often in a long batch
+
+
+def flood_fill_seed(image: Image.Image, target_area: int = None) -> Tuple[int, int, int]:
+    """
+    Pick a starting pixel inside a non-border region whose area is closest to a target.
+
+    Args:
+        image (Image.Image): The map.
+        target_area (int, optional): Wanted area in pixels; None picks the largest region (the ocean).
+
+    Returns:
+        tuple: (x, y, area) of the chosen region.
+    """
+    color_ids = image_to_color_ids(image)
+    labels, region_count = label_regions(color_ids)
+    areas = np.bincount(labels.ravel(), minlength=region_count)
+    colors = np.zeros(region_count, dtype=np.uint32)
+    colors[labels.ravel()] = color_ids.ravel()
+    candidates = np.flatnonzero(luminance(colors) >= 40)
+    if target_area is None:
+        region = candidates[np.argmax(areas[candidates])]
+    else:
+        region = candidates[np.argmin(np.abs(areas[candidates] - target_area))]
+    position = int(np.flatnonzero(labels.ravel() == region)[0])
+    return position % labels.shape[1], position // labels.shape[1], int(areas[region])
+
+
+def bench_flood_fill(runner: BenchmarkRunner, base: Image.Image) -> None:
+    for size, target_area in FLOOD_FILL_SIZES.items():
+        name = f"flood_fill.{size}"
+        if not runner.selected(name):
+            continue
+        x, y, area = flood_fill_seed(base, target_area)
+        target = base.getpixel((x, y))
+        runner.measure(name, lambda image: flood_fill(image, x, y, target, (1, 2, 3, 255)),
+                       setup=lambda: (base.copy(),), repeat=3 if target_area is None else None,
+                       region_area=area)
+
+
+def bench_roll_table(runner: BenchmarkRunner) -> None:
+    table = RollTable()
+    distinct = range(1, 100000)
+    # A long import of short rolls, where most rolls repeat and the batch scores each distinct roll once
+    rng = np.random.default_rng(SEED)
+    short = rng.integers(1, SHORT_ROLL_RANGE, size=len(distinct)).tolist()
+    for suffix, rolls in (("", distinct), (".short", short)):
+        loop = runner.measure(f"roll_table.calculate_tiles{suffix}",
+                              lambda: [table.calculate_tiles(roll) for roll in rolls], rolls=len(rolls))
+        batch = runner.measure(f"roll_table.calculate_tiles_batch{suffix}",
+                               lambda: table.calculate_tiles_batch(rolls), rolls=len(rolls))
+        if loop and batch:
+            batch["params"]["speedup"] = loop["median"] / batch["median"]
+            print(f"{'':<40} batch speedup {batch['params']['speedup']:.2f}x")
+
+
+def build_game(turns: int, map_path: str = MAP_PATH) -> ApplicationController:
+    """
+    Play a headless game in the current directory: the test map, eight players,
+    and every player taking REGIONS_PER_TURN unowned regions each turn.
+
+    Args:
+        turns (int): Turns to play; each one saves a map snapshot.
+        map_path (str): Base map to play on, e.g. one from benchmarks.synthetic.
+
+    Returns:
+        ApplicationController: The controller holding the game.
+    """
+    controller = ApplicationController(None)
+    controller.model["map_cache"] = MapCache(os.path.join(os.getcwd(), "map_cache"))
+    for index, color in enumerate(PLAYER_COLORS):
+        controller.model["players"].add(Player(f"Player {index + 1}", color, None))
+    region_map = controller.load_base_map(map_path)
+    controller.model["map_image"] = controller.model["original_map_image"].copy()
+    controller.save_original_map()
+    controller.setup_map_models(region_map)
+    controller.save_current_map_state()
+
+    rng = np.random.default_rng(SEED)
+    ownership = controller.model["ownership"]
+    for _ in range(turns):
+        for player in controller.model["players"]:
+            unowned = np.flatnonzero(~region_map.is_border & (ownership.owners == 0))
+            picked = rng.choice(unowned, size=min(REGIONS_PER_TURN, len(unowned)), replace=False)
+            controller.fill_regions(picked, player.id)
+        controller.advance_turn()
+    return controller
+
+
+def bench_game(runner: BenchmarkRunner, turns: int, map_path: str = MAP_PATH) -> None:
+    names = ["save_load.write_game", "save_load.read_game", "save_load.round_trip",
+             "display.render_fill", "gif_export"]
+    if not any(runner.selected(name) for name in names):
+        return
+    controller = build_game(turns, map_path)
+    owned = int(np.count_nonzero(controller.model["ownership"].owners))
+    runner.measure("save_load.write_game", controller.write_game, setup=lambda: ("game.mprg",),
+                   turns=turns, owned_regions=owned)
+    controller.write_game("game.mprg")
+    # The first load warms the map cache, as reopening a game does in practice
+    runner.measure("save_load.read_game", controller.read_game, setup=lambda: ("game.mprg",),
+                   turns=turns, owned_regions=owned)
+
+    def round_trip():
+        controller.write_game("round_trip.mprg")
+        controller.read_game("round_trip.mprg")
+    runner.measure("save_load.round_trip", round_trip, turns=turns, owned_regions=owned)
+
+    region_map = controller.model["region_map"]
+    rng = np.random.default_rng(SEED)
+    regions = rng.choice(np.flatnonzero(~region_map.is_border), size=FILL_REGIONS, replace=False)
+    players = [player.id for player in controller.model["players"]]
+
+    def fill_setup():
+        # Undo between rounds so each round repaints the same regions from the same state
+        while controller.model["map_history"]:
+            controller.undo_action()
+        return regions, int(rng.choice(players))
+    runner.measure("display.render_fill", controller.fill_regions, setup=fill_setup, regions=FILL_REGIONS)
+
+    runner.measure("gif_export", controller.write_gif, setup=lambda: ("game.gif",), repeat=3,
+                   turns=len(controller.model["game_states"]))
+
+
+def bench_photo_image(runner: BenchmarkRunner, base: Image.Image) -> None:
+    """
+    Time what GameView hands to Tk: a new PhotoImage on display, and a paste on repaint.
+    """
+    names = ("display.photo_image", "display.photo_paste")
+    if not any(runner.selected(name) for name in names):
+        return
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        for name in names:
+            runner.skip(name, f"no display ({e})")
+        return
+    from PIL import ImageTk
+    root.withdraw()
+    try:
+        runner.measure("display.photo_image", ImageTk.PhotoImage, setup=lambda: (base,))
+        photo = ImageTk.PhotoImage(base)
+        runner.measure("display.photo_paste", photo.paste, setup=lambda: (base,))
+    finally:
+        root.destroy()
+
+
+def run_all(runner: BenchmarkRunner, turns: int, map_path: str = MAP_PATH) -> None:
+    """
+    Run every benchmark group the runner selects. Writes game files to the current directory.
+    """
+    base = Image.open(map_path).convert("RGBA")
+    bench_flood_fill(runner, base)
+    bench_roll_table(runner)
+    bench_game(runner, turns, map_path)
+    bench_photo_image(runner, base)
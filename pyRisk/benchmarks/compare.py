@@ -0,0 +1,281 @@
+# benchmarks/compare.py
+#
+# Run from the pyRisk directory:
+#     python -m benchmarks.compare --record --runs 5       # run the suite five times and store it as the baseline
+#
+# Record the baseline on the reference machine the gate runs on, which needs at least MIN_BASELINE_CPUS cores.
+#     python -m benchmarks.compare                         # rerun and fail on regressions
+#     python -m benchmarks.compare --results results.json  # check results from benchmarks.run instead
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from benchmarks.harness import DEFAULT_REPEAT, DEFAULT_WARMUP, RESULTS_SCHEMA
+from benchmarks.run import DEFAULT_TURNS, run_suite
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 0.25  # Allowed slowdown of the median, relative to the baseline
+NOISE_FACTOR = 2.0  # IQRs of slack added on top, so a noisy case needs a bigger jump to fail
+MAX_NOISE_SHARE = 0.25  # The IQR slack never exceeds this share of the baseline median
+MIN_DELTA = 0.0005  # Changes under half a millisecond are never regressions
+DEFAULT_RUNS = 3  # Suite runs merged into a recorded baseline
+DEFAULT_CONFIRM = 2  # Reruns of failing cases before a regression is reported
+MIN_BASELINE_CPUS = 2  # Fewer cores leave the timings at the mercy of the scheduler
+# Hot paths get their own tolerances; prefixes are matched against case names
+TOLERANCES = {
+    "flood_fill.": 0.20,
+    "roll_table.": 0.20,
+    "save_load.": 0.25,
+    "display.render_fill": 0.25,
+    "gif_export": 0.30,
+}
+ENVIRONMENT_KEYS = ("python", "implementation", "machine", "cpu_count", "numpy", "pillow")
+
+
+def tolerance_for(name: str) -> float:
+    for prefix, tolerance in TOLERANCES.items():
+        if name.startswith(prefix):
+            return tolerance
+    return DEFAULT_TOLERANCE
+
+
+def compare_case(baseline: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decide whether one case regressed against its baseline.
+
+    The allowed slowdown is the case's relative tolerance of the baseline
+    median, plus NOISE_FACTOR times the larger of the two IQRs capped at
+    MAX_NOISE_SHARE of the baseline median, and never less than MIN_DELTA,
+    so even a noisy case fails well before it doubles. A case only
+    regresses when its median exceeds that allowance and its fastest run is
+    also slower than the baseline's fastest by more than the tolerance, so
+    one busy stretch on the machine doesn't fail the gate on its own.
+
+    Args:
+        baseline (dict): The stored result.
+        current (dict): The new result.
+
+    Returns:
+        dict: Medians, change, allowance and a status of "ok", "faster" or "REGRESSED".
+    """
+    tolerance = tolerance_for(current["name"])
+    noise = min(NOISE_FACTOR * max(baseline.get("iqr", 0.0), current.get("iqr", 0.0)),
+                MAX_NOISE_SHARE * baseline["median"])
+    allowed = max(tolerance * baseline["median"] + noise, MIN_DELTA)
+    delta = current["median"] - baseline["median"]
+    min_regressed = current["min"] > baseline["min"] * (1 + tolerance)
+    if delta > allowed and min_regressed:
+        status = "REGRESSED"
+    elif -delta > allowed:
+        status = "faster"
+    else:
+        status = "ok"
+    return {
+        "name": current["name"],
+        "baseline": baseline["median"],
+        "current": current["median"],
+        "change": delta / baseline["median"] if baseline["median"] else 0.0,
+        "allowed": allowed / baseline["median"] if baseline["median"] else 0.0,
+        "status": status,
+    }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    only: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Compare every case in two benchmark reports.
+
+    Cases missing from the new report count as regressions, since a
+    renamed or broken benchmark would otherwise pass silently. Cases with
+    no baseline are listed as "new"; skipped cases as "skipped".
+
+    Args:
+        baseline (dict): The stored report.
+        current (dict): The new report.
+        only (list, optional): Substrings of case names that were run; others aren't expected.
+
+    Returns:
+        list: One row per case, in the baseline's order followed by new cases.
+    """
+    stored = {result["name"]: result for result in baseline["results"]}
+    fresh = {result["name"]: result for result in current["results"]}
+    skipped = {entry["name"] for entry in current.get("skipped", [])}
+    rows = []
+    for name, result in stored.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        if name in fresh:
+            rows.append(compare_case(result, fresh[name]))
+        else:
+            rows.append({"name": name, "baseline": result["median"], "current": None, "change": None,
+                         "allowed": None, "status": "skipped" if name in skipped else "MISSING"})
+    for name, result in fresh.items():
+        if name not in stored:
+            rows.append({"name": name, "baseline": None, "current": result["median"], "change": None,
+                         "allowed": None, "status": "new"})
+    return rows
+
+
+def merge_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge several runs of the suite into one report.
+
+    Timings can shift between processes as well as between rounds, e.g.
+    when the scheduler moves the process to a slower core, and one run's
+    IQR doesn't show that. Each case keeps the result of the run with the
+    middle median, plus the medians of every run for reference.
+
+    Args:
+        reports (list): Reports from separate runs, in run order.
+
+    Returns:
+        dict: The last report with the merged results.
+    """
+    runs: Dict[str, List[Dict[str, Any]]] = {}
+    for report in reports:
+        for result in report["results"]:
+            runs.setdefault(result["name"], []).append(result)
+    results = []
+    for name, results_of_case in runs.items():
+        ordered = sorted(results_of_case, key=lambda result: result["median"])
+        medians = [result["median"] for result in ordered]
+        results.append({**ordered[(len(ordered) - 1) // 2], "run_medians": medians})
+    return {**reports[-1], "results": results}
+
+
+def better_result(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    return first if first["median"] <= second["median"] else second
+
+
+def environment_differences(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    old, new = baseline.get("environment", {}), current.get("environment", {})
+    differences = [f"{key}: {old.get(key)} -> {new.get(key)}" for key in ENVIRONMENT_KEYS if old.get(key) != new.get(key)]
+    old_map, new_map = baseline.get("settings", {}).get("map"), current.get("settings", {}).get("map")
+    if old_map and new_map and old_map != new_map:
+        differences.append(f"map: {old_map} -> {new_map}")
+    return differences
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """
+    Render the comparison as a text table, in milliseconds.
+    """
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.3f}"
+
+    def percent(value: Optional[float], signed: bool = True) -> str:
+        return "-" if value is None else f"{value * 100:+.1f}%" if signed else f"{value * 100:.1f}%"
+
+    lines = [f"{'Case':<36}{'baseline ms':>14}{'current ms':>14}{'change':>10}{'allowed':>10}  status"]
+    for row in rows:
+        lines.append(f"{row['name']:<36}{ms(row['baseline']):>14}{ms(row['current']):>14}"
+                     f"{percent(row['change']):>10}{percent(row['allowed'], False):>10}  {row['status']}")
+    return "\n".join(lines)
+
+
+def failures(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [row for row in rows if row["status"] in ("REGRESSED", "MISSING")]
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        report = json.load(f)
+    if report.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(f"{path} has results schema {report.get('schema')}, expected {RESULTS_SCHEMA}")
+    return report
+
+
+def record_baseline(report: Dict[str, Any], path: str, only: Optional[List[str]] = None) -> Tuple[int, int]:
+    """
+    Store results as the baseline, one entry per case.
+
+    With ``only`` set, the chosen cases replace their entries in the
+    existing baseline and the rest are kept, so one slow case can be
+    re-recorded without rerunning the whole suite.
+
+    Returns:
+        tuple: (cases written, cases in the baseline).
+    """
+    written = len(report["results"])
+    if only and os.path.exists(path):
+        baseline = load_report(path)
+        fresh = {result["name"]: result for result in report["results"]}
+        kept = [result for result in baseline["results"] if result["name"] not in fresh]
+        report = {**report, "results": kept + list(fresh.values())}
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return written, len(report["results"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Check the benchmarks against a stored baseline; exits 1 when a hot path regresses.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to check against or record")
+    parser.add_argument("--record", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="suite runs merged when recording")
+    parser.add_argument("--confirm", type=int, default=DEFAULT_CONFIRM,
+                        help="reruns of failing cases before reporting a regression")
+    parser.add_argument("--results", help="check this results file from benchmarks.run instead of rerunning")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed rounds per case")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="untimed rounds per case")
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS, help="turns played for the save/load and GIF cases")
+    parser.add_argument("--only", nargs="*", default=[], help="run cases whose names contain any of these")
+    args = parser.parse_args(argv)
+
+    if args.record and not args.results and (os.cpu_count() or 1) < MIN_BASELINE_CPUS:
+        print(f"Not recording a baseline on {os.cpu_count() or 1} CPU(s); record it on the reference machine",
+              file=sys.stderr)
+        return 2
+    if args.results:
+        current = load_report(args.results)
+    elif args.record:
+        current = merge_reports([run_suite(args.repeat, args.warmup, args.turns, args.only).report()
+                                 for _ in range(max(1, args.runs))])
+    else:
+        current = run_suite(args.repeat, args.warmup, args.turns, args.only).report()
+
+    if args.record:
+        cpus = current["environment"].get("cpu_count") or 1
+        if cpus < MIN_BASELINE_CPUS:
+            print(f"{args.results} was measured on {cpus} CPU(s); record the baseline on the reference machine",
+                  file=sys.stderr)
+            return 2
+        written, total = record_baseline(current, args.baseline, args.only)
+        print(f"Recorded {written} cases to {args.baseline} ({total} in the baseline)")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --record", file=sys.stderr)
+        return 2
+    baseline = load_report(args.baseline)
+    only = args.only or current.get("settings", {}).get("only")
+    rows = compare_reports(baseline, current, only)
+    # A regression has to reproduce: rerun just the failing cases and keep each case's better result
+    for attempt in range(args.confirm if not args.results else 0):
+        suspects = [row["name"] for row in rows if row["status"] == "REGRESSED"]
+        if not suspects:
+            break
+        print(f"\nConfirming {len(suspects)} case(s), attempt {attempt + 1} of {args.confirm}: {', '.join(suspects)}")
+        rerun = {result["name"]: result
+                 for result in run_suite(args.repeat, args.warmup, args.turns, suspects).results}
+        current = {**current, "results": [better_result(result, rerun[result["name"]]) if result["name"] in rerun
+                                          else result for result in current["results"]]}
+        rows = compare_reports(baseline, current, only)
+    print()
+    differences = environment_differences(baseline, current)
+    if differences:
+        print("Baseline was recorded on a different setup; expect noise:\n  " + "\n  ".join(differences) + "\n")
+    print(format_table(rows))
+    failed = failures(rows)
+    if failed:
+        print(f"\n{len(failed)} case(s) regressed beyond tolerance: "
+              f"{', '.join(row['name'] for row in failed)}", file=sys.stderr)
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
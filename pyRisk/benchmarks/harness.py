@@ -0,0 +1,138 @@
+# benchmarks/harness.py
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import PIL
+
+RESULTS_SCHEMA = 1
+DEFAULT_REPEAT = 7
+DEFAULT_WARMUP = 1
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Reduce timing samples to order statistics, which are steadier than the mean on a busy machine.
+
+    Args:
+        samples (list): Seconds per run.
+
+    Returns:
+        dict: min, median, mean, stdev, p95, iqr and max, in seconds.
+    """
+    ordered = sorted(samples)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) > 1 else [ordered[0]] * 3
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "p95": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "iqr": quartiles[2] - quartiles[0],
+        "max": ordered[-1],
+    }
+
+
+class BenchmarkRunner:
+    def __init__(self, repeat: int = DEFAULT_REPEAT, warmup: int = DEFAULT_WARMUP,
+                 only: Optional[List[str]] = None):
+        """
+        Initialize a BenchmarkRunner that times cases and collects their statistics.
+
+        Each case runs ``warmup`` untimed rounds and then ``repeat`` timed
+        rounds. Per-round setup runs outside the timed section, and garbage
+        collection is paused while the timed call runs, as timeit does.
+
+        Args:
+            repeat (int): Timed rounds per case.
+            warmup (int): Untimed rounds per case.
+            only (list, optional): Substrings of case names to run; all cases when empty.
+        """
+        self.repeat = repeat
+        self.warmup = warmup
+        self.only = only or []
+        self.settings: Dict[str, Any] = {}  # Run options worth keeping with the results, e.g. the map
+        self.results: List[Dict[str, Any]] = []
+        self.skipped: List[Dict[str, str]] = []
+
+    def selected(self, name: str) -> bool:
+        return not self.only or any(pattern in name for pattern in self.only)
+
+    def measure(self, name: str, func: Callable[..., Any], setup: Optional[Callable[[], tuple]] = None,
+                repeat: Optional[int] = None, **params) -> Optional[Dict[str, Any]]:
+        """
+        Time a case and record its statistics.
+
+        Args:
+            name (str): Case name, e.g. "flood_fill.small".
+            func (Callable): The code being timed, called with setup's result as arguments.
+            setup (Callable, optional): Builds fresh arguments for each round, untimed.
+            repeat (int, optional): Timed rounds, overriding the runner's default for slow cases.
+            params: Extra figures describing the case, stored with the result.
+
+        Returns:
+            dict, optional: The result, or None if the case was filtered out.
+        """
+        if not self.selected(name):
+            return None
+        rounds = repeat or self.repeat
+        samples = []
+        for round_index in range(self.warmup + rounds):
+            args = setup() if setup else ()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                func(*args)
+                elapsed = time.perf_counter() - start
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            if round_index >= self.warmup:
+                samples.append(elapsed)
+        result = {"name": name, "unit": "s", "repeat": rounds, **summarize(samples), "params": params}
+        self.results.append(result)
+        print(f"{name:<40} median {result['median'] * 1000:10.3f} ms  "
+              f"(min {result['min'] * 1000:.3f}, p95 {result['p95'] * 1000:.3f})")
+        return result
+
+    def skip(self, name: str, reason: str) -> None:
+        """
+        Record a case that can't run here, e.g. one needing a display.
+        """
+        if self.selected(name):
+            self.skipped.append({"name": name, "reason": reason})
+            print(f"{name:<40} skipped: {reason}")
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Get the results with a description of the machine they were measured on.
+        """
+        return {
+            "schema": RESULTS_SCHEMA,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": {
+                "python": sys.version.split()[0],
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "cpu_count": os.cpu_count(),
+                "numpy": np.__version__,
+                "pillow": PIL.__version__,
+            },
+            "settings": {"repeat": self.repeat, "warmup": self.warmup, "only": self.only, **self.settings},
+            "results": self.results,
+            "skipped": self.skipped,
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,59 @@
+# benchmarks/run.py
+#
+# Run from the pyRisk directory:
+#     python -m benchmarks.run --output benchmark_results.json
+#     python -m benchmarks.run --only flood_fill roll_table --repeat 15
+#     python -m benchmarks.run --map synthetic_map.png   # load test on a map from benchmarks.synthetic
+
+import argparse
+import os
+import tempfile
+from typing import List, Optional
+from benchmarks.harness import BenchmarkRunner, DEFAULT_REPEAT, DEFAULT_WARMUP
+from benchmarks.cases import MAP_PATH, run_all
+
+DEFAULT_TURNS = 10
+
+
+def run_suite(repeat: int = DEFAULT_REPEAT, warmup: int = DEFAULT_WARMUP, turns: int = DEFAULT_TURNS,
+              only: Optional[List[str]] = None, map_path: str = MAP_PATH) -> BenchmarkRunner:
+    """
+    Run the benchmarks in a scratch directory, which holds the snapshots, saves and map cache.
+
+    Returns:
+        BenchmarkRunner: The runner holding the results.
+    """
+    runner = BenchmarkRunner(repeat, warmup, only)
+    map_path = os.path.abspath(map_path)
+    # The test map is recorded relative to the pyRisk directory, so results from different checkouts match
+    runner.settings["map"] = os.path.relpath(MAP_PATH, os.path.dirname(os.path.dirname(MAP_PATH))) \
+        if map_path == MAP_PATH else map_path
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="pyrisk-bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            run_all(runner, turns, map_path)
+        finally:
+            os.chdir(cwd)
+    return runner
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time the editor's hot paths and write the statistics as JSON.")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed rounds per case")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="untimed rounds per case")
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS, help="turns played for the save/load and GIF cases")
+    parser.add_argument("--only", nargs="*", default=[], help="run cases whose names contain any of these")
+    parser.add_argument("--map", default=MAP_PATH, help="base map for the flood fill and game cases")
+    args = parser.parse_args(argv)
+
+    output = os.path.abspath(args.output)
+    runner = run_suite(args.repeat, args.warmup, args.turns, args.only, args.map)
+    runner.write(output)
+    print(f"Wrote {len(runner.results)} results to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,489 @@
+# benchmarks/synthetic.py
+#
+# Run from the pyRisk directory:
+#     python -m benchmarks.synthetic map synthetic_map.png --scale 10
+#     python -m benchmarks.synthetic game synthetic_game --scale 10 --players 80 --alliances 30 --turns 50
+#     python -m benchmarks.synthetic replay synthetic_game/journal.jsonl
+
+import argparse
+import colorsys
+import json
+import math
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from controllers.application_controller import ApplicationController
+from controllers.event_bus import DiplomacyChanged, PlayerUpdated
+from models.diplomacy import ALLIANCE, NAP
+from models.player import Player
+from models.region_map import RegionMap
+from models.roll_table import RollTable
+
+# Defaults match the size of the test map in temp_images/
+MAP_WIDTH = 2838
+MAP_HEIGHT = 1800
+MAP_REGIONS = 4000
+BORDER_WIDTH = 3
+ANTIALIAS = 0.8  # Blur radius of the border lines in pixels; 0 draws hard edges
+OCEAN_SHARE = 0.3  # Share of the cells that become one connected ocean
+CONTINENTS = 6
+JITTER = (0.1, 0.9)  # Seed position range within its grid cell; wider gives less regular regions
+BAND_ROWS = 256  # Rows labelled at a time, bounding the working memory
+COAST_WAVES = 6  # Random waves summed into the coastline noise
+COAST_NOISE = 0.35
+
+LAND_COLORS = [(255, 255, 255), (255, 249, 189), (220, 220, 220), (242, 240, 228), (204, 232, 196), (255, 222, 173)]
+OCEAN_COLOR = (123, 154, 185)
+
+JOURNAL_FORMAT = 1
+PLAYERS = 8
+TURNS = 10
+CONQUEST = 0.2  # Chance that a tile is taken from a hostile neighbour rather than unowned land
+
+
+def voronoi_labels(width: int, height: int, cells: int, rng: np.random.Generator,
+                   band_rows: int = BAND_ROWS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split an image into Voronoi cells around seeds jittered on a grid.
+
+    With one seed per grid cell, a pixel's nearest seed is almost always
+    in its own cell or one of the eight around it, so each pixel tests nine
+    seeds rather than all of them, and rows are labelled in bands.
+
+    Args:
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        cells (int): Wanted number of cells; the grid rounds it to fit the aspect ratio.
+        rng (np.random.Generator): Source of the seed positions.
+        band_rows (int): Rows labelled at a time.
+
+    Returns:
+        tuple: (labels, seed_x, seed_y): the (height, width) int32 cell index
+            per pixel, and the seed coordinates per cell.
+    """
+    columns = max(1, round(math.sqrt(cells * width / height)))
+    rows = max(1, round(cells / columns))
+    cell_w, cell_h = width / columns, height / rows
+    jitter = rng.uniform(*JITTER, size=(2, rows, columns))
+    seed_x = ((np.arange(columns)[None, :] + jitter[0]) * cell_w).astype(np.float32)
+    seed_y = ((np.arange(rows)[:, None] + jitter[1]) * cell_h).astype(np.float32)
+    # A ring of far-away seeds lets the nine-cell search run off the edges without bounds checks
+    padded_x = np.pad(seed_x, 1, constant_values=np.float32(1e9))
+    padded_y = np.pad(seed_y, 1, constant_values=np.float32(1e9))
+
+    labels = np.empty((height, width), dtype=np.int32)
+    xs = np.arange(width, dtype=np.float32) + 0.5
+    cell_xs = np.minimum((xs / cell_w).astype(np.int64), columns - 1)
+    for top in range(0, height, band_rows):
+        ys = np.arange(top, min(top + band_rows, height), dtype=np.float32)[:, None] + 0.5
+        cell_ys = np.minimum((ys / cell_h).astype(np.int64), rows - 1)
+        best = np.full((len(ys), width), np.inf, dtype=np.float32)
+        band = labels[top:top + len(ys)]
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                row_index, column_index = cell_ys + 1 + dy, cell_xs + 1 + dx
+                distance = (padded_x[row_index, column_index] - xs) ** 2 + (padded_y[row_index, column_index] - ys) ** 2
+                closer = distance < best
+                best = np.where(closer, distance, best)
+                band[...] = np.where(closer, (cell_ys + dy) * columns + (cell_xs + dx), band)
+    return labels, seed_x.ravel(), seed_y.ravel()
+
+
+def cell_groups(seed_x: np.ndarray, seed_y: np.ndarray, width: int, height: int, ocean: float, continents: int,
+                rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decide which cells are ocean and colour the land by continent.
+
+    Cells far from the centre, give or take some wavy coastline noise,
+    become ocean and share group 0, so they merge into one region with no
+    borders inside it. Every land cell is a group of its own, coloured
+    like the nearest of a few random continent centres.
+
+    Returns:
+        tuple: (group per cell, RGB colour per group as a uint8 array).
+    """
+    u, v = seed_x / width - 0.5, seed_y / height - 0.5
+    distance = np.sqrt(u ** 2 + v ** 2) * 2
+    noise = np.zeros_like(distance)
+    for _ in range(COAST_WAVES):
+        angle, frequency, phase = rng.uniform(0, 2 * np.pi), rng.uniform(2, 6), rng.uniform(0, 2 * np.pi)
+        noise += np.sin(frequency * 2 * np.pi * (u * np.cos(angle) + v * np.sin(angle)) + phase)
+    score = distance + COAST_NOISE * noise / COAST_WAVES
+    is_ocean = score >= np.quantile(score, 1 - ocean) if ocean > 0 else np.zeros(len(score), dtype=bool)
+    land = np.flatnonzero(~is_ocean)
+
+    groups = np.zeros(len(seed_x), dtype=np.int32)
+    groups[land] = np.arange(1, len(land) + 1)
+    colors = np.empty((len(land) + 1, 3), dtype=np.uint8)
+    colors[0] = OCEAN_COLOR
+    if len(land):
+        centres = rng.choice(land, size=min(continents, len(land)), replace=False)
+        nearest = np.argmin((seed_x[land, None] - seed_x[centres]) ** 2 + (seed_y[land, None] - seed_y[centres]) ** 2,
+                            axis=1)
+        colors[1:] = np.array(LAND_COLORS, dtype=np.uint8)[nearest % len(LAND_COLORS)]
+    return groups, colors
+
+
+def dilate(mask: np.ndarray, size: int) -> np.ndarray:
+    """
+    Grow a boolean mask with a size x size box, so one-pixel lines become size pixels wide.
+    """
+    before, after = (size - 1) // 2, size // 2
+    grown = mask.copy()
+    for shift in range(1, before + 1):
+        grown[:, shift:] |= mask[:, :-shift]
+    for shift in range(1, after + 1):
+        grown[:, :-shift] |= mask[:, shift:]
+    widened = grown.copy()
+    for shift in range(1, before + 1):
+        widened[shift:] |= grown[:-shift]
+    for shift in range(1, after + 1):
+        widened[:-shift] |= grown[shift:]
+    return widened
+
+
+def generate_map(width: int = MAP_WIDTH, height: int = MAP_HEIGHT, regions: int = MAP_REGIONS,
+                 border_width: int = BORDER_WIDTH, antialias: float = ANTIALIAS, ocean: float = OCEAN_SHARE,
+                 continents: int = CONTINENTS, seed: Optional[int] = None) -> Image.Image:
+    """
+    Draw a synthetic Risk map: Voronoi territories with black borders, coloured by continent, in an ocean.
+
+    Args:
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        regions (int): Approximate number of cells, land and ocean together.
+        border_width (int): Width of the border lines in pixels.
+        antialias (float): Blur radius of the border lines, as a paint program's
+            smoothing leaves them; 0 draws hard edges.
+        ocean (float): Share of the cells that become ocean.
+        continents (int): Number of continent colours.
+        seed (int, optional): Seed for a reproducible map.
+
+    Returns:
+        Image.Image: The RGB map. Saving it as JPEG adds compression noise as well.
+    """
+    rng = np.random.default_rng(seed)
+    labels, seed_x, seed_y = voronoi_labels(width, height, regions, rng)
+    groups, colors = cell_groups(seed_x, seed_y, width, height, ocean, continents, rng)
+    labels = groups[labels]
+
+    edges = np.zeros(labels.shape, dtype=bool)
+    edges[:, :-1] |= labels[:, :-1] != labels[:, 1:]
+    edges[:-1] |= labels[:-1] != labels[1:]
+    borders = dilate(edges, max(1, border_width))
+    del edges
+
+    image = Image.fromarray(colors[labels])
+    del labels
+    mask = Image.fromarray(borders.view(np.uint8) * np.uint8(255))
+    del borders
+    if antialias > 0:
+        mask = mask.filter(ImageFilter.GaussianBlur(antialias))
+    image.paste((0, 0, 0), mask=mask)
+    return image
+
+
+def player_colors(count: int) -> List[Tuple[int, int, int]]:
+    """
+    Pick distinct, saturated player colours by stepping the hue by the golden ratio.
+    """
+    colors = []
+    for index in range(count):
+        hue = (index * 0.618033988749895) % 1
+        saturation = 0.85 - 0.25 * ((index // 7) % 2)
+        value = 0.95 - 0.2 * ((index // 3) % 2)
+        colors.append(tuple(int(round(channel * 255)) for channel in colorsys.hsv_to_rgb(hue, saturation, value)))
+    return colors
+
+
+def packed_color(rgb: Tuple[int, int, int]) -> np.uint32:
+    return np.array(rgb + (255,), dtype=np.uint8).view(np.uint32)[0]
+
+
+def random_pairs(count: int, players: int, rng: np.random.Generator, taken: set) -> List[Tuple[int, int]]:
+    """
+    Pick up to count distinct unordered pairs of player indices not in taken, adding them to it.
+    """
+    pairs = []
+    limit = players * (players - 1) // 2
+    while len(pairs) < count and len(taken) < limit:
+        first, second = sorted(int(index) for index in rng.choice(players, size=2, replace=False))
+        if (first, second) not in taken:
+            taken.add((first, second))
+            pairs.append((first, second))
+    return pairs
+
+
+def generate_journal(map_path: str, region_map: RegionMap, players: int = PLAYERS, alliances: int = 0,
+                     naps: int = 0, turns: int = TURNS, conquest: float = CONQUEST, tiles_scale: int = 1,
+                     roll_table: Optional[RollTable] = None, seed: Optional[int] = None,
+                     name: str = "Synthetic Game") -> List[Dict[str, Any]]:
+    """
+    Simulate a game on a segmented map and list its actions as a journal.
+
+    Each turn every player rolls, the rolls are scored with the roll table,
+    and each player in a shuffled order takes as many tiles as they scored
+    (times tiles_scale). Tiles are taken next to the player's territory:
+    unowned land, or with probability ``conquest`` a region of a
+    neighbouring player they have no alliance or NAP with. Players with no
+    territory, or no room to grow, land on a random unowned region.
+    Regions in the ocean colour are never taken.
+
+    Args:
+        map_path (str): The base map, recorded in the journal's setup action.
+        region_map (RegionMap): The map's regions, as load_base_map segments it.
+        players (int): Number of players.
+        alliances (int): Random alliances made before the first turn.
+        naps (int): Random non-aggression pacts made before the first turn.
+        turns (int): Turns played.
+        conquest (float): Chance per tile of attacking rather than expanding.
+        tiles_scale (int): Multiplier on the scored tiles, for denser games.
+        roll_table (RollTable, optional): Scores the rolls; the default table when not given.
+        seed (int, optional): Seed for a reproducible game.
+        name (str): Game name.
+
+    Returns:
+        list: Journal actions, starting with "setup".
+    """
+    rng = np.random.default_rng(seed)
+    roll_table = roll_table or RollTable()
+    names = [f"Player {index + 1}" for index in range(players)]
+    actions: List[Dict[str, Any]] = [{"action": "setup", "format": JOURNAL_FORMAT, "map": os.path.abspath(map_path),
+                                      "regions": region_map.region_count, "name": name}]
+    for player_name, color in zip(names, player_colors(players)):
+        actions.append({"action": "add_player", "name": player_name, "color": list(color)})
+
+    # Owners hold player index + 1, so 0 stays unowned as in OwnershipStore
+    friendly = np.eye(players + 1, dtype=bool)
+    taken: set = set()
+    for relation, count in ((ALLIANCE, alliances), (NAP, naps)):
+        for first, second in random_pairs(count, players, rng, taken):
+            friendly[first + 1, second + 1] = friendly[second + 1, first + 1] = True
+            actions.append({"action": "diplomacy", "relation": relation, "players": [names[first], names[second]]})
+    friendly[:, 0] = True  # Unowned land is never conquered, only claimed
+
+    claimable = ~region_map.is_border & (region_map.colors != packed_color(OCEAN_COLOR))
+    pairs = np.array(list(region_map.adjacency), dtype=np.int64).reshape(-1, 2)
+    pairs = pairs[claimable[pairs[:, 0]] & claimable[pairs[:, 1]]]
+    sources = np.concatenate((pairs[:, 0], pairs[:, 1]))
+    targets = np.concatenate((pairs[:, 1], pairs[:, 0]))
+    owners = np.zeros(region_map.region_count, dtype=np.int32)
+
+    def expand(owner: int, count: int) -> np.ndarray:
+        taken_regions = []
+        while count > 0:
+            frontier = np.unique(targets[owners[sources] == owner])
+            frontier = frontier[owners[frontier] != owner]
+            free = frontier[owners[frontier] == 0]
+            hostile = frontier[~friendly[owner, owners[frontier]]]
+            attacks = min(int(rng.binomial(count, conquest)), len(hostile))
+            claims = min(count - attacks, len(free))
+            attacks = min(count - claims, len(hostile))
+            if claims + attacks == 0:
+                unowned = np.flatnonzero(claimable & (owners == 0))
+                if not len(unowned):
+                    break
+                wave = rng.choice(unowned, size=1)
+            else:
+                wave = np.concatenate((rng.choice(free, size=claims, replace=False),
+                                       rng.choice(hostile, size=attacks, replace=False)))
+            owners[wave] = owner
+            taken_regions.append(wave)
+            count -= len(wave)
+        return np.concatenate(taken_regions) if taken_regions else np.zeros(0, dtype=np.int64)
+
+    for _ in range(turns):
+        rolls = [[player_name, int(rng.integers(1, 100000))] for player_name in names]
+        actions.append({"action": "rolls", "rolls": rolls})
+        scores = roll_table.score_batch(roll for _, roll in rolls)
+        for index in rng.permutation(players):
+            regions = expand(int(index) + 1, scores[index][0] * tiles_scale)
+            if len(regions):
+                actions.append({"action": "fill", "player": names[index], "regions": regions.tolist()})
+        actions.append({"action": "advance_turn"})
+    return actions
+
+
+def write_journal(path: str, actions: Iterable[Dict[str, Any]]) -> None:
+    with open(path, 'w') as f:
+        for action in actions:
+            f.write(json.dumps(action) + "\n")
+
+
+def read_journal(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def replay_journal(controller: ApplicationController, actions: Iterable[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """
+    Apply journal actions to a controller through the same methods the views use.
+
+    Args:
+        controller (ApplicationController): The controller, usually headless.
+        actions (iterable): Journal actions from generate_journal or read_journal.
+
+    Returns:
+        dict: Action name -> [count, total seconds], for a load-test summary.
+
+    Raises:
+        ValueError: If the journal is in an unknown format, names an unknown
+            action or player, or was made from a map that now segments differently.
+    """
+    timings: Dict[str, List[float]] = {}
+    for action in actions:
+        kind = action["action"]
+        start = time.perf_counter()
+        if kind == "setup":
+            if action.get("format") != JOURNAL_FORMAT:
+                raise ValueError(f"Unsupported journal format {action.get('format')}.")
+            controller.model["game_name"] = action.get("name", controller.model["game_name"])
+            region_map = controller.load_base_map(action["map"])
+            if region_map.region_count != action["regions"]:
+                raise ValueError(f"{action['map']} has {region_map.region_count} regions, "
+                                 f"the journal expects {action['regions']}.")
+            controller.model["map_image"] = controller.model["original_map_image"].copy()
+            controller.save_original_map()
+            controller.setup_map_models(region_map)
+            controller.save_current_map_state()
+        elif kind == "add_player":
+            player = Player(action["name"], tuple(action["color"]), action.get("faction"))
+            controller.model["players"].add(player)
+            controller.refresh_blocs()
+            controller.events.publish(PlayerUpdated(player.id))
+        elif kind == "diplomacy":
+            first, second = (journal_player(controller, name) for name in action["players"])
+            if controller.model["diplomacy"].add(action["relation"], first.id, second.id):
+                controller.refresh_blocs()
+                controller.events.publish(DiplomacyChanged())
+        elif kind == "rolls":
+            controller.record_rolls([tuple(roll) for roll in action["rolls"]])
+        elif kind == "fill":
+            controller.fill_regions(action["regions"], journal_player(controller, action["player"]).id)
+        elif kind == "advance_turn":
+            controller.advance_turn()
+        else:
+            raise ValueError(f"Unknown journal action '{kind}'.")
+        timing = timings.setdefault(kind, [0, 0.0])
+        timing[0] += 1
+        timing[1] += time.perf_counter() - start
+    return timings
+
+
+def journal_player(controller: ApplicationController, name: str) -> Player:
+    player = controller.get_player_by_name(name)
+    if player is None:
+        raise ValueError(f"The journal names an unknown player '{name}'.")
+    return player
+
+
+def save_replayed_game(controller: ApplicationController, path: str) -> None:
+    """
+    Write the replayed game as a .mprg, with absolute snapshot paths so it opens from any directory.
+    """
+    for state in controller.model["game_states"]:
+        state.map_image_path = os.path.abspath(state.map_image_path)
+    controller.model["original_map_path"] = os.path.abspath(controller.model["original_map_path"])
+    controller.write_game(path)
+
+
+def format_timings(timings: Dict[str, List[float]]) -> str:
+    lines = [f"{'Action':<16}{'count':>8}{'total s':>10}{'mean ms':>10}"]
+    for kind, (count, seconds) in timings.items():
+        lines.append(f"{kind:<16}{count:>8}{seconds:>10.2f}{seconds / count * 1000:>10.2f}")
+    return "\n".join(lines)
+
+
+def map_arguments(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Turn the map options into generate_map arguments; --scale multiplies the area and region count.
+    """
+    side = math.sqrt(args.scale)
+    return {"width": round(args.width * side), "height": round(args.height * side),
+            "regions": round(args.regions * args.scale), "border_width": args.border_width,
+            "antialias": args.antialias, "ocean": args.ocean, "continents": args.continents, "seed": args.seed}
+
+
+def main(argv=None) -> int:
+    map_options = argparse.ArgumentParser(add_help=False)
+    map_options.add_argument("--width", type=int, default=MAP_WIDTH, help="map width in pixels")
+    map_options.add_argument("--height", type=int, default=MAP_HEIGHT, help="map height in pixels")
+    map_options.add_argument("--regions", type=int, default=MAP_REGIONS, help="approximate number of cells")
+    map_options.add_argument("--scale", type=float, default=1.0, help="multiply the map area and cell count")
+    map_options.add_argument("--border-width", type=int, default=BORDER_WIDTH, help="border line width in pixels")
+    map_options.add_argument("--antialias", type=float, default=ANTIALIAS, help="border blur radius; 0 for hard edges")
+    map_options.add_argument("--ocean", type=float, default=OCEAN_SHARE, help="share of the cells that are ocean")
+    map_options.add_argument("--continents", type=int, default=CONTINENTS, help="number of continent colours")
+    map_options.add_argument("--seed", type=int, help="seed for reproducible output")
+
+    parser = argparse.ArgumentParser(description="Generate synthetic maps and games for load testing.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    map_command = commands.add_parser("map", parents=[map_options], help="draw a synthetic map")
+    map_command.add_argument("output", help="image file to write, e.g. map.png or map.jpg")
+
+    game_command = commands.add_parser("game", parents=[map_options], help="simulate a game and save it")
+    game_command.add_argument("directory", help="directory for the map, journal, snapshots and .mprg")
+    game_command.add_argument("--map", help="base map to play on; a synthetic map is drawn when not given")
+    game_command.add_argument("--players", type=int, default=PLAYERS, help="number of players")
+    game_command.add_argument("--alliances", type=int, default=0, help="random alliances")
+    game_command.add_argument("--naps", type=int, default=0, help="random non-aggression pacts")
+    game_command.add_argument("--turns", type=int, default=TURNS, help="turns played")
+    game_command.add_argument("--conquest", type=float, default=CONQUEST, help="chance per tile of attacking")
+    game_command.add_argument("--tiles-scale", type=int, default=1, help="multiply the tiles each roll scores")
+    game_command.add_argument("--journal-only", action="store_true", help="write the journal without replaying it")
+
+    replay_command = commands.add_parser("replay", help="replay a journal headlessly and time each action")
+    replay_command.add_argument("journal", help="journal written by the game command")
+    replay_command.add_argument("--save", help="also write the replayed game to this .mprg file")
+    args = parser.parse_args(argv)
+
+    if args.command == "map":
+        start = time.perf_counter()
+        image = generate_map(**map_arguments(args))
+        image.save(args.output)
+        print(f"Wrote a {image.width}x{image.height} map to {args.output} in {time.perf_counter() - start:.1f}s")
+        return 0
+
+    cwd = os.getcwd()
+    if args.command == "replay":
+        actions = read_journal(args.journal)
+        save_path = os.path.abspath(args.save) if args.save else None
+        workdir = os.path.dirname(os.path.abspath(args.journal))
+    else:
+        workdir = os.path.abspath(args.directory)
+        os.makedirs(workdir, exist_ok=True)
+        map_path = os.path.abspath(args.map) if args.map else os.path.join(workdir, "map.png")
+        if not args.map:
+            generate_map(**map_arguments(args)).save(map_path)
+            print(f"Wrote the map to {map_path}")
+        save_path = None if args.journal_only else os.path.join(workdir, "game.mprg")
+
+    # Snapshots and the map cache are written relative to the working directory, as in the editor
+    os.chdir(workdir)
+    try:
+        controller = ApplicationController(None)
+        if args.command == "game":
+            region_map = controller.load_base_map(map_path)
+            actions = generate_journal(map_path, region_map, args.players, args.alliances, args.naps, args.turns,
+                                       args.conquest, args.tiles_scale, controller.model["roll_table"], args.seed)
+            write_journal("journal.jsonl", actions)
+            print(f"Wrote {len(actions)} actions on {region_map.region_count} regions "
+                  f"to {os.path.join(workdir, 'journal.jsonl')}")
+            if args.journal_only:
+                return 0
+        timings = replay_journal(controller, actions)
+        print(format_timings(timings))
+        if save_path:
+            save_replayed_game(controller, save_path)
+            print(f"Wrote the game to {save_path}")
+    finally:
+        os.chdir(cwd)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,52 +1,116 @@
 # controllers/application_controller.py
 
 import tkinter as tk
-from typing import Any
+from tkinter import messagebox, simpledialog, colorchooser
+from typing import Any, Iterable, Optional
 from models.player import Player
+from models.player_registry import PlayerRegistry
+from models.diplomacy import DiplomacyGraph, ALLIANCE, NAP
 from models.game_state import GameState
 from models.roll_table import RollTable
+from models.roll_history import RollHistory
+from models.region_map import RegionMap, MAX_BORDER_WIDTH
+from models.ownership import OwnershipDelta, OwnershipStore, UNOWNED
+from models.bloc_analytics import BlocAnalytics
+from models.territory_stats import TerritoryStats
+from models.turn_report import TurnReport
+from utils.ownership_reconstruction import count_painted_regions, reconstruct_owners
 from utils.utils import flood_fill
+from utils.roll_import import parse_roll_lines
+from utils.region_mapping import parse_region_mapping
+from utils.map_preprocessing import preprocess_map, PREPROCESS_PARAMS
+from utils.map_cache import MapCache
+from utils.tile_server import TileServer, TileStore, DEFAULT_HOST, LAN_HOST
+from utils.latency import LatencyRecorder
+from utils.memory_profile import MemoryProfiler
+from controllers.event_bus import (EventBus, OwnershipChanged, MapChanged, PlayerUpdated, RollAppended,
+                                   TurnAdvanced, DiplomacyChanged)
 from views.start_view import StartView
 from views.game_view import GameView
 from views.players_view import PlayersView
 from views.alliances_view import AlliancesView
 from views.roll_view import RollView
+from views.replay_view import ReplayView
+from views.latency_view import LatencyView
 from PIL import Image, ImageDraw
+import numpy as np
+import hashlib
+import io
 import os
 import json
-import messagebox
+import socket
+import time
 
 
 class ApplicationController:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: Optional[tk.Tk]):
+        """
+        Initialize the ApplicationController.
+
+        Args:
+            root (tk.Tk, optional): The Tk root. Without one the controller runs
+                headless, with no views and events delivered immediately, e.g. for benchmarks.
+        """
         self.root = root
         self.current_view: Any = None
+        # Set PYRISK_LATENCY=1 to record action timings from startup
+        self.latency = LatencyRecorder(enabled=os.environ.get("PYRISK_LATENCY") == "1")
+        self.events = EventBus(root, self.latency)
         self.model = self.initialize_model()
-        self.setup_start_view()
+        # Set PYRISK_MEMORY=1 to write a memory report every turn to memory_reports/, and
+        # PYRISK_MEMORY_ACTIONS=canvas_click,undo to also report before and after those actions
+        self.memory = MemoryProfiler(enabled=os.environ.get("PYRISK_MEMORY") == "1",
+                                     actions=filter(None, os.environ.get("PYRISK_MEMORY_ACTIONS", "").split(",")))
+        if root is not None:
+            self.setup_start_view()
 
     def initialize_model(self):
         # Initialize your model components here
         return {
             "game_name": "Untitled Game",
             "current_turn": 0,
-            "players": [],
+            "players": PlayerRegistry(),
+            "diplomacy": DiplomacyGraph(),
             "game_states": [],
             "roll_table": RollTable(),
             "map_image": None,
             "original_map_image": None,
+            "original_map_path": None,
+            "import_timings": [],  # (stage, seconds) of the last map import's preprocessing
+            "map_cache": MapCache(),
             "map_history": [],
             "max_history": 10,
             "mode": 'color',
             "selected_player": None,
-            "tile_owners": {},
+            "region_selection": set(),  # Regions picked for the next batch fill
+            "region_map": None,  # Set when a map is imported
+            "ownership": None,
+            "territory_stats": None,
+            "bloc_analytics": None,
+            "turn_report": None,
+            "tile_server": None,  # Spectator server, while running
+            "tile_server_lan": False,  # Let other computers on the network watch, not just this one
             "roll_mode": None,  # Set by StartView
-            "all_roll_results": []
+            "roll_history": RollHistory()
         }
 
-    def setup_start_view(self):
+    def show_view(self, view_class, handler: Any):
+        """
+        Replace the current view, moving event subscriptions to the new one.
+
+        Args:
+            view_class: The view class to create.
+            handler (Callable): The controller callback for the new view's actions.
+        """
         if self.current_view:
+            self.events.unsubscribe_all(self.current_view)
             self.current_view.destroy()
-        self.current_view = StartView(self.root, self.handle_start_view_actions)
+        self.current_view = view_class(self.root, self.memory.track(self.latency.track(handler), self.model))
+        if hasattr(self.current_view, "bind_events"):
+            self.current_view.bind_events(self.events)
+
+    def setup_start_view(self):
+        self.show_view(StartView, self.handle_start_view_actions)
 
     def handle_start_view_actions(self, action: str):
         if action in ["external", "application"]:
@@ -54,9 +118,7 @@ class ApplicationController:
             self.setup_game_view()
 
     def setup_game_view(self):
-        if self.current_view:
-            self.current_view.destroy()
-        self.current_view = GameView(self.root, self.handle_game_view_actions)
+        self.show_view(GameView, self.handle_game_view_actions)
         # Additional setup if necessary
 
     def handle_game_view_actions(self, action: str, data=None):
@@ -70,8 +132,22 @@ class ApplicationController:
             self.select_player(data)
         elif action == "canvas_click":
             self.handle_canvas_click(data)
+        elif action == "toggle_region_selection":
+            self.toggle_region_selection(data)
+        elif action == "box_select":
+            self.box_select(*data)
+        elif action == "apply_selection":
+            self.apply_selection()
+        elif action == "clear_selection":
+            self.clear_selection()
+        elif action == "load_region_mapping":
+            self.load_region_mapping()
+        elif action == "lasso_select":
+            self.lasso_select(data)
         elif action == "import_map":
             self.import_map()
+        elif action == "import_painted_map":
+            self.import_painted_map()
         elif action == "export_map":
             self.export_map()
         elif action == "export_gif":
@@ -80,12 +156,28 @@ class ApplicationController:
             self.save_game()
         elif action == "load_game":
             self.load_game()
+        elif action == "show_turn_report":
+            self.show_turn_report()
+        elif action == "export_turn_report":
+            self.export_turn_report()
+        elif action == "show_replay":
+            self.show_replay()
+        elif action == "toggle_tile_server":
+            self.toggle_tile_server()
+        elif action == "get_tile_server_lan":
+            return self.model["tile_server_lan"]
+        elif action == "set_tile_server_lan":
+            self.model["tile_server_lan"] = bool(data)
+        elif action == "show_latency_monitor":
+            self.show_latency_monitor()
+        elif action == "get_selected_player_stats":
+            return self.get_player_stats(self.model["selected_player"])
+        elif action == "get_map_image":
+            return self.model["map_image"]
         # Handle other actions as needed
 
     def setup_players_view(self):
-        if self.current_view:
-            self.current_view.destroy()
-        self.current_view = PlayersView(self.root, self.handle_players_view_actions)
+        self.show_view(PlayersView, self.handle_players_view_actions)
 
     def handle_players_view_actions(self, action: str, data=None):
         if action == "add_player":
@@ -96,16 +188,12 @@ class ApplicationController:
             self.remove_player(data)
         elif action == "get_players":
             return self.model["players"]
-        elif action == "get_player_roll_info":
-            player_name = data
-            # Placeholder for actual roll info
-            return ("", 0, 0)
+        elif action == "get_player_rows":
+            return self.get_player_rows()
         # Handle other actions as needed
 
     def setup_alliances_view(self):
-        if self.current_view:
-            self.current_view.destroy()
-        self.current_view = AlliancesView(self.root, self.handle_alliances_view_actions)
+        self.show_view(AlliancesView, self.handle_alliances_view_actions)
 
     def handle_alliances_view_actions(self, action: str, *args):
         if action == "add_alliance":
@@ -116,12 +204,15 @@ class ApplicationController:
             self.add_nap(player1_name, player2_name)
         elif action == "get_players":
             return self.model["players"]
+        elif action == "get_relations":
+            relation, = args
+            return self.get_relations(relation)
+        elif action == "get_bloc_summary":
+            return self.get_bloc_summary()
         # Handle other actions as needed
 
     def setup_roll_view(self):
-        if self.current_view:
-            self.current_view.destroy()
-        self.current_view = RollView(self.root, self.handle_roll_view_actions)
+        self.show_view(RollView, self.handle_roll_view_actions)
 
     def handle_roll_view_actions(self, action: str, *args):
         if action == "configure_roll_table":
@@ -129,21 +220,30 @@ class ApplicationController:
         elif action == "roll_for_all_players":
             self.roll_for_all_players()
         elif action == "get_current_roll":
-            turn = self.model["current_turn"]
-            roll_results = self.model["all_roll_results"][-1][1] if self.model["all_roll_results"] else []
-            return (turn, roll_results)
+            return self.get_current_roll()
         elif action == "get_all_rolls":
-            return self.model["all_roll_results"]
+            return self.get_all_rolls()
+        elif action == "get_roll_history":
+            return self.model["roll_history"]
+        elif action == "get_current_turn":
+            return self.model["current_turn"]
+        elif action == "get_roll_mode":
+            return self.model["roll_mode"]
+        elif action == "import_external_rolls":
+            lines, = args
+            return self.import_external_rolls(lines)
         # Handle other actions as needed
 
     def advance_turn(self):
         self.model["current_turn"] += 1
-        self.current_view.update_turn_label(self.model["current_turn"])
         self.save_current_map_state()
         self.model["map_history"].clear()
-        if self.model["roll_mode"] != 'external':
-            self.model["roll_table"].number_values.clear()
-        self.current_view.refresh()
+        if self.model["territory_stats"]:
+            self.model["territory_stats"].start_turn()
+            # The live ownership matches the snapshot just saved for this turn
+            self.model["turn_report"].record_turn(self.model["current_turn"], self.model["ownership"].owners)
+        self.memory.snapshot(f"turn_{self.model['current_turn']}", self.model)
+        self.events.publish(TurnAdvanced(self.model["current_turn"]))
 
     def toggle_mode(self):
         if self.model["mode"] == 'color':
@@ -154,14 +254,23 @@ class ApplicationController:
 
     def undo_action(self):
         if self.model["map_history"]:
-            self.model["map_image"] = self.model["map_history"].pop()
-            self.current_view.display_map_image(self.model["map_image"])
+            entry = self.model["map_history"].pop()
+            if isinstance(entry, OwnershipDelta):
+                # Region fills are undone by giving the regions back and repainting them
+                self.model["ownership"].assign(entry.regions, entry.old_owners)
+                self.events.publish(MapChanged(self.render_regions(entry.regions)))
+                return
+            self.model["map_image"], owners = entry
+            if owners is not None and self.model["ownership"]:
+                self.model["ownership"].restore(owners)
+            self.events.publish(MapChanged())
         else:
             messagebox.showinfo("Undo", "No actions to undo.")
 
     def select_player(self, player: Player):
         self.model["selected_player"] = player
         self.current_view.highlight_selected_player_button(player.name)
+        self.current_view.update_player_stats(self.get_player_stats(player))
 
     def handle_canvas_click(self, event):
         x, y = self.current_view.get_canvas_click_coordinates(event)
@@ -170,42 +279,342 @@ class ApplicationController:
             return
         if x >= self.model["map_image"].width or y >= self.model["map_image"].height:
             return
+        if self.model["mode"] == 'color' and not self.model["selected_player"]:
+            messagebox.showwarning("No Player Selected", "Please select a player before coloring.")
+            return
 
-        # Save current state for undo
-        if len(self.model["map_history"]) >= self.model["max_history"]:
-            self.model["map_history"].pop(0)
-        self.model["map_history"].append(self.model["map_image"].copy())
+        region_map = self.model["region_map"]
+        if region_map and region_map.is_ownable(region_map.region_at(x, y)):
+            self.fill_regions([region_map.region_at(x, y)], self.current_owner())
+            return
 
+        # Border lines aren't regions anyone can own, so they are still flood filled
+        self.push_history()
         if self.model["mode"] == 'color':
-            if not self.model["selected_player"]:
-                messagebox.showwarning("No Player Selected", "Please select a player before coloring.")
-                return
             target_color = self.model["map_image"].getpixel((x, y))
             replacement_color = self.model["selected_player"].color + (255,)  # Assuming RGBA
+            with self.latency.phase("fill"):
+                flood_fill(self.model["map_image"], x, y, target_color, replacement_color)
+            self.events.publish(MapChanged())
 
-            # Example: Decrement remaining tiles if applicable
-
-            previous_owner = self.model["tile_owners"].get((x, y))
-            if previous_owner and previous_owner != self.model["selected_player"].name:
-                self.update_player_tiles(previous_owner, 1)
-
-            self.model["tile_owners"][(x, y)] = self.model["selected_player"].name
-            flood_fill(self.model["map_image"], x, y, target_color, replacement_color)
-            self.current_view.display_map_image(self.model["map_image"])
-        
         elif self.model["mode"] == 'erase':
             original_color = self.model["map_image"].getpixel((x, y))
-            # Assuming there's an original map to revert to
+            # Revert to the colour of the unpainted map
             replacement_color = self.model["original_map_image"].getpixel((x, y))
-            if (x, y) in self.model["tile_owners"]:
-                player_name = self.model["tile_owners"].pop((x, y))
-                self.update_player_tiles(player_name, 1)
-            flood_fill(self.model["map_image"], x, y, original_color, replacement_color)
-            self.current_view.display_map_image(self.model["map_image"])
+            with self.latency.phase("fill"):
+                flood_fill(self.model["map_image"], x, y, original_color, replacement_color)
+            self.events.publish(MapChanged())
+
+    def current_owner(self) -> int:
+        """
+        Get the owner a fill gives regions: the selected player, or nobody in erase mode.
+        """
+        if self.model["mode"] == 'erase':
+            return UNOWNED
+        return self.model["selected_player"].id
+
+    def fill_regions(self, regions, owner: int):
+        """
+        Give many regions to one owner as a single undoable step with one repaint.
+
+        Args:
+            regions (iterable): Region indices; border lines are ignored.
+            owner (int or np.ndarray): Player id, 0 to erase, or one owner per region.
+        """
+        region_map = self.model["region_map"]
+        regions = np.fromiter(regions, dtype=np.int64)
+        owners = np.broadcast_to(np.asarray(owner, dtype=np.int32), regions.shape)
+        ownable = ~region_map.is_border[regions]
+        with self.latency.phase("fill"):
+            delta = self.model["ownership"].assign(regions[ownable], owners[ownable])
+        if not len(delta):
+            return
+        # The delta itself is the history record: a few bytes per region instead of a map copy
+        if len(self.model["map_history"]) >= self.model["max_history"]:
+            self.model["map_history"].pop(0)
+        self.model["map_history"].append(delta)
+        self.events.publish(MapChanged(self.render_regions(delta.regions)))
+
+    def render_regions(self, regions: np.ndarray) -> tuple:
+        """
+        Repaint regions in their owners' colours, or the base map colour when unowned.
+
+        Returns:
+            tuple: The repainted box (x0, y0, x1, y1).
+        """
+        region_map = self.model["region_map"]
+        owners = self.model["ownership"].owners[regions]
+        palette = np.zeros(self.model["players"].max_id + 1, dtype=np.uint32)
+        for player in self.model["players"]:
+            palette[player.id] = np.array(player.color + (255,), dtype=np.uint8).view(np.uint32)[0]
+        known = owners < len(palette)
+        colors = region_map.colors[regions].copy()
+        # Ids of removed players have no palette entry and show the base map
+        owned = known & (owners != UNOWNED)
+        owned[owned] = palette[owners[owned]] != 0
+        colors[owned] = palette[owners[owned]]
+        with self.latency.phase("overlay"):
+            return region_map.render(self.model["map_image"], regions, colors)
 
-    def update_player_tiles(self, player_name: str, change: int):
-        # Placeholder for updating player tiles
-        pass
+    def toggle_region_selection(self, event):
+        """
+        Add the region under a shift-click to the batch selection, or take it out again.
+        """
+        region_map = self.model["region_map"]
+        if region_map is None:
+            return
+        x, y = self.current_view.get_canvas_click_coordinates(event)
+        if x >= region_map.width or y >= region_map.height:
+            return
+        region = region_map.region_at(x, y)
+        if region_map.is_ownable(region):
+            self.model["region_selection"] ^= {region}
+            self.show_selection()
+
+    def box_select(self, x0: int, y0: int, x1: int, y1: int):
+        """
+        Add every region lying entirely inside a dragged box to the batch selection.
+        """
+        region_map = self.model["region_map"]
+        if region_map is None:
+            return
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        self.model["region_selection"].update(region_map.regions_in_box(x0, y0, x1 + 1, y1 + 1).tolist())
+        self.show_selection()
+
+    def show_selection(self):
+        selection = self.model["region_selection"]
+        region_map = self.model["region_map"]
+        boxes = region_map.bboxes[sorted(selection)].tolist() if selection else []
+        self.current_view.show_selection(boxes)
+
+    def clear_selection(self):
+        self.model["region_selection"] = set()
+        self.current_view.show_selection([])
+
+    def apply_selection(self):
+        """
+        Fill the selected regions for the selected player (or erase them) in one step.
+        """
+        if not self.model["region_selection"]:
+            messagebox.showinfo("No Selection", "Shift-click or Ctrl-drag to select regions first.")
+            return
+        if self.model["mode"] == 'color' and not self.model["selected_player"]:
+            messagebox.showwarning("No Player Selected", "Please select a player before coloring.")
+            return
+        self.fill_regions(self.model["region_selection"], self.current_owner())
+        self.clear_selection()
+
+    def lasso_select(self, points: list):
+        """
+        Preview the regions inside a lasso and, once confirmed, fill them in one step.
+
+        Args:
+            points (list): The lasso polygon's (x, y) vertices in map pixels.
+        """
+        region_map = self.model["region_map"]
+        if region_map is None or len(points) < 3:
+            return
+        if self.model["mode"] == 'color' and not self.model["selected_player"]:
+            messagebox.showwarning("No Player Selected", "Please select a player before coloring.")
+            return
+        full, partial = region_map.regions_in_polygon(points)
+        if not len(full) and not len(partial):
+            return
+
+        # Preview: fully covered regions strongly tinted, partially covered faintly
+        color = self.model["selected_player"].color if self.model["mode"] == 'color' else (255, 255, 255)
+        box = region_map.bbox_of(np.concatenate((full, partial)))
+        with self.latency.phase("overlay"):
+            overlay = np.zeros((box[3] - box[1], box[2] - box[0], 4), dtype=np.uint8)
+            overlay[region_map.mask(partial, box)] = color + (70,)
+            overlay[region_map.mask(full, box)] = color + (160,)
+            self.current_view.show_lasso_preview(Image.fromarray(overlay, "RGBA"), box[:2])
+
+        answer = messagebox.askyesnocancel(
+            "Lasso Selection",
+            f"{len(full)} regions are fully inside the lasso and {len(partial)} partly inside.\n\n"
+            "Include the partly covered regions?")
+        self.current_view.clear_lasso_preview()
+        if answer is None:
+            return
+        self.fill_regions(np.concatenate((full, partial)) if answer else full, self.current_owner())
+
+    def load_region_mapping(self):
+        """
+        Fill regions from a ``x,y,player`` or ``region,player`` file in one step.
+        """
+        from tkinter import filedialog
+        if self.model["region_map"] is None:
+            messagebox.showwarning("No Map Loaded", "Please import a map first.")
+            return
+        file_path = filedialog.askopenfilename(filetypes=[("Region mapping files", "*.csv;*.tsv;*.txt"), ("All files", "*.*")])
+        if not file_path:
+            return
+        players = self.model["players"]
+        with open(file_path, newline='') as f:
+            result = parse_region_mapping(f, self.model["region_map"], players)
+        if not result.ok:
+            messagebox.showerror("Invalid Input", result.error_report())
+            return
+        if not result.assignments:
+            messagebox.showwarning("No Regions", "No region assignments found in the file.")
+            return
+        regions = [region for region, _ in result.assignments]
+        owners = [players.get(name).id for _, name in result.assignments]
+        self.fill_regions(regions, np.array(owners, dtype=np.int32))
+
+    def push_history(self):
+        """
+        Save the map image and region ownership so the next change can be undone.
+        """
+        with self.latency.phase("history"):
+            if len(self.model["map_history"]) >= self.model["max_history"]:
+                self.model["map_history"].pop(0)
+            owners = self.model["ownership"].snapshot() if self.model["ownership"] else None
+            self.model["map_history"].append((self.model["map_image"].copy(), owners))
+
+    def load_base_map(self, file_path: str, preprocess: bool = True):
+        """
+        Load a base map and its regions, reusing the map cache when the same file was loaded before.
+
+        Sets original_map_image and import_timings, and returns the
+        segmented map for setup_map_models.
+
+        Args:
+            file_path (str): The map image.
+            preprocess (bool): Clean the image with preprocess_map first, as on import.
+                Saved games store the already cleaned map and only need segmenting.
+
+        Returns:
+            RegionMap: The segmented base map.
+        """
+        cache = self.model["map_cache"]
+        params = ",".join(f"{name}={value}" for name, value in PREPROCESS_PARAMS.items()) if preprocess else "none"
+        key = cache.key(file_path, f"preprocess={params};border_width={MAX_BORDER_WIDTH}")
+        start = time.perf_counter()
+        entry = cache.get(key)
+        if entry is not None:
+            image = Image.fromarray(entry["image"], "RGBA")
+            region_map = RegionMap.from_arrays(entry)
+            timings = [("cache", time.perf_counter() - start)]
+        else:
+            if preprocess:
+                result = preprocess_map(Image.open(file_path))
+                image, labels, timings = result.image, result.labels, result.timings
+            else:
+                image, labels, timings = Image.open(file_path).convert("RGBA"), None, []
+            start = time.perf_counter()
+            region_map = RegionMap.from_image(image, labels=labels)
+            timings.append(("regions", time.perf_counter() - start))
+            arrays = region_map.to_arrays()
+            arrays["image"] = np.asarray(image)
+            try:
+                cache.put(key, arrays)
+            except OSError:
+                pass  # The cache only speeds up the next load
+        self.model["original_map_image"] = image
+        self.model["import_timings"] = timings
+        for stage, seconds in timings:
+            self.latency.record_phase(stage, seconds)
+        return region_map
+
+    def setup_map_models(self, region_map: RegionMap):
+        """
+        Reset ownership, statistics and bloc analytics for a newly segmented base map.
+
+        Args:
+            region_map (RegionMap): The base map's regions, from load_base_map.
+        """
+        for service in ("territory_stats", "bloc_analytics"):
+            if self.model[service]:
+                self.model[service].detach()
+        ownership = OwnershipStore(region_map.region_count)
+        ownership.subscribe(self.on_ownership_changed)
+        stats = TerritoryStats(region_map, ownership)
+        stats.subscribe(self.on_player_stats_changed)
+        self.model["region_map"] = region_map
+        self.model["ownership"] = ownership
+        self.model["territory_stats"] = stats
+        self.model["bloc_analytics"] = BlocAnalytics(region_map, ownership, stats, self.model["diplomacy"],
+                                                     self.model["players"], self.model["roll_history"])
+        self.model["turn_report"] = TurnReport(region_map.areas)
+        self.model["map_history"].clear()  # Undo snapshots belong to the previous map
+
+    def clear_map_models(self):
+        """
+        Drop the map, its region models and the selection, e.g. before loading a game that may have no map.
+        """
+        for service in ("territory_stats", "bloc_analytics"):
+            if self.model[service]:
+                self.model[service].detach()
+        for key in ("map_image", "original_map_image", "original_map_path", "region_map", "ownership",
+                    "territory_stats", "bloc_analytics", "turn_report", "selected_player"):
+            self.model[key] = None
+        self.model["map_history"].clear()
+        self.model["region_selection"].clear()
+
+    def refresh_blocs(self):
+        if self.model["bloc_analytics"]:
+            self.model["bloc_analytics"].rebuild_blocs()
+
+    def get_bloc_summary(self) -> list:
+        """
+        Get per-bloc territory, rolled tiles and border figures for the current turn.
+
+        Returns:
+            list: BlocAnalytics.summary() dicts, or an empty list before a map is imported.
+        """
+        if not self.model["bloc_analytics"]:
+            return []
+        return self.model["bloc_analytics"].summary(self.model["current_turn"])
+
+    def get_player_rows(self) -> list:
+        """
+        Get the roll and tile figures of every player for the current turn in one pass.
+
+        Returns:
+            list: (player, roll_value, total_tiles, remaining_tiles) tuples in roster order.
+        """
+        history = self.model["roll_history"]
+        turn = self.model["current_turn"]
+        rolls = history.latest_rolls(turn)
+        totals = history.turn_totals(turn)
+        stats = self.model["territory_stats"]
+        rows = []
+        for player in self.model["players"]:
+            total_tiles = totals.get(player.id, 0)
+            remaining_tiles = stats.remaining_tiles(player.id, total_tiles) if stats else total_tiles
+            rows.append((player, rolls.get(player.id, ""), total_tiles, remaining_tiles))
+        return rows
+
+    def get_player_stats(self, player: Optional[Player]) -> Optional[tuple]:
+        """
+        Get a player's territory and remaining tiles for the current turn.
+
+        Args:
+            player (Player, optional): The player to look up.
+
+        Returns:
+            tuple, optional: (regions, area, remaining_tiles), or None without a player.
+        """
+        if player is None:
+            return None
+        tiles_rolled = self.model["roll_history"].turn_totals(self.model["current_turn"]).get(player.id, 0)
+        stats = self.model["territory_stats"]
+        if stats is None:
+            return 0, 0, tiles_rolled
+        return stats.regions[player.id], stats.area[player.id], stats.remaining_tiles(player.id, tiles_rolled)
+
+    def on_player_stats_changed(self, player_ids: set):
+        self.events.publish(PlayerUpdated(*player_ids))
+
+    def on_ownership_changed(self, delta):
+        """
+        Publish the regions of an ownership delta and the map area they cover.
+        """
+        self.events.publish(OwnershipChanged(delta.regions, self.model["region_map"].bbox_of(delta.regions)))
 
     def add_player(self):
         name = simpledialog.askstring("Player Name", "Enter player name:")
@@ -216,8 +625,9 @@ class ApplicationController:
                 try:
                     name, color_rgb, faction = self.validate_player_data(name, color[0], faction)
                     player = Player(name, color_rgb, faction)
-                    self.model["players"].append(player)
-                    self.current_view.refresh()
+                    self.model["players"].add(player)
+                    self.refresh_blocs()
+                    self.events.publish(PlayerUpdated(player.id))
                 except ValueError as e:
                     messagebox.showerror("Invalid Input", str(e))
 
@@ -230,10 +640,11 @@ class ApplicationController:
                     faction = simpledialog.askstring("Faction", "Edit faction name (optional):", initialvalue=player.faction)
                     try:
                         name, color_rgb, faction = self.validate_player_data(name, color[0], faction, editing=True, current_player=player)
-                        player.name = name
+                        self.model["players"].rename(player, name)
+                        self.model["roll_history"].rename_player(player.id, name)
                         player.color = color_rgb
                         player.faction = faction
-                        self.current_view.refresh()
+                        self.events.publish(PlayerUpdated(player.id))
                     except ValueError as e:
                         messagebox.showerror("Invalid Input", str(e))
         else:
@@ -242,16 +653,31 @@ class ApplicationController:
     def remove_player(self, player: Optional[Player]):
         if player:
             # Remove alliances and NAPs
-            for p in self.model["players"]:
-                if player in p.allies:
-                    p.allies.remove(player)
-                if player in p.naps:
-                    p.naps.remove(player)
+            self.model["diplomacy"].remove_player(player.id)
+            self.release_regions(player.id)
             self.model["players"].remove(player)
-            self.current_view.refresh()
+            self.refresh_blocs()
+            self.events.publish(PlayerUpdated(player.id))
+            self.events.publish(DiplomacyChanged())
         else:
             messagebox.showwarning("No Selection", "Please select a player to remove.")
 
+    def release_regions(self, player_id: int):
+        """
+        Give a removed player's regions back to nobody and repaint them in the base map colours.
+
+        Undo history is dropped too, as undoing an older fill would hand regions
+        back to the removed id.
+        """
+        ownership = self.model["ownership"]
+        if not ownership:
+            return
+        regions = np.flatnonzero(ownership.owners == player_id)
+        if len(regions):
+            ownership.assign(regions, UNOWNED)
+            self.events.publish(MapChanged(self.render_regions(regions)))
+        self.model["map_history"].clear()
+
     def add_alliance(self, player1_name: str, player2_name: str):
         if player1_name == player2_name:
             messagebox.showwarning("Invalid Selection", "Please select two different players.")
@@ -259,11 +685,10 @@ class ApplicationController:
         p1 = self.get_player_by_name(player1_name)
         p2 = self.get_player_by_name(player2_name)
         if p1 and p2:
-            if p2 not in p1.allies:
-                p1.add_ally(p2)
-                p2.add_ally(p1)
+            if self.model["diplomacy"].add(ALLIANCE, p1.id, p2.id):
+                self.refresh_blocs()
                 messagebox.showinfo("Alliance Added", f"{p1.name} and {p2.name} are now allies.")
-                self.current_view.refresh()
+                self.events.publish(DiplomacyChanged())
             else:
                 messagebox.showinfo("Already Allies", f"{p1.name} and {p2.name} are already allies.")
         else:
@@ -276,21 +701,33 @@ class ApplicationController:
         p1 = self.get_player_by_name(player1_name)
         p2 = self.get_player_by_name(player2_name)
         if p1 and p2:
-            if p2 not in p1.naps:
-                p1.add_nap(p2)
-                p2.add_nap(p1)
+            if self.model["diplomacy"].add(NAP, p1.id, p2.id):
                 messagebox.showinfo("NAP Added", f"{p1.name} and {p2.name} have a Non-Aggression Pact.")
-                self.current_view.refresh()
+                self.events.publish(DiplomacyChanged())
             else:
                 messagebox.showinfo("NAP Exists", f"{p1.name} and {p2.name} already have a NAP.")
         else:
             messagebox.showwarning("Invalid Selection", "Please select valid players.")
 
+    def get_relations(self, relation: str) -> list:
+        """
+        List the pairs of player names with a given relation.
+
+        Args:
+            relation (str): 'alliance' or 'nap'.
+
+        Returns:
+            list: Sorted (name, name) pairs, each pair in alphabetical order.
+        """
+        players = self.model["players"]
+        pairs = []
+        for player1_id, player2_id in self.model["diplomacy"].pairs(relation):
+            names = sorted((players.get_by_id(player1_id).name, players.get_by_id(player2_id).name))
+            pairs.append(tuple(names))
+        return sorted(pairs)
+
     def get_player_by_name(self, name: str) -> Optional[Player]:
-        for player in self.model["players"]:
-            if player.name == name:
-                return player
-        return None
+        return self.model["players"].find(name)
 
     def validate_player_data(self, name: str, color: tuple, faction: Optional[str], editing=False, current_player: Optional[Player]=None):
         """
@@ -313,11 +750,8 @@ class ApplicationController:
         if not name or not name.strip():
             raise ValueError("Player name cannot be empty.")
         name = name.strip()
-        for player in self.model["players"]:
-            if player.name.lower() == name.lower():
-                if editing and current_player and player == current_player:
-                    continue
-                raise ValueError(f"Player name '{name}' is already taken.")
+        if self.model["players"].is_name_taken(name, exclude=current_player if editing else None):
+            raise ValueError(f"Player name '{name}' is already taken.")
 
         # Validate color
         if not isinstance(color, tuple) or len(color) != 3:
@@ -343,33 +777,116 @@ class ApplicationController:
         if not self.model["players"]:
             messagebox.showwarning("No Players", "Please add players before rolling.")
             return
-        self.model["roll_table"].roll_number()
-        roll_results = []
-        for player in self.model["players"]:
-            roll_value = self.model["roll_table"].roll_number()
-            tiles = self.model["roll_table"].calculate_tiles(roll_value)
-            roll_results.append((player.name, roll_value, tiles))
-        self.model["all_roll_results"].append((self.model["current_turn"], roll_results))
-        self.current_view.refresh()
+        roll_table = self.model["roll_table"]
+        rolls = [(player.name, roll_table.roll_number()) for player in self.model["players"]]
+        self.record_rolls(rolls)
+
+    def import_external_rolls(self, lines: Iterable[str]) -> bool:
+        """
+        Validate and record a bulk submission of external rolls.
+
+        Args:
+            lines (iterable): ``name,roll`` lines from a CSV/TSV file or pasted text.
+
+        Returns:
+            bool: True if the rolls were recorded, False if the input was rejected.
+        """
+        result = parse_roll_lines(lines, self.model["players"])
+        if not result.ok:
+            messagebox.showerror("Invalid Input", result.error_report())
+            return False
+        if not result.rolls:
+            messagebox.showwarning("No Rolls", "No rolls found in the input.")
+            return False
+        self.record_rolls(result.rolls)
+        return True
+
+    def record_rolls(self, rolls: list):
+        """
+        Score (player_name, roll) pairs in one batch and record them for the current turn.
+
+        Args:
+            rolls (list): (player_name, roll) pairs; rolls may be ints or digit strings.
+        """
+        players = self.model["players"]
+        scores = self.model["roll_table"].score_batch(roll for _, roll in rolls)
+        roll_results = [(players.get(name).id, name, roll, tiles, rule)
+                        for (name, roll), (tiles, rule) in zip(rolls, scores)]
+        self.model["roll_history"].append_batch(self.model["current_turn"], roll_results)
+        self.events.publish(RollAppended(self.model["current_turn"]))
 
     def get_current_roll(self):
         turn = self.model["current_turn"]
-        roll_results = self.model["all_roll_results"][-1][1] if self.model["all_roll_results"] else []
+        history = self.model["roll_history"]
+        roll_results = history.batch_results(-1)[1] if history.batch_count() else []
         return (turn, roll_results)
 
     def get_all_rolls(self):
-        return self.model["all_roll_results"]
+        return list(self.model["roll_history"].batches())
 
     def import_map(self):
         from tkinter import filedialog
         file_path = filedialog.askopenfilename(filetypes=[("Image files", "*.png;*.jpg;*.jpeg")])
         if file_path:
-            self.model["map_image"] = Image.open(file_path).convert("RGBA")
-            self.model["original_map_image"] = self.model["map_image"].copy()
-            self.current_view.display_map_image(self.model["map_image"])
+            # Snap JPEG noise and anti-aliasing to flat colours so each territory fills in one go
+            region_map = self.load_base_map(file_path)
+            self.model["map_image"] = self.model["original_map_image"].copy()
+            self.save_original_map()
+            self.setup_map_models(region_map)
+            self.events.publish(MapChanged())
             self.save_current_map_state()
             self.model["map_history"].clear()
 
+    def import_painted_map(self):
+        """
+        Replace the map with one painted outside the editor and work out who owns what from its colours.
+        """
+        from tkinter import filedialog
+        if self.model["original_map_image"] is None:
+            messagebox.showwarning("No Map Loaded", "Please import the unpainted map first.")
+            return
+        file_path = filedialog.askopenfilename(filetypes=[("Image files", "*.png;*.jpg;*.jpeg")])
+        if file_path:
+            painted = Image.open(file_path).convert("RGBA")
+            if painted.size != self.model["original_map_image"].size:
+                messagebox.showerror("Invalid Map", "The painted map must be the same size as the imported map.")
+                return
+            self.push_history()
+            self.model["map_image"] = painted
+            self.reconstruct_ownership()
+            # The painted map is taken as the state at the start of the turn
+            self.model["territory_stats"].start_turn()
+            self.events.publish(MapChanged())
+
+    def reconstruct_ownership(self):
+        """
+        Rebuild region ownership by matching the painted map's colours against the player colours.
+        """
+        region_map = self.model["region_map"]
+        if region_map is None:
+            return
+        player_colors = {player.id: player.color for player in self.model["players"]}
+        owners = reconstruct_owners(region_map.labels, ~region_map.is_border, self.model["original_map_image"],
+                                    self.model["map_image"], player_colors)
+        self.model["ownership"].restore(owners)
+
+    def save_original_map(self):
+        """
+        Save the unpainted map under a name taken from its content, so importing
+        another map doesn't overwrite the base image older saves refer to.
+        """
+        temp_dir = "temp_maps"
+        if not os.path.exists(temp_dir):
+            os.makedirs(temp_dir)
+        buffer = io.BytesIO()
+        self.model["original_map_image"].save(buffer, format="PNG")
+        digest = hashlib.sha256(buffer.getvalue()).hexdigest()
+        filename = f"{temp_dir}/original_map_{digest[:16]}.png"
+        if not os.path.exists(filename):
+            with open(filename, 'wb') as f:
+                f.write(buffer.getvalue())
+        self.model["original_map_path"] = filename
+
     def save_current_map_state(self):
         if self.model["map_image"] is None:
             return
@@ -396,81 +913,282 @@ class ApplicationController:
         if not self.model["game_states"]:
             messagebox.showwarning("No Game States", "No game states to export.")
             return
-        frames = [Image.open(state.map_image_path) for state in self.model["game_states"]]
         file_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=[("GIF files", "*.gif")])
         if file_path:
-            frames[0].save(file_path, save_all=True, append_images=frames[1:], duration=500, loop=0)
+            self.write_gif(file_path)
             messagebox.showinfo("GIF Exported", "Game progression GIF has been exported successfully.")
 
+    def write_gif(self, file_path: str):
+        """
+        Save the saved turn snapshots as an animated GIF, half a second per turn.
+        """
+        frames = [Image.open(state.map_image_path) for state in self.model["game_states"]]
+        frames[0].save(file_path, save_all=True, append_images=frames[1:], duration=500, loop=0)
+
+    def toggle_tile_server(self):
+        """
+        Start or stop the spectator server that shares the live map over HTTP.
+
+        The server only listens on this computer unless sharing on the local
+        network was switched on in the game view; it has no authentication.
+        """
+        server = self.model["tile_server"]
+        if server:
+            self.events.unsubscribe_all(server.store)
+            server.stop()
+            self.model["tile_server"] = None
+            self.current_view.update_tile_server_button(None)
+            return
+        if self.model["map_image"] is None:
+            messagebox.showwarning("No Map Loaded", "Please import a map before sharing it.")
+            return
+        store = TileStore(lambda: self.model["map_image"])
+        lan = self.model["tile_server_lan"]
+        try:
+            server = TileServer(store, LAN_HOST if lan else DEFAULT_HOST)
+        except OSError as e:
+            messagebox.showerror("Error Starting Server", f"Could not start the spectator server:\n{e}")
+            return
+        self.events.subscribe(MapChanged, store.on_map_changed)
+        server.start()
+        self.model["tile_server"] = server
+        host = socket.gethostname() if lan else "localhost"
+        self.current_view.update_tile_server_button(f"http://{host}:{server.port}/", lan)
+
+    def show_latency_monitor(self):
+        """
+        Open the debug window showing action timings.
+        """
+        window = tk.Toplevel(self.root)
+        window.title("Latency Monitor")
+        latency_view = LatencyView(window, self.handle_latency_view_actions)
+
+        def close():
+            latency_view.destroy()
+            window.destroy()
+        window.protocol("WM_DELETE_WINDOW", close)
+
+    def handle_latency_view_actions(self, action: str):
+        if action == "get_latency_table":
+            return self.latency.format_table()
+        elif action == "is_latency_enabled":
+            return self.latency.enabled
+        elif action == "toggle_latency":
+            self.latency.enabled = not self.latency.enabled
+            return self.latency.enabled
+        elif action == "reset_latency":
+            self.latency.reset()
+        elif action == "export_latency":
+            self.export_latency()
+
+    def export_latency(self):
+        from tkinter import filedialog
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        if file_path:
+            try:
+                self.latency.write_json(file_path, {"import_timings": self.model["import_timings"]})
+                messagebox.showinfo("Timings Exported", "Action timings have been exported successfully.")
+            except OSError as e:
+                messagebox.showerror("Error Exporting Timings", f"An error occurred while exporting the timings:\n{e}")
+
+    def show_replay(self):
+        """
+        Open the replay window with a turn slider over the saved map snapshots.
+        """
+        if not self.model["game_states"]:
+            messagebox.showwarning("No Game States", "No turns to replay.")
+            return
+        window = tk.Toplevel(self.root)
+        window.title("Replay")
+        replay_view = ReplayView(window, self.latency.track(self.handle_replay_view_actions))
+
+        def close():
+            replay_view.destroy()
+            window.destroy()
+        window.protocol("WM_DELETE_WINDOW", close)
+
+    def handle_replay_view_actions(self, action: str):
+        if action == "get_replay_frames":
+            return [(state.turn_number, state.map_image_path) for state in self.model["game_states"]]
+
+    def update_turn_report(self) -> Optional[TurnReport]:
+        """
+        Record every saved turn snapshot that the turn report doesn't have yet.
+
+        Snapshots recorded during play come straight from the ownership store;
+        the rest (e.g. after loading a game) are reconstructed from their images
+        once and then cached.
+
+        Returns:
+            TurnReport, optional: The up-to-date report, or None before a map is imported.
+        """
+        report = self.model["turn_report"]
+        if report is None:
+            return None
+        region_map = self.model["region_map"]
+        player_colors = {player.id: player.color for player in self.model["players"]}
+        for state in self.model["game_states"]:
+            if state.turn_number not in report:
+                painted = Image.open(state.map_image_path).convert("RGBA")
+                report.record_turn(state.turn_number, reconstruct_owners(
+                    region_map.labels, ~region_map.is_border, self.model["original_map_image"],
+                    painted, player_colors))
+        return report
+
+    def report_player_name(self, player_id: int) -> str:
+        player = self.model["players"].get_by_id(player_id)
+        return player.name if player else f"Player #{player_id}"
+
+    def show_turn_report(self):
+        report = self.update_turn_report()
+        if not report or not report.turns:
+            messagebox.showwarning("No Game States", "No turns to report on.")
+            return
+        table = report.format_table(self.report_player_name)
+        if len(self.model["roll_history"]):
+            table += "\n\n" + self.model["roll_history"].format_summary()
+        self.current_view.show_turn_report(table)
+
+    def export_turn_report(self):
+        from tkinter import filedialog
+        report = self.update_turn_report()
+        if not report or not report.turns:
+            messagebox.showwarning("No Game States", "No turns to report on.")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if file_path:
+            try:
+                with open(file_path, 'w', newline='') as f:
+                    report.write_csv(f, self.report_player_name)
+                messagebox.showinfo("Report Exported", "Turn report has been exported successfully.")
+            except OSError as e:
+                messagebox.showerror("Error Exporting Report", f"An error occurred while exporting the report:\n{e}")
+
     def save_game(self):
         from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(defaultextension=".mprg",
                                                  filetypes=[("MSPaint Risk Game files", "*.mprg")])
         if file_path:
-            game_data = {
-                "game_name": self.model["game_name"],
-                "current_turn": self.model["current_turn"],
-                "players": [{
-                    "name": player.name,
-                    "color": player.color,
-                    "faction": player.faction,
-                    "allies": [ally.name for ally in player.allies],
-                    "naps": [nap.name for nap in player.naps]
-                } for player in self.model["players"]],
-                "game_states": [state.map_image_path for state in self.model["game_states"]],
-                "roll_table": {
-                    "number_values": self.model["roll_table"].number_values,
-                    "repeats_config": self.model["roll_table"].repeats_config,
-                    "palindromes_config": self.model["roll_table"].palindromes_config
-                },
-                "all_roll_results": self.model["all_roll_results"],
-                "roll_mode": self.model["roll_mode"]
-            }
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(game_data, f)
+                self.write_game(file_path)
                 messagebox.showinfo("Game Saved", "Game has been saved successfully.")
             except Exception as e:
                 messagebox.showerror("Error Saving Game", f"An error occurred while saving the game:\n{e}")
 
+    def write_game(self, file_path: str):
+        """
+        Save the game to a .mprg file. Map snapshots are referenced by path, not embedded.
+        """
+        game_data = {
+            "game_name": self.model["game_name"],
+            "current_turn": self.model["current_turn"],
+            "players": [{
+                "id": player.id,
+                "name": player.name,
+                "color": player.color,
+                "faction": player.faction
+            } for player in self.model["players"]],
+            "next_player_id": self.model["players"].next_id,
+            "diplomacy": self.model["diplomacy"].to_dict(),
+            "game_states": [state.map_image_path for state in self.model["game_states"]],
+            "original_map": self.model["original_map_path"],
+            "roll_table": self.model["roll_table"].to_dict(),
+            "roll_history": self.model["roll_history"].to_dict(),
+            "roll_mode": self.model["roll_mode"]
+        }
+        with open(file_path, 'w') as f:
+            json.dump(game_data, f)
+
     def load_game(self):
         from tkinter import filedialog
         file_path = filedialog.askopenfilename(filetypes=[("MSPaint Risk Game files", "*.mprg")])
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    game_data = json.load(f)
-                self.model["game_name"] = game_data.get("game_name", "Untitled Game")
-                self.model["current_turn"] = game_data.get("current_turn", 0)
-                self.model["players"] = []
-                name_to_player = {}
-                for pdata in game_data.get("players", []):
-                    player = Player(pdata["name"], tuple(pdata["color"]), pdata.get("faction"))
-                    self.model["players"].append(player)
-                    name_to_player[player.name] = player
-                for pdata, player in zip(game_data.get("players", []), self.model["players"]):
-                    player.allies = [name_to_player[name] for name in pdata.get("allies", []) if name in name_to_player]
-                    player.naps = [name_to_player[name] for name in pdata.get("naps", []) if name in name_to_player]
-                self.model["game_states"] = []
-                for path in game_data.get("game_states", []):
-                    turn_number = int(os.path.splitext(os.path.basename(path))[0].split('_')[-1])
-                    state = GameState(turn_number, path)
-                    self.model["game_states"].append(state)
-                if self.model["game_states"]:
-                    last_state = self.model["game_states"][-1]
-                    self.model["map_image"] = Image.open(last_state.map_image_path)
-                    self.model["original_map_image"] = self.model["map_image"].copy()
-                    self.current_view.display_map_image(self.model["map_image"])
-                self.model["roll_table"].number_values = game_data.get("roll_table", {}).get("number_values", self.model["roll_table"].number_values)
-                self.model["roll_table"].repeats_config = game_data.get("roll_table", {}).get("repeats_config", self.model["roll_table"].repeats_config)
-                self.model["roll_table"].palindromes_config = game_data.get("roll_table", {}).get("palindromes_config", self.model["roll_table"].palindromes_config)
-                self.model["all_roll_results"] = game_data.get("all_roll_results", [])
-                self.model["roll_mode"] = game_data.get("roll_mode", "application")
-                messagebox.showinfo("Game Loaded", "Game has been loaded successfully.")
-                self.current_view.refresh()
+                warning = self.read_game(file_path)
+                if warning:
+                    messagebox.showwarning("Game Loaded", warning)
+                else:
+                    messagebox.showinfo("Game Loaded", "Game has been loaded successfully.")
+                with self.latency.phase("refresh"):
+                    self.current_view.refresh()
             except Exception as e:
                 messagebox.showerror("Error Loading Game", f"An error occurred while loading the game:\n{e}")
 
+    def read_game(self, file_path: str) -> Optional[str]:
+        """
+        Load a game saved by write_game, replacing the current one.
+
+        Saves that don't record the unpainted map fall back to the first
+        saved turn. If that turn already has painted territory, ownership
+        isn't reconstructed, since painted regions would pass for base colours.
+
+        Returns:
+            str, optional: A warning for the user, or None if the game loaded cleanly.
+        """
+        with open(file_path, 'r') as f:
+            game_data = json.load(f)
+        self.clear_map_models()
+        self.model["game_name"] = game_data.get("game_name", "Untitled Game")
+        self.model["current_turn"] = game_data.get("current_turn", 0)
+        players = PlayerRegistry()
+        for pdata in game_data.get("players", []):
+            player = Player(pdata["name"], tuple(pdata["color"]), pdata.get("faction"))
+            players.add(player, pdata.get("id"))
+        # Older saves don't record it; ids above the surviving players may then be reused
+        players.next_id = game_data.get("next_player_id", players.next_id)
+        if "diplomacy" in game_data:
+            diplomacy = DiplomacyGraph.from_dict(game_data["diplomacy"])
+        else:
+            # Older saves list allies and NAPs by name on each player
+            diplomacy = DiplomacyGraph()
+            for pdata, player in zip(game_data.get("players", []), players):
+                for relation, key in ((ALLIANCE, "allies"), (NAP, "naps")):
+                    for name in pdata.get(key, []):
+                        partner = players.get(name)
+                        if partner and partner is not player:
+                            diplomacy.add(relation, player.id, partner.id)
+        self.model["players"] = players
+        self.model["diplomacy"] = diplomacy
+        self.model["game_states"] = []
+        region_map = None
+        base_from_snapshot = False
+        for path in game_data.get("game_states", []):
+            turn_number = int(os.path.splitext(os.path.basename(path))[0].split('_')[-1])
+            state = GameState(turn_number, path)
+            self.model["game_states"].append(state)
+        if self.model["game_states"]:
+            last_state = self.model["game_states"][-1]
+            self.model["map_image"] = Image.open(last_state.map_image_path).convert("RGBA")
+            # Older saves don't record the unpainted map; the first saved turn is the closest match
+            base_from_snapshot = not game_data.get("original_map")
+            original_path = game_data.get("original_map") or self.model["game_states"][0].map_image_path
+            region_map = self.load_base_map(original_path, preprocess=False)
+            self.model["original_map_path"] = original_path
+        self.events.publish(MapChanged())  # Also clears the canvas when the save has no map
+        roll_config = game_data.get("roll_table", {})
+        self.model["roll_table"].configure(roll_config.get("number_values"), roll_config.get("repeats_config"),
+                                           roll_config.get("palindromes_config"), roll_config.get("custom_rules"))
+        self.model["roll_history"] = RollHistory.from_dict(
+            game_data.get("roll_history", game_data.get("all_roll_results", [])), players)
+        self.model["roll_mode"] = game_data.get("roll_mode", "application")
+        warning = None
+        if region_map is not None:
+            self.setup_map_models(region_map)
+            painted = 0
+            if base_from_snapshot:
+                painted = count_painted_regions(region_map.colors, ~region_map.is_border,
+                                                {player.id: player.color for player in players})
+            if painted:
+                warning = (f"This save doesn't include the unpainted map, and its first turn already has "
+                           f"{painted} region(s) in player colours. Territory ownership wasn't restored; "
+                           f"statistics start from an unowned map.")
+            else:
+                self.reconstruct_ownership()
+            self.model["territory_stats"].start_turn()
+        return warning
+
     def destroy(self):
+        if self.model["tile_server"]:
+            self.model["tile_server"].stop()
         if self.current_view:
             self.current_view.destroy()
@@ -0,0 +1,172 @@
+# controllers/event_bus.py
+
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type
+from utils.latency import LatencyRecorder
+
+BBox = Tuple[int, int, int, int]  # (x0, y0, x1, y1), exclusive of x1/y1
+
+
+def union_bbox(a: Optional[BBox], b: Optional[BBox]) -> Optional[BBox]:
+    """
+    Get the smallest box containing two boxes; None means the whole map.
+    """
+    if a is None or b is None:
+        return None
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+class Event:
+    def merge(self, other: 'Event') -> 'Event':
+        """
+        Combine this event with a later one of the same type; the later one wins by default.
+        """
+        return other
+
+
+class OwnershipChanged(Event):
+    def __init__(self, regions: np.ndarray, bbox: Optional[BBox]):
+        """
+        Initialize an OwnershipChanged event.
+
+        Args:
+            regions (np.ndarray): Indices of the regions that changed owner.
+            bbox (tuple, optional): Map area covering those regions.
+        """
+        self.regions = regions
+        self.bbox = bbox
+
+    def merge(self, other: 'OwnershipChanged') -> 'OwnershipChanged':
+        return OwnershipChanged(np.union1d(self.regions, other.regions), union_bbox(self.bbox, other.bbox))
+
+
+class MapChanged(Event):
+    def __init__(self, bbox: Optional[BBox] = None):
+        """
+        Initialize a MapChanged event for pixels of the map image that need repainting.
+
+        Args:
+            bbox (tuple, optional): Changed area, or None for the whole map.
+        """
+        self.bbox = bbox
+
+    def merge(self, other: 'MapChanged') -> 'MapChanged':
+        return MapChanged(union_bbox(self.bbox, other.bbox))
+
+
+class PlayerUpdated(Event):
+    def __init__(self, *player_ids: int):
+        """
+        Initialize a PlayerUpdated event for players that were added, edited,
+        removed, or whose territory or tiles changed.
+
+        Args:
+            player_ids (int): Registry ids of the affected players.
+        """
+        self.player_ids: Set[int] = set(player_ids)
+
+    def merge(self, other: 'PlayerUpdated') -> 'PlayerUpdated':
+        return PlayerUpdated(*(self.player_ids | other.player_ids))
+
+
+class RollAppended(Event):
+    def __init__(self, turn: int, batches: int = 1):
+        """
+        Initialize a RollAppended event.
+
+        Args:
+            turn (int): The turn the rolls were recorded in.
+            batches (int): Number of roll batches appended.
+        """
+        self.turn = turn
+        self.batches = batches
+
+    def merge(self, other: 'RollAppended') -> 'RollAppended':
+        return RollAppended(other.turn, self.batches + other.batches)
+
+
+class TurnAdvanced(Event):
+    def __init__(self, turn: int):
+        """
+        Initialize a TurnAdvanced event.
+
+        Args:
+            turn (int): The new current turn.
+        """
+        self.turn = turn
+
+
+class DiplomacyChanged(Event):
+    def __init__(self):
+        """
+        Initialize a DiplomacyChanged event for added or removed alliances and NAPs.
+        """
+
+
+class EventBus:
+    def __init__(self, root, latency: Optional[LatencyRecorder] = None):
+        """
+        Initialize an EventBus that delivers events once per Tk idle cycle.
+
+        Published events are queued per type and merged, so a burst of
+        actions reaches each subscriber as one combined event when Tk next
+        goes idle, and views repaint once. Handlers are bound methods of the
+        view that subscribed, so a view's subscriptions can be dropped
+        together when it is destroyed.
+
+        Args:
+            root: The Tk root used to schedule idle callbacks. Without one,
+                events are delivered as soon as they are published.
+            latency (LatencyRecorder, optional): Times each handler, e.g. the
+                PhotoImage repaint, as "event/<type>/<View>.<method>" while enabled.
+        """
+        self.root = root
+        self.latency = latency
+        self._handlers: Dict[Type[Event], List[Callable[[Event], None]]] = {}
+        self._pending: Dict[Type[Event], Event] = {}
+        self._scheduled = False
+
+    def subscribe(self, event_type: Type[Event], handler: Callable[[Event], None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe_all(self, owner) -> None:
+        """
+        Drop every handler bound to an object, e.g. a view being destroyed.
+        """
+        for handlers in self._handlers.values():
+            handlers[:] = [handler for handler in handlers if getattr(handler, '__self__', None) is not owner]
+
+    def publish(self, event: Event) -> None:
+        """
+        Queue an event, merging it with a pending event of the same type.
+
+        Args:
+            event (Event): The event to deliver on the next idle cycle.
+        """
+        event_type = type(event)
+        pending = self._pending.get(event_type)
+        self._pending[event_type] = event if pending is None else pending.merge(event)
+        if self.root is None:
+            self.flush()
+        elif not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """
+        Deliver all pending events now, in the order their types were first published.
+        """
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        timed = self.latency is not None and self.latency.enabled
+        for event_type, event in pending.items():
+            for handler in list(self._handlers.get(event_type, ())):
+                if not timed:
+                    handler(event)
+                    continue
+                start = time.perf_counter()
+                handler(event)
+                owner = type(getattr(handler, '__self__', None)).__name__
+                self.latency.record(f"event/{event_type.__name__}/{owner}.{handler.__name__}",
+                                    time.perf_counter() - start)
@@ -0,0 +1,146 @@
+# models/bloc_analytics.py
+
+import numpy as np
+from collections import Counter
+from typing import Dict, FrozenSet, List, Tuple
+from models.diplomacy import DiplomacyGraph, ALLIANCE
+from models.ownership import OwnershipDelta, OwnershipStore
+from models.player_registry import PlayerRegistry
+from models.region_map import RegionMap
+from models.roll_history import RollHistory
+from models.territory_stats import TerritoryStats
+
+
+class BlocAnalytics:
+    def __init__(self, region_map: RegionMap, ownership: OwnershipStore, stats: TerritoryStats,
+                 diplomacy: DiplomacyGraph, players: PlayerRegistry, roll_history: RollHistory):
+        """
+        Initialize BlocAnalytics and subscribe it to ownership changes.
+
+        A bloc is a connected group of allied players; players without
+        alliances form a bloc of their own. Per-player territory comes from
+        TerritoryStats; the border length between every pair of players and
+        the bloc totals are updated from each OwnershipDelta by visiting only
+        the changed regions and their neighbours. Bloc totals are rebuilt from
+        the per-player figures, not from pixels, when diplomacy changes.
+
+        Args:
+            region_map (RegionMap): Region areas and adjacency.
+            ownership (OwnershipStore): The ownership store to follow.
+            stats (TerritoryStats): Per-player territory, subscribed to the same store.
+            diplomacy (DiplomacyGraph): Alliances that define the blocs.
+            players (PlayerRegistry): The game's players.
+            roll_history (RollHistory): Source of the tiles rolled per turn.
+        """
+        self.region_map = region_map
+        self.ownership = ownership
+        self.stats = stats
+        self.diplomacy = diplomacy
+        self.players = players
+        self.roll_history = roll_history
+
+        self._owners = [0] * region_map.region_count
+        self.player_border: Counter = Counter()  # (player_a, player_b) with a < b -> shared border length
+
+        self.blocs: List[FrozenSet[int]] = []
+        self.bloc_of: Dict[int, int] = {}
+        self.bloc_regions: List[int] = []
+        self.bloc_area: List[int] = []
+        self.bloc_border: Counter = Counter()  # (bloc_a, bloc_b) with a < b -> shared border length
+
+        # Borders for the existing territory first; with no blocs yet the feed
+        # leaves bloc totals alone and rebuild_blocs derives them afterwards.
+        owners = ownership.owners
+        regions = owners.nonzero()[0]
+        if len(regions):
+            self.on_ownership_changed(OwnershipDelta(regions, np.zeros_like(owners[regions]), owners[regions]))
+        self.rebuild_blocs()
+        ownership.subscribe(self.on_ownership_changed)
+
+    def detach(self):
+        self.ownership.unsubscribe(self.on_ownership_changed)
+
+    def on_ownership_changed(self, delta: OwnershipDelta):
+        """
+        Update territory and border aggregates for the regions in a delta.
+
+        Args:
+            delta (OwnershipDelta): The regions that changed owner.
+        """
+        areas = self.region_map.areas
+        neighbours = self.region_map.neighbours
+        owners = self._owners
+        bloc_of = self.bloc_of
+        for region, old, new in zip(delta.regions.tolist(), delta.old_owners.tolist(), delta.new_owners.tolist()):
+            area = int(areas[region])
+            for owner, sign in ((old, -1), (new, 1)):
+                if owner:
+                    bloc = bloc_of.get(owner)
+                    if bloc is not None:
+                        self.bloc_regions[bloc] += sign
+                        self.bloc_area[bloc] += sign * area
+            for neighbour, length in neighbours[region].items():
+                other = owners[neighbour]
+                if not other:
+                    continue
+                if old and old != other:
+                    self._add_border(old, other, -length)
+                if new and new != other:
+                    self._add_border(new, other, length)
+            owners[region] = new
+
+    def _add_border(self, player_a: int, player_b: int, length: int):
+        key = (player_a, player_b) if player_a < player_b else (player_b, player_a)
+        self.player_border[key] += length
+        bloc_a = self.bloc_of.get(player_a)
+        bloc_b = self.bloc_of.get(player_b)
+        if bloc_a is not None and bloc_b is not None and bloc_a != bloc_b:
+            self.bloc_border[(bloc_a, bloc_b) if bloc_a < bloc_b else (bloc_b, bloc_a)] += length
+
+    def rebuild_blocs(self):
+        """
+        Recompute the blocs after alliances or players change.
+
+        Costs O(players + bordering player pairs); no map data is touched.
+        """
+        player_ids = [player.id for player in self.players]
+        self.blocs = [frozenset(bloc) for bloc in self.diplomacy.blocs(ALLIANCE, player_ids)]
+        self.bloc_of = {player_id: index for index, bloc in enumerate(self.blocs) for player_id in bloc}
+        self.bloc_regions = [sum(self.stats.regions[player_id] for player_id in bloc) for bloc in self.blocs]
+        self.bloc_area = [sum(self.stats.area[player_id] for player_id in bloc) for bloc in self.blocs]
+        self.bloc_border = Counter()
+        for (player_a, player_b), length in self.player_border.items():
+            bloc_a = self.bloc_of.get(player_a)
+            bloc_b = self.bloc_of.get(player_b)
+            if length and bloc_a is not None and bloc_b is not None and bloc_a != bloc_b:
+                self.bloc_border[(min(bloc_a, bloc_b), max(bloc_a, bloc_b))] += length
+
+    def summary(self, turn: int) -> List[dict]:
+        """
+        Summarise every bloc, largest territory first.
+
+        Args:
+            turn (int): The turn whose rolled tiles to total.
+
+        Returns:
+            list: One dict per bloc with 'members' (names), 'regions', 'area',
+                'tiles_rolled' and 'borders' (list of (rival member names, length)).
+        """
+        tiles_rolled = self.roll_history.turn_totals(turn)
+        names = [sorted(self.players.get_by_id(player_id).name for player_id in bloc) for bloc in self.blocs]
+        rivals: Dict[int, List[Tuple[int, int]]] = {index: [] for index in range(len(self.blocs))}
+        for (bloc_a, bloc_b), length in self.bloc_border.items():
+            if length:
+                rivals[bloc_a].append((bloc_b, length))
+                rivals[bloc_b].append((bloc_a, length))
+        summaries = []
+        for index, bloc in enumerate(self.blocs):
+            summaries.append({
+                'members': names[index],
+                'regions': self.bloc_regions[index],
+                'area': self.bloc_area[index],
+                'tiles_rolled': sum(tiles_rolled.get(player_id, 0) for player_id in bloc),
+                'borders': [(names[rival], length) for rival, length in sorted(rivals[index], key=lambda r: -r[1])],
+            })
+        summaries.sort(key=lambda summary: (-summary['area'], summary['members']))
+        return summaries
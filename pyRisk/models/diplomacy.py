@@ -0,0 +1,158 @@
+# models/diplomacy.py
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+ALLIANCE = 'alliance'
+NAP = 'nap'
+RELATIONS = (ALLIANCE, NAP)
+
+
+class DiplomacyGraph:
+    def __init__(self):
+        """
+        Initialize an empty DiplomacyGraph.
+
+        Each relation (alliances and NAPs) is a symmetric graph over
+        PlayerRegistry ids stored as adjacency sets, so adding, removing and
+        checking a pact are O(1) and bulk queries are set operations.
+        """
+        self._adjacency: Dict[str, Dict[int, Set[int]]] = {relation: {} for relation in RELATIONS}
+
+    def _graph(self, relation: str) -> Dict[int, Set[int]]:
+        try:
+            return self._adjacency[relation]
+        except KeyError:
+            raise ValueError(f"Unknown relation '{relation}'.") from None
+
+    def add(self, relation: str, player1_id: int, player2_id: int) -> bool:
+        """
+        Add a symmetric relation between two players.
+
+        Args:
+            relation (str): 'alliance' or 'nap'.
+            player1_id (int): Registry id of the first player.
+            player2_id (int): Registry id of the second player.
+
+        Returns:
+            bool: True if the relation was added, False if it already existed.
+        """
+        if player1_id == player2_id:
+            raise ValueError("A player cannot have a pact with themselves.")
+        graph = self._graph(relation)
+        partners = graph.setdefault(player1_id, set())
+        if player2_id in partners:
+            return False
+        partners.add(player2_id)
+        graph.setdefault(player2_id, set()).add(player1_id)
+        return True
+
+    def remove(self, relation: str, player1_id: int, player2_id: int) -> bool:
+        """
+        Remove a relation between two players.
+
+        Returns:
+            bool: True if the relation existed.
+        """
+        graph = self._graph(relation)
+        if player2_id not in graph.get(player1_id, ()):
+            return False
+        graph[player1_id].discard(player2_id)
+        graph[player2_id].discard(player1_id)
+        return True
+
+    def has(self, relation: str, player1_id: int, player2_id: int) -> bool:
+        return player2_id in self._graph(relation).get(player1_id, ())
+
+    def partners(self, relation: str, player_id: int) -> FrozenSet[int]:
+        """
+        Get the ids of every player with the given relation to a player.
+        """
+        return frozenset(self._graph(relation).get(player_id, ()))
+
+    def remove_player(self, player_id: int) -> None:
+        """
+        Drop every relation of a player, in time proportional to its number of pacts.
+        """
+        for graph in self._adjacency.values():
+            for partner_id in graph.pop(player_id, ()):
+                graph[partner_id].discard(player_id)
+
+    def pairs(self, relation: str) -> List[Tuple[int, int]]:
+        """
+        List each relation once as an (id, id) pair with the smaller id first.
+        """
+        return [(player_id, partner_id)
+                for player_id, partners in self._graph(relation).items()
+                for partner_id in partners if player_id < partner_id]
+
+    def common_partners(self, relation: str, player1_id: int, player2_id: int) -> FrozenSet[int]:
+        """
+        Get the players related to both players, e.g. their common allies.
+        """
+        graph = self._graph(relation)
+        return frozenset(graph.get(player1_id, set()) & graph.get(player2_id, set()))
+
+    def hostile_to(self, player_id: int, player_ids: Iterable[int]) -> Set[int]:
+        """
+        Get the players that have neither an alliance nor a NAP with a player.
+
+        Args:
+            player_id (int): The player to check.
+            player_ids (iterable): Ids of every player in the game.
+
+        Returns:
+            set: Ids of the hostile players.
+        """
+        friendly = {player_id}
+        for graph in self._adjacency.values():
+            friendly |= graph.get(player_id, set())
+        return set(player_ids) - friendly
+
+    def blocs(self, relation: str = ALLIANCE, player_ids: Optional[Iterable[int]] = None) -> List[Set[int]]:
+        """
+        Find the blocs of a relation: the connected components of its graph.
+
+        Args:
+            relation (str): The relation to follow, alliances by default.
+            player_ids (iterable, optional): Every player in the game. If given,
+                players without pacts are returned as single-player blocs.
+
+        Returns:
+            list: Sets of player ids, largest bloc first.
+        """
+        graph = self._graph(relation)
+        nodes = list(graph) if player_ids is None else list(player_ids)
+        seen: Set[int] = set()
+        components = []
+        for start in nodes:
+            if start in seen or (player_ids is None and not graph[start]):
+                continue
+            component = {start}
+            stack = [start]
+            while stack:
+                for partner_id in graph.get(stack.pop(), ()):
+                    if partner_id not in component:
+                        component.add(partner_id)
+                        stack.append(partner_id)
+            seen |= component
+            components.append(component)
+        components.sort(key=len, reverse=True)
+        return components
+
+    def to_dict(self) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Serialise the graph as id pairs per relation.
+        """
+        return {relation: self.pairs(relation) for relation in RELATIONS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Iterable[Iterable[int]]]) -> 'DiplomacyGraph':
+        """
+        Rebuild a graph from to_dict output.
+        """
+        graph = cls()
+        for relation in RELATIONS:
+            for player1_id, player2_id in data.get(relation, ()):
+                if player1_id != player2_id:
+                    graph.add(relation, player1_id, player2_id)
+        return graph
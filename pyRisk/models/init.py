@@ -1,7 +1,17 @@
 # models/__init__.py
 
 from .player import Player
+from .player_registry import PlayerRegistry
 from .game_state import GameState
+from .diplomacy import DiplomacyGraph
 from .roll_table import RollTable
+from .roll_rules import CompiledRollRules
+from .roll_history import RollHistory
+from .region_map import RegionMap
+from .ownership import OwnershipStore
+from .territory_stats import TerritoryStats
+from .bloc_analytics import BlocAnalytics
+from .turn_report import TurnReport
 
-__all__ = ['Player', 'GameState', 'RollTable']
+__all__ = ['Player', 'PlayerRegistry', 'GameState', 'DiplomacyGraph', 'RollTable', 'CompiledRollRules', 'RollHistory',
+           'RegionMap', 'OwnershipStore', 'TerritoryStats', 'BlocAnalytics', 'TurnReport']
@@ -0,0 +1,96 @@
+# models/ownership.py
+
+import numpy as np
+from typing import Callable, Iterable, List, Union
+
+UNOWNED = 0
+
+
+class OwnershipDelta:
+    def __init__(self, regions: np.ndarray, old_owners: np.ndarray, new_owners: np.ndarray):
+        """
+        Initialize an OwnershipDelta describing regions that changed owner.
+
+        Args:
+            regions (np.ndarray): Indices of the regions that changed.
+            old_owners (np.ndarray): Player id that owned each region before (0 = unowned).
+            new_owners (np.ndarray): Player id that owns each region now (0 = unowned).
+        """
+        self.regions = regions
+        self.old_owners = old_owners
+        self.new_owners = new_owners
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+
+class OwnershipStore:
+    def __init__(self, region_count: int):
+        """
+        Initialize an OwnershipStore with every region unowned.
+
+        Owners are PlayerRegistry ids held in one array indexed by region.
+        Every change is reported to subscribers as an OwnershipDelta listing
+        only the regions that actually changed.
+
+        Args:
+            region_count (int): Number of regions in the RegionMap.
+        """
+        self.owners = np.zeros(region_count, dtype=np.int32)
+        self._listeners: List[Callable[[OwnershipDelta], None]] = []
+
+    def subscribe(self, listener: Callable[[OwnershipDelta], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[OwnershipDelta], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def owner_of(self, region: int) -> int:
+        return int(self.owners[region])
+
+    def regions_of(self, player_id: int) -> np.ndarray:
+        return np.flatnonzero(self.owners == player_id)
+
+    def assign(self, regions: Union[Iterable[int], np.ndarray], owners: Union[int, np.ndarray]) -> OwnershipDelta:
+        """
+        Give regions to a player (or to several, one owner per region).
+
+        Args:
+            regions (iterable): Region indices to change.
+            owners (int or np.ndarray): Player id for all regions, or one id per region; 0 releases them.
+
+        Returns:
+            OwnershipDelta: The regions that actually changed owner.
+        """
+        regions = np.asarray(regions, dtype=np.int64).ravel()
+        owners = np.broadcast_to(np.asarray(owners, dtype=np.int32), regions.shape)
+        regions, first = np.unique(regions, return_index=True)  # Duplicates keep their first owner
+        owners = owners[first]
+        changed = self.owners[regions] != owners
+        return self._apply(regions[changed], owners[changed])
+
+    def restore(self, owners: np.ndarray) -> OwnershipDelta:
+        """
+        Replace the whole ownership array, e.g. from an undo snapshot or a save.
+
+        Args:
+            owners (np.ndarray): Player id per region.
+
+        Returns:
+            OwnershipDelta: The regions that actually changed owner.
+        """
+        owners = np.asarray(owners, dtype=np.int32)
+        regions = np.flatnonzero(self.owners != owners)
+        return self._apply(regions, owners[regions])
+
+    def snapshot(self) -> np.ndarray:
+        return self.owners.copy()
+
+    def _apply(self, regions: np.ndarray, new_owners: np.ndarray) -> OwnershipDelta:
+        delta = OwnershipDelta(regions, self.owners[regions].copy(), new_owners.copy())
+        if len(delta):
+            self.owners[regions] = new_owners
+            for listener in list(self._listeners):
+                listener(delta)
+        return delta
@@ -1,6 +1,6 @@
 # models/player.py
 
-from typing import List, Optional
+from typing import Optional
 
 
 class Player:
@@ -20,25 +20,4 @@ class Player:
         self.name = name.strip()
         self.color = color
         self.faction = faction.strip() if faction else None
-        self.allies: List['Player'] = []
-        self.naps: List['Player'] = []
-
-    def add_ally(self, player: 'Player') -> None:
-        """
-        Add a player to the allies list.
-
-        Args:
-            player (Player): The player to ally with.
-        """
-        if player not in self.allies:
-            self.allies.append(player)
-
-    def add_nap(self, player: 'Player') -> None:
-        """
-        Add a player to the Non-Aggression Pacts (NAPs) list.
-
-        Args:
-            player (Player): The player to form a NAP with.
-        """
-        if player not in self.naps:
-            self.naps.append(player)
+        self.id: Optional[int] = None  # Assigned by PlayerRegistry
@@ -0,0 +1,137 @@
+# models/player_registry.py
+
+from typing import Dict, Iterator, Optional
+from models.player import Player
+
+
+class PlayerRegistry:
+    def __init__(self):
+        """
+        Initialize an empty PlayerRegistry.
+
+        Players are indexed by exact name, by casefolded name and by a small
+        integer id. Ids start at 1 (0 means "no owner" in owner rasters) and
+        are never reused, so they stay valid in saved rasters after players
+        are removed.
+        """
+        self._by_id: Dict[int, Player] = {}
+        self._by_name: Dict[str, Player] = {}
+        self._by_folded_name: Dict[str, Player] = {}
+        self._next_id = 1
+
+    def __iter__(self) -> Iterator[Player]:
+        return iter(list(self._by_id.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, player: Player) -> bool:
+        return self._by_id.get(getattr(player, 'id', None)) is player
+
+    @property
+    def max_id(self) -> int:
+        """
+        Get the largest id handed out so far, for sizing id-indexed arrays.
+        """
+        return self._next_id - 1
+
+    @property
+    def next_id(self) -> int:
+        """
+        Get the id the next new player will get. Saved with the game so removed players' ids stay retired.
+        """
+        return self._next_id
+
+    @next_id.setter
+    def next_id(self, value: int):
+        # Ids already handed out are never handed out again, so this can only move forward
+        self._next_id = max(self._next_id, value)
+
+    def add(self, player: Player, player_id: Optional[int] = None) -> int:
+        """
+        Register a player and assign it an id.
+
+        Args:
+            player (Player): The player to add.
+            player_id (int, optional): Id to restore, e.g. when loading a save.
+
+        Returns:
+            int: The player's id.
+
+        Raises:
+            ValueError: If the name or id is already taken.
+        """
+        if self.is_name_taken(player.name):
+            raise ValueError(f"Player name '{player.name}' is already taken.")
+        if player_id is None:
+            player_id = self._next_id
+        elif player_id < 1 or player_id in self._by_id:
+            raise ValueError(f"Player id {player_id} is invalid or already taken.")
+        self._next_id = max(self._next_id, player_id + 1)
+        player.id = player_id
+        self._by_id[player_id] = player
+        self._by_name[player.name] = player
+        self._by_folded_name[player.name.casefold()] = player
+        return player_id
+
+    def remove(self, player: Player) -> None:
+        """
+        Remove a player from the registry. Its id is not reused.
+
+        Args:
+            player (Player): The player to remove.
+        """
+        if player not in self:
+            return
+        del self._by_id[player.id]
+        del self._by_name[player.name]
+        del self._by_folded_name[player.name.casefold()]
+
+    def rename(self, player: Player, new_name: str) -> None:
+        """
+        Rename a player, updating every index at once.
+
+        Args:
+            player (Player): The registered player to rename.
+            new_name (str): The new name.
+
+        Raises:
+            ValueError: If another player already uses the name (ignoring case).
+        """
+        new_name = new_name.strip()
+        if self.is_name_taken(new_name, exclude=player):
+            raise ValueError(f"Player name '{new_name}' is already taken.")
+        del self._by_name[player.name]
+        del self._by_folded_name[player.name.casefold()]
+        player.name = new_name
+        self._by_name[new_name] = player
+        self._by_folded_name[new_name.casefold()] = player
+
+    def get(self, name: str) -> Optional[Player]:
+        """
+        Look up a player by exact name.
+        """
+        return self._by_name.get(name)
+
+    def find(self, name: str) -> Optional[Player]:
+        """
+        Look up a player by exact name, falling back to a case-insensitive match.
+        """
+        return self._by_name.get(name) or self._by_folded_name.get(name.strip().casefold())
+
+    def get_by_id(self, player_id: int) -> Optional[Player]:
+        return self._by_id.get(player_id)
+
+    def is_name_taken(self, name: str, exclude: Optional[Player] = None) -> bool:
+        """
+        Check whether a name is used by a player other than ``exclude``, ignoring case.
+
+        Args:
+            name (str): The name to check.
+            exclude (Player, optional): A player whose own name doesn't count, e.g. when editing.
+
+        Returns:
+            bool: True if the name is taken.
+        """
+        player = self._by_folded_name.get(name.strip().casefold())
+        return player is not None and player is not exclude
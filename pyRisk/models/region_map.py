@@ -0,0 +1,221 @@
+# models/region_map.py
+
+import numpy as np
+from PIL import Image, ImageDraw
+from typing import Dict, List, Optional, Sequence, Tuple
+from utils.segmentation import BORDER_LUMINANCE, image_to_color_ids, label_regions, luminance, region_adjacency
+
+MAX_BORDER_WIDTH = 6  # Widest border line two regions can touch across
+
+
+class RegionMap:
+    def __init__(self, labels: np.ndarray, colors: np.ndarray, is_border: np.ndarray,
+                 adjacency: Dict[Tuple[int, int], int], areas: Optional[np.ndarray] = None,
+                 centroids: Optional[np.ndarray] = None, bboxes: Optional[np.ndarray] = None):
+        """
+        Initialize a RegionMap from a label raster and its per-region data.
+
+        Regions are the 4-connected areas of identical colour in the base map.
+        Region indices run from 0 to region_count - 1; border regions (the
+        dark lines between territories) can't be owned.
+
+        Args:
+            labels (np.ndarray): (height, width) int32 region index per pixel.
+            colors (np.ndarray): Packed RGBA colour (uint32) per region.
+            is_border (np.ndarray): Boolean per region, True for border lines.
+            adjacency (dict): (region_a, region_b) -> shared border length, region_a < region_b.
+            areas, centroids, bboxes (np.ndarray, optional): Per-region figures saved
+                by to_arrays; computed from the labels when not given.
+        """
+        self.labels = labels
+        self.colors = colors
+        self.is_border = is_border
+        self.region_count = len(colors)
+        self.height, self.width = labels.shape
+        if areas is None or centroids is None or bboxes is None:
+            areas, centroids, bboxes = self._region_figures()
+        self.areas = areas
+        self.centroids = centroids
+        self.bboxes = bboxes
+
+        self.adjacency = adjacency
+        self.neighbours: List[Dict[int, int]] = [{} for _ in range(self.region_count)]
+        for (region_a, region_b), length in adjacency.items():
+            self.neighbours[region_a][region_b] = length
+            self.neighbours[region_b][region_a] = length
+
+    def _region_figures(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the area, centroid and bounding box of every region from the labels.
+        """
+        flat = self.labels.ravel()
+        areas = np.bincount(flat, minlength=self.region_count).astype(np.int64)
+        ys, xs = np.divmod(np.arange(flat.size, dtype=np.int64), self.width)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centroids = np.stack([
+                np.bincount(flat, weights=xs, minlength=self.region_count) / areas,
+                np.bincount(flat, weights=ys, minlength=self.region_count) / areas,
+            ], axis=1)
+        # Bounding boxes as (x0, y0, x1, y1), exclusive of x1/y1. A stable sort by
+        # label keeps each region's pixels in row-major order.
+        order = np.argsort(flat, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(areas)[:-1]))
+        sorted_xs = order % self.width
+        bboxes = np.stack([
+            np.minimum.reduceat(sorted_xs, starts),
+            order[starts] // self.width,
+            np.maximum.reduceat(sorted_xs, starts) + 1,
+            order[starts + areas - 1] // self.width + 1,
+        ], axis=1).astype(np.int32)
+        return areas, centroids, bboxes
+
+    @classmethod
+    def from_image(cls, image: Image.Image, border_luminance: int = BORDER_LUMINANCE,
+                   max_border_width: int = MAX_BORDER_WIDTH, labels: Optional[np.ndarray] = None) -> 'RegionMap':
+        """
+        Segment a base map image into regions.
+
+        Args:
+            image (Image.Image): The unpainted base map.
+            border_luminance (int): Regions darker than this are border lines.
+            max_border_width (int): Widest border line two regions can touch across.
+            labels (np.ndarray, optional): Labels already computed for this image
+                with label_regions, e.g. by the import preprocessing.
+
+        Returns:
+            RegionMap: The segmented map.
+        """
+        color_ids = image_to_color_ids(image)
+        if labels is None:
+            labels, region_count = label_regions(color_ids)
+        else:
+            region_count = int(labels.max()) + 1
+        colors = np.zeros(region_count, dtype=np.uint32)
+        colors[labels.ravel()] = color_ids.ravel()
+        is_border = luminance(colors) < border_luminance
+        adjacency = region_adjacency(labels, is_border[labels], max_border_width)
+        return cls(labels, colors, is_border, adjacency)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Get everything needed to rebuild this map without segmenting it again, e.g. for the map cache.
+
+        Returns:
+            dict: Named arrays accepted by from_arrays.
+        """
+        pairs = np.array(list(self.adjacency), dtype=np.int32).reshape(-1, 2)
+        lengths = np.fromiter(self.adjacency.values(), dtype=np.int64, count=len(self.adjacency))
+        return {"labels": self.labels, "colors": self.colors, "is_border": self.is_border,
+                "adjacency_pairs": pairs, "adjacency_lengths": lengths,
+                "areas": self.areas, "centroids": self.centroids, "bboxes": self.bboxes}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> 'RegionMap':
+        """
+        Rebuild a RegionMap from the arrays saved by to_arrays.
+
+        Args:
+            arrays (dict): Named arrays, e.g. a map cache entry.
+
+        Returns:
+            RegionMap: The segmented map.
+        """
+        adjacency = {(int(a), int(b)): int(length) for (a, b), length
+                     in zip(arrays["adjacency_pairs"].tolist(), arrays["adjacency_lengths"].tolist())}
+        return cls(arrays["labels"], arrays["colors"], arrays["is_border"], adjacency,
+                   arrays["areas"], arrays["centroids"], arrays["bboxes"])
+
+    def regions_in_box(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """
+        Get the ownable regions lying entirely inside a box.
+
+        Args:
+            x0, y0, x1, y1 (int): The box, exclusive of x1/y1.
+
+        Returns:
+            np.ndarray: Region indices.
+        """
+        boxes = self.bboxes
+        inside = (boxes[:, 0] >= x0) & (boxes[:, 1] >= y0) & (boxes[:, 2] <= x1) & (boxes[:, 3] <= y1)
+        return np.flatnonzero(inside & ~self.is_border)
+
+    def bbox_of(self, regions: np.ndarray) -> Tuple[int, int, int, int]:
+        """
+        Get the box covering a non-empty set of regions, as (x0, y0, x1, y1).
+        """
+        boxes = self.bboxes[regions]
+        return (int(boxes[:, 0].min()), int(boxes[:, 1].min()),
+                int(boxes[:, 2].max()), int(boxes[:, 3].max()))
+
+    def mask(self, regions: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Get a boolean mask of the pixels of some regions within a box.
+
+        Args:
+            regions (np.ndarray): Region indices.
+            box (tuple): (x0, y0, x1, y1), exclusive of x1/y1.
+
+        Returns:
+            np.ndarray: (y1 - y0, x1 - x0) boolean mask.
+        """
+        x0, y0, x1, y1 = box
+        selected = np.zeros(self.region_count, dtype=bool)
+        selected[regions] = True
+        return selected[self.labels[y0:y1, x0:x1]]
+
+    def regions_in_polygon(self, points: Sequence[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the ownable regions a polygon covers fully and partially.
+
+        The polygon is rasterised once over its bounding box and the covered
+        pixels are counted per region against each region's area.
+
+        Args:
+            points (sequence): The polygon's (x, y) vertices in map pixels.
+
+        Returns:
+            tuple: (fully_covered, partially_covered) arrays of region indices.
+        """
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        x0, y0 = max(0, min(xs)), max(0, min(ys))
+        x1, y1 = min(self.width, max(xs) + 1), min(self.height, max(ys) + 1)
+        empty = np.zeros(0, dtype=np.int64)
+        if x1 <= x0 or y1 <= y0:
+            return empty, empty
+        raster = Image.new("1", (x1 - x0, y1 - y0), 0)
+        ImageDraw.Draw(raster).polygon([(x - x0, y - y0) for x, y in points], fill=1, outline=1)
+        covered = np.bincount(self.labels[y0:y1, x0:x1][np.asarray(raster, dtype=bool)], minlength=self.region_count)
+        touched = (covered > 0) & ~self.is_border
+        full = touched & (covered == self.areas)
+        return np.flatnonzero(full), np.flatnonzero(touched & ~full)
+
+    def render(self, image: Image.Image, regions: np.ndarray, colors: np.ndarray) -> Tuple[int, int, int, int]:
+        """
+        Paint whole regions of an RGBA image in one vectorised pass.
+
+        Only the box covering the regions is read and written back.
+
+        Args:
+            image (Image.Image): The RGBA map image to paint in place.
+            regions (np.ndarray): Non-empty array of region indices.
+            colors (np.ndarray): Packed RGBA colour (uint32) per region.
+
+        Returns:
+            tuple: The painted box (x0, y0, x1, y1).
+        """
+        x0, y0, x1, y1 = bbox = self.bbox_of(regions)
+        lut = np.zeros(self.region_count, dtype=np.uint32)
+        lut[regions] = colors
+        labels = self.labels[y0:y1, x0:x1]
+        mask = self.mask(regions, bbox)
+        pixels = image_to_color_ids(image.crop(bbox)).copy()
+        pixels[mask] = lut[labels[mask]]
+        image.paste(Image.fromarray(pixels.view(np.uint8).reshape(y1 - y0, x1 - x0, 4), "RGBA"), (x0, y0))
+        return bbox
+
+    def region_at(self, x: int, y: int) -> int:
+        return int(self.labels[y, x])
+
+    def is_ownable(self, region: int) -> bool:
+        return not self.is_border[region]
@@ -0,0 +1,339 @@
+# models/roll_history.py
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from models.player_registry import PlayerRegistry
+
+
+def _format_columns(headers: Sequence[str], rows: List[tuple]) -> str:
+    """
+    Lay rows out as a fixed-width table, the first column left-aligned and figures right-aligned.
+    """
+    rows = [tuple(str(value) for value in row) for row in rows]
+    widths = [max([len(header)] + [len(row[index]) for row in rows]) for index, header in enumerate(headers)]
+
+    def align(values):
+        return '  '.join(value.ljust(width) if index == 0 else value.rjust(width)
+                         for index, (value, width) in enumerate(zip(values, widths)))
+    lines = [align(headers), '  '.join('-' * width for width in widths)]
+    lines.extend(align(row) for row in rows)
+    return '\n'.join(lines)
+
+
+class RollHistory:
+    def __init__(self):
+        """
+        Initialize an empty column store of every roll made in a game.
+
+        Each roll is one row across parallel columns: turn, player id, roll,
+        tiles and rule id. Player ids are PlayerRegistry ids, so a removed
+        player's rolls never pass to a new player who reuses the name, and a
+        rename only touches the name table. Players who can't be matched to
+        the registry, e.g. in old saves, get negative ids. Rule names are
+        interned into small integer ids. Rolls submitted together form a
+        batch; ``batch_starts`` holds the first row of each batch. Rolls are
+        kept as strings because external rolls can exceed 64 bits and may
+        have leading zeros.
+        """
+        self.player_names: Dict[int, str] = {}  # Latest name per player id, kept after removal
+        self.rule_names: List[Optional[str]] = [None]  # Rule id 0 means no rule hit
+        self._rule_ids: Dict[Optional[str], int] = {None: 0}
+
+        self.turns = array('i')
+        self.player_ids = array('i')
+        self.rolls: List[str] = []
+        self.tiles = array('i')
+        self.rule_ids = array('H')
+        self.batch_starts = array('I')
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def _intern_rule(self, rule: Optional[str]) -> int:
+        rule_id = self._rule_ids.get(rule)
+        if rule_id is None:
+            rule_id = self._rule_ids[rule] = len(self.rule_names)
+            self.rule_names.append(rule)
+        return rule_id
+
+    def append(self, turn: int, player_id: int, player_name: str, roll, tiles: int,
+               rule: Optional[str] = None) -> None:
+        """
+        Append a single roll to the current batch in O(1).
+
+        Args:
+            turn (int): The turn the roll was made in.
+            player_id (int): The rolling player's registry id.
+            player_name (str): The rolling player's name, shown in the history.
+            roll (int or str): The rolled number.
+            tiles (int): Tiles awarded for the roll.
+            rule (str, optional): Name of the rule that decided the tiles.
+        """
+        if not self.batch_starts:
+            self.batch_starts.append(0)
+        self.player_names[player_id] = player_name
+        self.turns.append(turn)
+        self.player_ids.append(player_id)
+        self.rolls.append(str(roll))
+        self.tiles.append(tiles)
+        self.rule_ids.append(self._intern_rule(rule))
+
+    def append_batch(self, turn: int, results: List[tuple]) -> None:
+        """
+        Append the rolls of one submission as a new batch.
+
+        Args:
+            turn (int): The turn the rolls were made in.
+            results (list): (player_id, player_name, roll, tiles) or
+                (player_id, player_name, roll, tiles, rule) tuples.
+        """
+        self.batch_starts.append(len(self))
+        for result in results:
+            self.append(turn, *result)
+
+    def rename_player(self, player_id: int, new_name: str) -> None:
+        """
+        Rename a player across the whole history in O(1).
+
+        Args:
+            player_id (int): The player's registry id.
+            new_name (str): The new name.
+        """
+        if player_id in self.player_names:
+            self.player_names[player_id] = new_name
+
+    # Row access
+
+    def batch_count(self) -> int:
+        return len(self.batch_starts)
+
+    def batch_range(self, index: int) -> Tuple[int, int]:
+        """
+        Get the [start, end) row range of a batch.
+
+        Args:
+            index (int): Batch index; negative values count from the end.
+
+        Returns:
+            tuple: (start_row, end_row)
+        """
+        if index < 0:
+            index += len(self.batch_starts)
+        start = self.batch_starts[index]
+        end = self.batch_starts[index + 1] if index + 1 < len(self.batch_starts) else len(self)
+        return start, end
+
+    def rows(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str, str, int]]:
+        """
+        Iterate over rows as (turn, player_name, roll, tiles).
+
+        Args:
+            start (int): First row.
+            end (int, optional): Row after the last; defaults to the end of the history.
+        """
+        end = len(self) if end is None else end
+        names = self.player_names
+        for row in range(start, end):
+            yield self.turns[row], names.get(self.player_ids[row], ""), self.rolls[row], self.tiles[row]
+
+    def batch_results(self, index: int) -> Tuple[int, List[Tuple[str, str, int]]]:
+        """
+        Get one batch in the legacy (turn, [(name, roll, tiles), ...]) shape.
+
+        Args:
+            index (int): Batch index; negative values count from the end.
+        """
+        start, end = self.batch_range(index)
+        turn = self.turns[start] if end > start else 0
+        return turn, [(name, roll, tiles) for _, name, roll, tiles in self.rows(start, end)]
+
+    def batches(self) -> Iterator[Tuple[int, List[Tuple[str, str, int]]]]:
+        for index in range(len(self.batch_starts)):
+            yield self.batch_results(index)
+
+    # Aggregate queries
+
+    def player_totals(self) -> Dict[int, int]:
+        """
+        Get the total tiles rolled by each player over the whole game.
+
+        Returns:
+            dict: Player id -> total tiles.
+        """
+        totals: Dict[int, int] = dict.fromkeys(self.player_names, 0)
+        for player_id, tiles in zip(self.player_ids, self.tiles):
+            totals[player_id] += tiles
+        return totals
+
+    def turn_sums(self) -> Dict[int, int]:
+        """
+        Get the total tiles rolled across all players per turn.
+
+        Returns:
+            dict: Turn number -> total tiles, in turn order.
+        """
+        sums: Dict[int, int] = {}
+        for turn, tiles in zip(self.turns, self.tiles):
+            sums[turn] = sums.get(turn, 0) + tiles
+        return sums
+
+    def turn_totals(self, turn: int) -> Dict[int, int]:
+        """
+        Get the tiles each player rolled in one turn.
+
+        Scans backwards from the newest row, so the cost depends on how many
+        rolls were made since that turn, not on the length of the game.
+
+        Args:
+            turn (int): The turn to total.
+
+        Returns:
+            dict: Player id -> tiles rolled in that turn.
+        """
+        totals: Dict[int, int] = {}
+        row = len(self) - 1
+        while row >= 0 and self.turns[row] >= turn:
+            if self.turns[row] == turn:
+                player_id = self.player_ids[row]
+                totals[player_id] = totals.get(player_id, 0) + self.tiles[row]
+            row -= 1
+        return totals
+
+    def latest_rolls(self, turn: int) -> Dict[int, str]:
+        """
+        Get each player's most recent roll in one turn.
+
+        Args:
+            turn (int): The turn to look at.
+
+        Returns:
+            dict: Player id -> latest roll in that turn.
+        """
+        latest: Dict[int, str] = {}
+        row = len(self) - 1
+        while row >= 0 and self.turns[row] >= turn:
+            if self.turns[row] == turn:
+                latest.setdefault(self.player_ids[row], self.rolls[row])
+            row -= 1
+        return latest
+
+    def rule_hit_counts(self) -> Dict[str, int]:
+        """
+        Count how often each rule decided a roll.
+
+        Returns:
+            dict: Rule name -> number of rolls it decided.
+        """
+        counts = Counter(self.rule_ids)
+        return {self.rule_names[rule_id]: count for rule_id, count in counts.items() if rule_id}
+
+    def streaks(self, rule_prefix: str = '') -> Dict[int, Tuple[int, int]]:
+        """
+        Find each player's streaks of consecutive turns with a rule hit.
+
+        Args:
+            rule_prefix (str): Only count rules starting with this, e.g. 'repeat'.
+                Defaults to any rule.
+
+        Returns:
+            dict: Player id -> (current_streak, longest_streak) in turns.
+        """
+        matching = {rule_id for rule_id, name in enumerate(self.rule_names)
+                    if name is not None and name.startswith(rule_prefix)}
+        last_turn: Dict[int, Optional[int]] = dict.fromkeys(self.player_names)
+        current = dict.fromkeys(self.player_names, 0)
+        longest = dict.fromkeys(self.player_names, 0)
+        for turn, player_id, rule_id in zip(self.turns, self.player_ids, self.rule_ids):
+            if last_turn[player_id] == turn:
+                continue  # Only the first roll of a player in a turn counts
+            hit = rule_id in matching
+            consecutive = last_turn[player_id] is not None and turn == last_turn[player_id] + 1
+            last_turn[player_id] = turn
+            if hit:
+                current[player_id] = current[player_id] + 1 if consecutive else 1
+                longest[player_id] = max(longest[player_id], current[player_id])
+            else:
+                current[player_id] = 0
+        return {player_id: (current[player_id], longest[player_id]) for player_id in self.player_names}
+
+    def format_summary(self) -> str:
+        """
+        Render the whole-game roll figures as fixed-width text tables: tiles per
+        turn, and per player the total tiles and rule-hit streaks, then how
+        often each rule decided a roll.
+        """
+        streaks = self.streaks()
+        totals = self.player_totals()
+        players = sorted(totals, key=lambda player_id: (-totals[player_id], self.player_names[player_id]))
+        sections = [
+            _format_columns(("Turn", "Tiles rolled"), list(self.turn_sums().items())),
+            _format_columns(("Player", "Tiles rolled", "Rule streak", "Best streak"),
+                            [(self.player_names[player_id], totals[player_id], *streaks[player_id])
+                             for player_id in players]),
+        ]
+        hits = self.rule_hit_counts()
+        if hits:
+            sections.append(_format_columns(("Rule", "Rolls decided"),
+                                            sorted(hits.items(), key=lambda hit: (-hit[1], hit[0]))))
+        return '\n\n'.join(sections)
+
+    # Serialisation
+
+    def to_dict(self) -> dict:
+        """
+        Serialise the history as JSON-ready columns.
+
+        Returns:
+            dict: Column lists plus the player and rule name tables.
+        """
+        return {
+            "players": [[player_id, name] for player_id, name in self.player_names.items()],
+            "rule_names": self.rule_names,
+            "turns": self.turns.tolist(),
+            "player_ids": self.player_ids.tolist(),
+            "rolls": self.rolls,
+            "tiles": self.tiles.tolist(),
+            "rule_ids": self.rule_ids.tolist(),
+            "batch_starts": self.batch_starts.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data, players: Optional[PlayerRegistry] = None) -> 'RollHistory':
+        """
+        Rebuild a history from to_dict output or an older save.
+
+        Older saves hold a legacy ``all_roll_results`` list that identifies
+        players by name only. Those names are matched to the registry; names
+        it doesn't hold (removed players) get negative ids of their own.
+
+        Args:
+            data (dict or list): Serialised columns, or [(turn, [(name, roll, tiles), ...]), ...].
+            players (PlayerRegistry, optional): The loaded game's players, for older saves.
+
+        Returns:
+            RollHistory: The restored history.
+        """
+        history = cls()
+        former: Dict[str, int] = {}
+
+        def player_id_of(name: str) -> int:
+            player = players.get(name) if players is not None else None
+            if player is not None:
+                return player.id
+            return former.setdefault(name, -1 - len(former))
+
+        if isinstance(data, list):
+            for turn, results in data:
+                history.append_batch(turn, [(player_id_of(result[0]),) + tuple(result) for result in results])
+            return history
+        history.player_names = {int(player_id): name for player_id, name in data.get("players", [])}
+        history.player_ids = array('i', data.get("player_ids", []))
+        history.rule_names = list(data.get("rule_names", [None]))
+        history._rule_ids = {name: rule_id for rule_id, name in enumerate(history.rule_names)}
+        history.turns = array('i', data.get("turns", []))
+        history.rolls = [str(roll) for roll in data.get("rolls", [])]
+        history.tiles = array('i', data.get("tiles", []))
+        history.rule_ids = array('H', data.get("rule_ids", []))
+        history.batch_starts = array('I', data.get("batch_starts", []))
+        return history
@@ -0,0 +1,233 @@
+# models/roll_rules.py
+
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Operator = Tuple[Callable[[int, int], int], int]
+
+OPERATORS: Dict[str, Callable[[int, int], int]] = {
+    'add': operator.add,
+    'multiply': operator.mul,
+    'replace': lambda base_tiles, value: value,
+}
+
+REPEAT_PRIORITY = 10
+PALINDROME_PRIORITY = 20
+CUSTOM_RULE_KINDS = ('ends_with', 'ascending_run', 'descending_run')
+DEDUP_MIN_BATCH = 4096  # Smaller batches are always scored roll by roll
+DEDUP_MAX_DISTINCT_SHARE = 0.25  # Batches are deduplicated when at most this share of the rolls differ
+
+
+def repeat_suffix_length(roll_str: str) -> int:
+    """
+    Get the length of the run of identical digits at the end of a roll.
+
+    Args:
+        roll_str (str): The rolled number as a string.
+
+    Returns:
+        int: Length of the run, or 0 if the last two digits differ.
+    """
+    if not roll_str:
+        return 0
+    last = roll_str[-1]
+    length = len(roll_str) - len(roll_str.rstrip(last))
+    return length if length >= 2 else 0
+
+
+def palindrome_suffix_length(roll_str: str) -> int:
+    """
+    Get the length of the longest palindrome at the end of a roll.
+
+    A suffix of the roll is a palindrome exactly when it equals a prefix of
+    the reversed roll, so the longest one falls out of the KMP prefix
+    function of ``reversed + separator + roll`` in a single linear pass.
+
+    Args:
+        roll_str (str): The rolled number as a string.
+
+    Returns:
+        int: Length of the palindrome, or 0 if none of length 2 or more.
+    """
+    if len(roll_str) < 2:
+        return 0
+    text = roll_str[::-1] + '#' + roll_str
+    prefix = [0] * len(text)
+    for i in range(1, len(text)):
+        k = prefix[i - 1]
+        while k and text[i] != text[k]:
+            k = prefix[k - 1]
+        if text[i] == text[k]:
+            k += 1
+        prefix[i] = k
+    length = prefix[-1]
+    return length if length >= 2 else 0
+
+
+def run_suffix_length(roll_str: str, step: int) -> int:
+    """
+    Get the length of the run at the end of a roll where each digit is the previous one plus ``step``.
+
+    Args:
+        roll_str (str): The rolled number as a string.
+        step (int): 1 for ascending runs such as 345, -1 for descending runs such as 543.
+
+    Returns:
+        int: Length of the run (1 if the last two digits don't follow on).
+    """
+    length = 1 if roll_str else 0
+    for i in range(len(roll_str) - 1, 0, -1):
+        if ord(roll_str[i]) - ord(roll_str[i - 1]) != step:
+            break
+        length += 1
+    return length
+
+
+class CompiledRule:
+    __slots__ = ('name', 'priority', 'match', 'operators', 'default_operator', 'per_length')
+
+    def __init__(self, name: str, priority: int, match: Callable[[str], int],
+                 operators: Tuple[Optional[Operator], ...] = (), default_operator: Optional[Operator] = None,
+                 per_length: bool = False):
+        """
+        Initialize a compiled rule.
+
+        Args:
+            name (str): Rule name reported with each hit; per-length rules append '-<length>'.
+            priority (int): Lower priorities are tried first.
+            match (Callable): Returns the matched suffix length of a roll string, or 0.
+            operators (tuple): Operator per matched length, for per-length rules.
+            default_operator (tuple, optional): Operator for lengths without one; None means default tiles.
+            per_length (bool): Whether the operator and reported name depend on the matched length.
+        """
+        self.name = name
+        self.priority = priority
+        self.match = match
+        self.operators = operators
+        self.default_operator = default_operator
+        self.per_length = per_length
+
+    def operator_for(self, length: int) -> Optional[Operator]:
+        if length < len(self.operators) and self.operators[length] is not None:
+            return self.operators[length]
+        return self.default_operator
+
+
+def _resolve_operator(config: Dict[str, Any]) -> Operator:
+    return OPERATORS.get(config.get('type', 'add'), OPERATORS['add']), int(config.get('value', 0))
+
+
+def _length_table(config: Dict[str, Dict[str, Any]]) -> Tuple[Optional[Operator], ...]:
+    lengths = {int(length): rule for length, rule in config.items() if str(length).isdigit()}
+    if not lengths:
+        return ()
+    table: List[Optional[Operator]] = [None] * (max(lengths) + 1)
+    for length, rule in lengths.items():
+        if rule:
+            table[length] = _resolve_operator(rule)
+    return tuple(table)
+
+
+def _compile_custom_rule(config: Dict[str, Any]) -> Optional[CompiledRule]:
+    kind = config.get('kind')
+    if kind == 'ends_with':
+        pattern = str(config.get('pattern', ''))
+        if not pattern.isdigit():
+            return None
+        pattern_length = len(pattern)
+        match = lambda roll_str: pattern_length if roll_str.endswith(pattern) else 0
+        default_name = f"ends in {pattern}"
+    elif kind in ('ascending_run', 'descending_run'):
+        step = 1 if kind == 'ascending_run' else -1
+        min_length = max(2, int(config.get('min_length', 3)))
+
+        def match(roll_str: str) -> int:
+            length = run_suffix_length(roll_str, step)
+            return length if length >= min_length else 0
+        default_name = f"{kind.replace('_', ' ')} of {min_length}+"
+    else:
+        return None
+    return CompiledRule(config.get('name') or default_name, int(config.get('priority', 0)), match,
+                        default_operator=_resolve_operator(config))
+
+
+class CompiledRollRules:
+    __slots__ = ('digit_values', 'base_values', 'default_tiles', 'pipeline')
+
+    def __init__(self, number_values: Dict[str, int], repeats_config: Dict[str, Dict[str, Any]],
+                 palindromes_config: Dict[str, Dict[str, Any]], default_tiles: int,
+                 custom_rules: Iterable[Dict[str, Any]] = ()):
+        """
+        Compile a roll table configuration into an immutable rule pipeline.
+
+        Digit values become lookup tuples indexed by digit, repeat and
+        palindrome configs become operator tuples indexed by length, and all
+        rules, built-in and custom, are sorted into one precedence order. The
+        first rule that matches the end of a roll decides its tiles; if none
+        does, the last digit's value is used.
+
+        Args:
+            number_values (dict): Digit string -> tiles.
+            repeats_config (dict): Repeat length string -> {'type', 'value'}.
+            palindromes_config (dict): Palindrome length string -> {'type', 'value'}.
+            default_tiles (int): Tiles when a matched length has no config, or a digit has no value.
+            custom_rules (iterable): User-defined rules, see CUSTOM_RULE_KINDS.
+        """
+        self.digit_values = tuple(int(number_values.get(str(d), default_tiles)) for d in range(10))
+        self.base_values = tuple(int(number_values.get(str(d), 1)) for d in range(10))
+        self.default_tiles = default_tiles
+        rules = [
+            CompiledRule('repeat', REPEAT_PRIORITY, repeat_suffix_length,
+                         _length_table(repeats_config), per_length=True),
+            CompiledRule('palindrome', PALINDROME_PRIORITY, palindrome_suffix_length,
+                         _length_table(palindromes_config), per_length=True),
+        ]
+        rules.extend(rule for rule in map(_compile_custom_rule, custom_rules) if rule is not None)
+        self.pipeline = tuple(sorted(rules, key=lambda rule: rule.priority))  # sorted() is stable
+
+    def score(self, roll_str: str) -> Tuple[int, Optional[str]]:
+        """
+        Score a roll with the compiled pipeline.
+
+        Args:
+            roll_str (str): The rolled number as a string.
+
+        Returns:
+            tuple: (tiles, rule) where rule names the rule that decided the tiles, or None.
+                An empty roll scores (0, None).
+        """
+        if not roll_str:
+            return 0, None
+        last_digit = ord(roll_str[-1]) - 48
+        for rule in self.pipeline:
+            length = rule.match(roll_str)
+            if length:
+                name = f"{rule.name}-{length}" if rule.per_length else rule.name
+                op = rule.operator_for(length)
+                if op is None:
+                    return self.default_tiles, name
+                apply, value = op
+                return apply(self.base_values[last_digit] * length, value), name
+        return self.digit_values[last_digit], None
+
+    def score_batch(self, roll_strs: Iterable[str]) -> List[Tuple[int, Optional[str]]]:
+        """
+        Score many rolls. Large batches where most rolls repeat score each distinct roll once.
+
+        Deduplicating costs a set and a dict lookup per roll, more than it saves
+        when the rolls are mostly distinct, so other batches are scored directly.
+
+        Args:
+            roll_strs (iterable): The rolled numbers as strings.
+
+        Returns:
+            list: (tiles, rule) for each roll, in input order.
+        """
+        roll_strs = list(roll_strs)
+        score = self.score
+        if len(roll_strs) >= DEDUP_MIN_BATCH:
+            distinct = set(roll_strs)
+            if len(distinct) <= DEDUP_MAX_DISTINCT_SHARE * len(roll_strs):
+                scored = {roll_str: score(roll_str) for roll_str in distinct}
+                return [scored[roll_str] for roll_str in roll_strs]
+        return [score(roll_str) for roll_str in roll_strs]
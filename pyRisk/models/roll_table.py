@@ -1,173 +1,184 @@
 # models/roll_table.py
 
 import random
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union
 import tkinter as tk
 from tkinter import messagebox
+from models.roll_rules import CompiledRollRules, CUSTOM_RULE_KINDS
+
+
+def _read_only_config(config: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    return MappingProxyType({length: MappingProxyType(rule) for length, rule in config.items()})
 
 
 class RollTable:
+    CONFIG_TYPES = ('add', 'multiply', 'replace')
+
     def __init__(self):
-<<<<<<< HEAD:pyRisk/roll_table.py
-        # Default values for numbers 0-9
-        self.number_values = {str(i): 1 for i in range(1, 10)}  # '1'-'9' ? 1 tile each
-        self.number_values['0'] = 0  # '0' ? 0 tiles
-=======
         """
         Initialize a RollTable instance with default configurations.
+
+        The configuration is compiled into a CompiledRollRules pipeline every
+        time it is assigned, through the setters or configure().
         """
-        # Default values for numbers 1-9
-        self.number_values: Dict[str, int] = {str(i): 1 for i in range(1, 10)}  # Default to 1 tile per number
-        
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
-        # Configurations for repeats and palindromes
-        self.repeats_config: Dict[str, Dict[str, Any]] = {
+        self._rules: Optional[CompiledRollRules] = None
+        # Default values for numbers 0-9
+        number_values = {str(i): 1 for i in range(1, 10)}  # '1'-'9' -> 1 tile each
+        number_values['0'] = 0  # '0' -> 0 tiles
+        self._number_values: Dict[str, int] = number_values
+
+        # Configurations for repeats and palindromes, keyed by length ('2', '3', ... any length)
+        self._repeats_config: Dict[str, Dict[str, Any]] = {
             '2': {'type': 'add', 'value': 0},  # Doubles
             '3': {'type': 'add', 'value': 0},  # Triples
-            # Add more repeats as needed
         }
-        self.palindromes_config: Dict[str, Dict[str, Any]] = {
+        self._palindromes_config: Dict[str, Dict[str, Any]] = {
             '2': {'type': 'add', 'value': 0},  # Palindromes of length 2
             '3': {'type': 'add', 'value': 0},  # Palindromes of length 3
-            # Add more palindrome lengths as needed
         }
-        self.default_tiles = 1  # Default tiles when no specific config is matched
+        # User-defined rules, e.g. {'kind': 'ends_with', 'pattern': '7', 'type': 'add', 'value': 2, 'priority': 5}
+        self._custom_rules: List[Dict[str, Any]] = []
+        self._default_tiles = 1  # Default tiles when no specific config is matched
+        self.recompile()
+
+    # The getters return read-only views, so the configuration can only change
+    # through the setters or configure(), which recompile the rule pipeline
+
+    @property
+    def number_values(self) -> Mapping[str, int]:
+        return MappingProxyType(self._number_values)
+
+    @number_values.setter
+    def number_values(self, value: Mapping[str, int]):
+        self.configure(number_values=value)
+
+    @property
+    def repeats_config(self) -> Mapping[str, Mapping[str, Any]]:
+        return _read_only_config(self._repeats_config)
+
+    @repeats_config.setter
+    def repeats_config(self, value: Mapping[str, Mapping[str, Any]]):
+        self.configure(repeats_config=value)
+
+    @property
+    def palindromes_config(self) -> Mapping[str, Mapping[str, Any]]:
+        return _read_only_config(self._palindromes_config)
+
+    @palindromes_config.setter
+    def palindromes_config(self, value: Mapping[str, Mapping[str, Any]]):
+        self.configure(palindromes_config=value)
+
+    @property
+    def custom_rules(self) -> Tuple[Mapping[str, Any], ...]:
+        return tuple(MappingProxyType(rule) for rule in self._custom_rules)
+
+    @custom_rules.setter
+    def custom_rules(self, value: Iterable[Mapping[str, Any]]):
+        self.configure(custom_rules=value)
+
+    @property
+    def default_tiles(self) -> int:
+        return self._default_tiles
+
+    @default_tiles.setter
+    def default_tiles(self, value: int):
+        self.configure(default_tiles=value)
+
+    def configure(self, number_values: Optional[Mapping[str, int]] = None,
+                  repeats_config: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                  palindromes_config: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                  custom_rules: Optional[Iterable[Mapping[str, Any]]] = None,
+                  default_tiles: Optional[int] = None) -> None:
+        """
+        Replace any part of the configuration and recompile the rule pipeline once.
 
-    def calculate_tiles(self, roll_value: int) -> int:
+        Values are copied, so later changes to the caller's dicts don't leak in.
+        Parts left as None keep their current value.
         """
-        Calculate the number of tiles based on the roll value.
+        if number_values is not None:
+            self._number_values = dict(number_values)
+        if repeats_config is not None:
+            self._repeats_config = {length: dict(rule) for length, rule in repeats_config.items()}
+        if palindromes_config is not None:
+            self._palindromes_config = {length: dict(rule) for length, rule in palindromes_config.items()}
+        if custom_rules is not None:
+            self._custom_rules = [dict(rule) for rule in custom_rules]
+        if default_tiles is not None:
+            self._default_tiles = default_tiles
+        self.recompile()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a JSON-ready copy of the configuration, as saved in .mprg files.
+        """
+        return {
+            "number_values": dict(self._number_values),
+            "repeats_config": {length: dict(rule) for length, rule in self._repeats_config.items()},
+            "palindromes_config": {length: dict(rule) for length, rule in self._palindromes_config.items()},
+            "custom_rules": [dict(rule) for rule in self._custom_rules],
+        }
 
-        Args:
-            roll_value (int): The rolled number.
+    @property
+    def rules(self) -> CompiledRollRules:
+        return self._rules
 
-        Returns:
-            int: Number of tiles allocated.
+    def recompile(self) -> None:
         """
-        roll_str = str(roll_value)
-        tiles = 0
-
-        # Check for repeats at the end first
-        repeat_length, repeat_value = self._get_longest_repeat(roll_str)
-        if repeat_length >= 2:
-            repeat_config = self.repeats_config.get(str(repeat_length))
-            if repeat_config:
-                base_tiles = self.number_values.get(repeat_value, 1) * repeat_length
-                tiles += self._apply_config(base_tiles, repeat_config)
-<<<<<<< HEAD:pyRisk/roll_table.py
-            else:
-                tiles += self.default_tiles  # Use default_tiles if no specific config
-            return tiles  # Return early if a repeat was processed
-=======
-            return tiles  # Return early if a repeat was found
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
-
-        # Check for palindromes at the end
-        palindrome_length = self._get_end_palindrome_length(roll_str)
-        if palindrome_length >= 2:
-            palindrome_config = self.palindromes_config.get(str(palindrome_length))
-            if palindrome_config:
-                base_tiles = self.number_values.get(roll_str[-1], 1) * palindrome_length
-                tiles += self._apply_config(base_tiles, palindrome_config)
-<<<<<<< HEAD:pyRisk/roll_table.py
-            else:
-                tiles += self.default_tiles  # Use default_tiles if no specific config
-            return tiles  # Return early if a palindrome was processed
-=======
-            return tiles  # Return early if a palindrome was found
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
-
-        # If no repeats or palindromes, just count the last digit
-        last_digit = roll_str[-1]
-        tiles += self.number_values.get(last_digit, self.default_tiles)  # Use default_tiles if digit not found
-
-        return tiles
-
-    def _get_longest_repeat(self, roll_str: str) -> (int, str):
+        Compile the current configuration into the rule pipeline used for scoring.
         """
-        Get the longest sequence of repeating digits at the end of the roll string.
+        self._rules = CompiledRollRules(self._number_values, self._repeats_config, self._palindromes_config,
+                                        self._default_tiles, self._custom_rules)
+
+    def calculate_tiles(self, roll_value: Union[int, str]) -> int:
+        """
+        Calculate the number of tiles based on the roll value.
 
         Args:
-            roll_str (str): The rolled number as a string.
+            roll_value (int or str): The rolled number. Strings keep any leading zeros.
 
         Returns:
-            tuple: (repeat_length, repeat_value)
+            int: Number of tiles allocated.
         """
-        if not roll_str:
-            return 0, ''
-
-        # Start from the end of the string
-        repeat_value = roll_str[-1]
-        repeat_length = 1
-
-        # Count backwards from the end
-        for i in range(len(roll_str) - 2, -1, -1):
-            if roll_str[i] == repeat_value:
-                repeat_length += 1
-            else:
-                break  # Stop as soon as a non-repeating digit is found
-
-<<<<<<< HEAD:pyRisk/roll_table.py
-=======
-        # If the repeat length is 1, no repeat was found
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
-        if repeat_length == 1:
-            return 0, ''
-        else:
-            return repeat_length, repeat_value
-
-    def _get_end_palindrome_length(self, roll_str: str) -> int:
+        return self._rules.score(str(roll_value))[0]
+
+    def score_roll(self, roll_value: Union[int, str]) -> Tuple[int, Optional[str]]:
         """
-        Determine the length of the palindrome at the end of the roll string.
+        Calculate the tiles for a roll and report which rule decided them.
 
         Args:
-            roll_str (str): The rolled number as a string.
+            roll_value (int or str): The rolled number. Strings keep any leading zeros.
 
         Returns:
-            int: Length of the palindrome, or 0 if none found.
+            tuple: (tiles, rule) where rule is e.g. 'repeat-3', 'palindrome-5' or a
+                custom rule's name, or None if only the last digit counted.
         """
-        for i in range(len(roll_str), 1, -1):
-            if self._is_palindrome(roll_str[-i:]):
-                return i
-        return 0
+        return self._rules.score(str(roll_value))
 
-    def _is_palindrome(self, s: str) -> bool:
+    def calculate_tiles_batch(self, roll_values: Iterable[Union[int, str]]) -> List[int]:
         """
-        Check if a string is a palindrome.
+        Calculate the number of tiles for many rolls at once.
 
         Args:
-            s (str): The string to check.
+            roll_values (iterable): The rolled numbers, as ints or digit strings.
 
         Returns:
-            bool: True if palindrome, False otherwise.
+            list: Number of tiles allocated to each roll, in input order.
         """
-        return s == s[::-1]
+        return [tiles for tiles, _ in self.score_batch(roll_values)]
 
-    def _apply_config(self, base_tiles: int, config: Dict[str, Any]) -> int:
+    def score_batch(self, roll_values: Iterable[Union[int, str]]) -> List[Tuple[int, Optional[str]]]:
         """
-        Apply the configuration to the base tile count.
+        Score many rolls at once, returning (tiles, rule) for each as in score_roll.
 
         Args:
-            base_tiles (int): The base number of tiles.
-            config (dict): Configuration dictionary with 'type' and 'value'.
+            roll_values (iterable): The rolled numbers, as ints or digit strings.
 
         Returns:
-            int: The adjusted number of tiles.
+            list: (tiles, rule) for each roll, in input order.
         """
-        config_type = config.get('type', 'add')
-        value = config.get('value', 0)
-        if config_type == 'add':
-            return base_tiles + value
-        elif config_type == 'multiply':
-            return base_tiles * value
-        elif config_type == 'replace':
-            return value
-        else:
-            return base_tiles  # Default to no change
-
-<<<<<<< HEAD:pyRisk/roll_table.py
-    def roll_number(self):
-        # Roll a random number (e.g., 1 to 99999)
-=======
+        return self._rules.score_batch(map(str, roll_values))
+
     def roll_number(self) -> int:
         """
         Simulate rolling a random number.
@@ -175,13 +186,15 @@ class RollTable:
         Returns:
             int: A random number between 1 and 99999.
         """
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
         return random.randint(1, 99999)
 
     def open_configuration_window(self, master: tk.Tk) -> None:
         """
         Open a GUI window to configure the roll table settings.
 
+        Repeat and palindrome rules can be added for any length of 2 or more,
+        alongside custom rules such as "ends in 7" or ascending runs.
+
         Args:
             master (tk.Tk): The parent Tkinter window.
         """
@@ -189,95 +202,127 @@ class RollTable:
         roll_window.title("Configure Roll Table")
 
         # Number values (0-9)
-        tk.Label(roll_window, text="Set values for numbers 0-9:").grid(row=0, column=0, columnspan=2, pady=(10, 0))
+        numbers_frame = tk.Frame(roll_window)
+        numbers_frame.grid(row=0, column=0, sticky='n', padx=10)
+        tk.Label(numbers_frame, text="Set values for numbers 0-9:").grid(row=0, column=0, columnspan=2, pady=(10, 0))
         number_vars = {}
         for i in range(0, 10):
-            tk.Label(roll_window, text=str(i)).grid(row=i+1, column=0, padx=10, pady=2)
-            var = tk.IntVar(value=self.number_values[str(i)])
+            tk.Label(numbers_frame, text=str(i)).grid(row=i+1, column=0, padx=10, pady=2)
+            var = tk.IntVar(value=self.number_values.get(str(i), self.default_tiles))
             number_vars[str(i)] = var
-            tk.Entry(roll_window, textvariable=var).grid(row=i+1, column=1, padx=10, pady=2)
-
-        # Repeats configuration
-        tk.Label(roll_window, text="Configure Repeats:").grid(row=11, column=0, columnspan=2, pady=(10, 0))
-        repeats = ['2', '3']  # '2' for doubles, '3' for triples
-        repeat_vars = {}
-        for idx, repeat in enumerate(repeats):
-            row = 12 + idx * 3
-            tk.Label(roll_window, text=f"{repeat}-digit Repeats").grid(row=row, column=0, columnspan=2, pady=(5, 0))
-
-            # Type option
-<<<<<<< HEAD:pyRisk/roll_table.py
-            tk.Label(roll_window, text="Type:").grid(row=row+1, column=0, padx=10, pady=2)
-            type_var = tk.StringVar(value=self.repeats_config.get(repeat, {'type': 'add'})['type'])
-            tk.OptionMenu(roll_window, type_var, 'add', 'multiply', 'replace').grid(row=row+1, column=1, padx=10, pady=2)
-
-            # Value
-            tk.Label(roll_window, text="Value:").grid(row=row+2, column=0, padx=10, pady=2)
-            value_var = tk.IntVar(value=self.repeats_config.get(repeat, {'value': 0})['value'])
-            tk.Entry(roll_window, textvariable=value_var).grid(row=row+2, column=1, padx=10, pady=2)
-=======
-            tk.Label(roll_window, text="Type:").grid(row=row + 1, column=0)
-            type_var = tk.StringVar(value=self.repeats_config.get(repeat, {'type': 'add'})['type'])
-            tk.OptionMenu(roll_window, type_var, 'add', 'multiply', 'replace').grid(row=row + 1, column=1)
-
-            # Value
-            tk.Label(roll_window, text="Value:").grid(row=row + 2, column=0)
-            value_var = tk.IntVar(value=self.repeats_config.get(repeat, {'value': 0})['value'])
-            tk.Entry(roll_window, textvariable=value_var).grid(row=row + 2, column=1)
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
-
-            repeat_vars[repeat] = {'type': type_var, 'value': value_var}
-
-        # Palindrome configuration
-        tk.Label(roll_window, text="Configure Palindromes:").grid(row=18, column=0, columnspan=2, pady=(10, 0))
-        palindrome_lengths = ['2', '3']
-        palindrome_vars = {}
-        for idx, length in enumerate(palindrome_lengths):
-            row = 19 + idx * 3
-            tk.Label(roll_window, text=f"Length {length} Palindromes").grid(row=row, column=0, columnspan=2, pady=(5, 0))
-
-            # Type option
-<<<<<<< HEAD:pyRisk/roll_table.py
-            tk.Label(roll_window, text="Type:").grid(row=row+1, column=0, padx=10, pady=2)
-            type_var = tk.StringVar(value=self.palindromes_config.get(length, {'type': 'add'})['type'])
-            tk.OptionMenu(roll_window, type_var, 'add', 'multiply', 'replace').grid(row=row+1, column=1, padx=10, pady=2)
-
-            # Value
-            tk.Label(roll_window, text="Value:").grid(row=row+2, column=0, padx=10, pady=2)
-            value_var = tk.IntVar(value=self.palindromes_config.get(length, {'value': 0})['value'])
-            tk.Entry(roll_window, textvariable=value_var).grid(row=row+2, column=1, padx=10, pady=2)
-=======
-            tk.Label(roll_window, text="Type:").grid(row=row + 1, column=0)
-            type_var = tk.StringVar(value=self.palindromes_config.get(length, {'type': 'add'})['type'])
-            tk.OptionMenu(roll_window, type_var, 'add', 'multiply', 'replace').grid(row=row + 1, column=1)
-
-            # Value
-            tk.Label(roll_window, text="Value:").grid(row=row + 2, column=0)
-            value_var = tk.IntVar(value=self.palindromes_config.get(length, {'value': 0})['value'])
-            tk.Entry(roll_window, textvariable=value_var).grid(row=row + 2, column=1)
->>>>>>> 093dc3ca3f58bf1f2f81fbb2eda8e86bdf91dba3:pyRisk/models/roll_table.py
-
-            palindrome_vars[length] = {'type': type_var, 'value': value_var}
+            tk.Entry(numbers_frame, textvariable=var).grid(row=i+1, column=1, padx=10, pady=2)
+
+        def build_rule_section(column: int, title: str, label_format: str, config: Dict[str, Dict[str, Any]]) -> dict:
+            section = tk.Frame(roll_window)
+            section.grid(row=0, column=column, sticky='n', padx=10)
+            tk.Label(section, text=title).grid(row=0, column=0, columnspan=3, pady=(10, 0))
+            rows_frame = tk.Frame(section)
+            rows_frame.grid(row=1, column=0, columnspan=3)
+            rule_vars: Dict[str, Dict[str, tk.Variable]] = {}
+
+            def add_rule_row(length: str, rule: Dict[str, Any]):
+                if length in rule_vars:
+                    return
+                row = len(rule_vars)
+                tk.Label(rows_frame, text=label_format.format(length)).grid(row=row, column=0, padx=5, pady=2, sticky='w')
+                type_var = tk.StringVar(value=rule.get('type', 'add'))
+                tk.OptionMenu(rows_frame, type_var, *self.CONFIG_TYPES).grid(row=row, column=1, padx=5, pady=2)
+                value_var = tk.IntVar(value=rule.get('value', 0))
+                tk.Entry(rows_frame, textvariable=value_var, width=8).grid(row=row, column=2, padx=5, pady=2)
+                rule_vars[length] = {'type': type_var, 'value': value_var}
+
+            for length in sorted(config, key=int):
+                add_rule_row(length, config[length])
+
+            # Add a rule for a new length
+            new_length_var = tk.StringVar()
+            tk.Entry(section, textvariable=new_length_var, width=6).grid(row=2, column=0, padx=5, pady=5)
+
+            def on_add_length():
+                length = new_length_var.get().strip()
+                if not length.isdigit() or int(length) < 2:
+                    messagebox.showerror("Invalid Length", "Length must be a whole number of 2 or more.", parent=roll_window)
+                    return
+                add_rule_row(str(int(length)), {'type': 'add', 'value': 0})
+                new_length_var.set("")
+
+            tk.Button(section, text="Add Length", command=on_add_length).grid(row=2, column=1, columnspan=2, pady=5)
+            return rule_vars
+
+        repeat_vars = build_rule_section(1, "Configure Repeats:", "{}-digit Repeats", self.repeats_config)
+        palindrome_vars = build_rule_section(2, "Configure Palindromes:", "Length {} Palindromes", self.palindromes_config)
+
+        # Custom rules
+        custom_section = tk.Frame(roll_window)
+        custom_section.grid(row=0, column=3, sticky='n', padx=10)
+        tk.Label(custom_section, text="Custom Rules (lower priority first;\nrepeats are 10, palindromes 20):").grid(
+            row=0, column=0, columnspan=6, pady=(10, 0))
+        for column, heading in enumerate(("Kind", "Pattern / Min", "Type", "Value", "Priority", "")):
+            tk.Label(custom_section, text=heading).grid(row=1, column=column, padx=3)
+        custom_rows_frame = tk.Frame(custom_section)
+        custom_rows_frame.grid(row=2, column=0, columnspan=6)
+        custom_vars: List[Dict[str, tk.Variable]] = []
+
+        def add_custom_row(rule: Dict[str, Any]):
+            row = len(custom_vars)
+            rule_vars = {
+                'kind': tk.StringVar(value=rule.get('kind', CUSTOM_RULE_KINDS[0])),
+                'argument': tk.StringVar(value=str(rule.get('pattern', rule.get('min_length', '')))),
+                'type': tk.StringVar(value=rule.get('type', 'add')),
+                'value': tk.IntVar(value=rule.get('value', 0)),
+                'priority': tk.IntVar(value=rule.get('priority', 0)),
+                'enabled': tk.BooleanVar(value=True),
+            }
+            tk.OptionMenu(custom_rows_frame, rule_vars['kind'], *CUSTOM_RULE_KINDS).grid(row=row, column=0, padx=3)
+            tk.Entry(custom_rows_frame, textvariable=rule_vars['argument'], width=8).grid(row=row, column=1, padx=3)
+            tk.OptionMenu(custom_rows_frame, rule_vars['type'], *self.CONFIG_TYPES).grid(row=row, column=2, padx=3)
+            tk.Entry(custom_rows_frame, textvariable=rule_vars['value'], width=6).grid(row=row, column=3, padx=3)
+            tk.Entry(custom_rows_frame, textvariable=rule_vars['priority'], width=6).grid(row=row, column=4, padx=3)
+            tk.Checkbutton(custom_rows_frame, text="On", variable=rule_vars['enabled']).grid(row=row, column=5, padx=3)
+            custom_vars.append(rule_vars)
+
+        for rule in self.custom_rules:
+            add_custom_row(rule)
+        tk.Button(custom_section, text="Add Rule", command=lambda: add_custom_row({})).grid(
+            row=3, column=0, columnspan=6, pady=5)
 
         def save_roll_table():
-            # Save number values
-            for num_str, var in number_vars.items():
-                self.number_values[num_str] = var.get()
-
-            # Save repeats configuration
-            for repeat, vars_dict in repeat_vars.items():
-                config_type = vars_dict['type'].get()
-                value = vars_dict['value'].get()
-                self.repeats_config[repeat] = {'type': config_type, 'value': value}
-
-            # Save palindromes configuration
-            for length, vars_dict in palindrome_vars.items():
-                config_type = vars_dict['type'].get()
-                value = vars_dict['value'].get()
-                self.palindromes_config[length] = {'type': config_type, 'value': value}
+            try:
+                # Save number values
+                number_values = {num_str: var.get() for num_str, var in number_vars.items()}
+                repeats_config = {length: {'type': vars_dict['type'].get(), 'value': vars_dict['value'].get()}
+                                  for length, vars_dict in repeat_vars.items()}
+                palindromes_config = {length: {'type': vars_dict['type'].get(), 'value': vars_dict['value'].get()}
+                                      for length, vars_dict in palindrome_vars.items()}
+                custom_rules = []
+                for rule_vars in custom_vars:
+                    if not rule_vars['enabled'].get():
+                        continue
+                    kind = rule_vars['kind'].get()
+                    argument = rule_vars['argument'].get().strip()
+                    if not argument.isdigit():
+                        messagebox.showerror("Invalid Rule", "Custom rule patterns and minimum lengths must be digits.",
+                                             parent=roll_window)
+                        return
+                    rule = {'kind': kind, 'type': rule_vars['type'].get(), 'value': rule_vars['value'].get(),
+                            'priority': rule_vars['priority'].get()}
+                    if kind == 'ends_with':
+                        rule['pattern'] = argument
+                    else:
+                        rule['min_length'] = int(argument)
+                    custom_rules.append(rule)
+            except tk.TclError:
+                messagebox.showerror("Invalid Value", "All values must be whole numbers.", parent=roll_window)
+                return
+            self.configure(number_values={**self.number_values, **number_values},
+                           repeats_config={**self.repeats_config, **repeats_config},
+                           palindromes_config={**self.palindromes_config, **palindromes_config},
+                           custom_rules=custom_rules)
 
             messagebox.showinfo("Roll Table Saved", "Roll table configurations have been saved.")
             roll_window.destroy()
 
-        tk.Button(roll_window, text="Save", command=save_roll_table).grid(row=25, column=0, pady=10)
-        tk.Button(roll_window, text="Cancel", command=roll_window.destroy).grid(row=25, column=1, pady=10)
+        buttons_frame = tk.Frame(roll_window)
+        buttons_frame.grid(row=1, column=0, columnspan=4, pady=10)
+        tk.Button(buttons_frame, text="Save", command=save_roll_table).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons_frame, text="Cancel", command=roll_window.destroy).pack(side=tk.LEFT, padx=5)
@@ -0,0 +1,101 @@
+# models/territory_stats.py
+
+import numpy as np
+from collections import Counter
+from typing import Callable, List, Set
+from models.ownership import OwnershipDelta, OwnershipStore
+from models.region_map import RegionMap
+
+
+class TerritoryStats:
+    def __init__(self, region_map: RegionMap, ownership: OwnershipStore):
+        """
+        Initialize TerritoryStats and subscribe it to ownership changes.
+
+        Keeps each player's region count, pixel area and the number of regions
+        placed this turn, updated from every OwnershipDelta in time proportional
+        to the number of changed regions. A region counts as placed when its
+        owner differs from its owner at the start of the turn, so erasing or
+        undoing a placement gives the tile back.
+
+        Args:
+            region_map (RegionMap): Region areas.
+            ownership (OwnershipStore): The ownership store to follow.
+        """
+        self.region_map = region_map
+        self.ownership = ownership
+        self.regions: Counter = Counter()
+        self.area: Counter = Counter()
+        self.placed: Counter = Counter()
+        self._turn_start_owners = ownership.snapshot()
+        self._listeners: List[Callable[[Set[int]], None]] = []
+
+        owners = ownership.owners
+        owned = owners.nonzero()[0]
+        if len(owned):
+            self.on_ownership_changed(OwnershipDelta(owned, np.zeros_like(owners[owned]), owners[owned]))
+        ownership.subscribe(self.on_ownership_changed)
+
+    def subscribe(self, listener: Callable[[Set[int]], None]) -> None:
+        """
+        Register a callback that receives the ids of players whose statistics changed.
+        """
+        self._listeners.append(listener)
+
+    def detach(self):
+        self.ownership.unsubscribe(self.on_ownership_changed)
+        self._listeners.clear()
+
+    def start_turn(self):
+        """
+        Make the current ownership the baseline for counting placed tiles.
+        """
+        self._turn_start_owners = self.ownership.snapshot()
+        changed = {player_id for player_id, count in self.placed.items() if count}
+        self.placed.clear()
+        self._notify(changed)
+
+    def on_ownership_changed(self, delta: OwnershipDelta):
+        """
+        Update the statistics for the regions in a delta.
+
+        Args:
+            delta (OwnershipDelta): The regions that changed owner.
+        """
+        areas = self.region_map.areas
+        start_owners = self._turn_start_owners
+        changed = set()
+        for region, old, new in zip(delta.regions.tolist(), delta.old_owners.tolist(), delta.new_owners.tolist()):
+            area = int(areas[region])
+            start = start_owners[region]
+            if old:
+                self.regions[old] -= 1
+                self.area[old] -= area
+                if old != start:
+                    self.placed[old] -= 1
+                changed.add(old)
+            if new:
+                self.regions[new] += 1
+                self.area[new] += area
+                if new != start:
+                    self.placed[new] += 1
+                changed.add(new)
+        self._notify(changed)
+
+    def _notify(self, player_ids: Set[int]):
+        if player_ids:
+            for listener in list(self._listeners):
+                listener(player_ids)
+
+    def remaining_tiles(self, player_id: int, tiles_rolled: int) -> int:
+        """
+        Get how many of a player's rolled tiles are still to be placed this turn.
+
+        Args:
+            player_id (int): The player's registry id.
+            tiles_rolled (int): Tiles the player rolled this turn.
+
+        Returns:
+            int: Tiles rolled minus regions placed this turn.
+        """
+        return tiles_rolled - self.placed[player_id]
@@ -0,0 +1,135 @@
+# models/turn_report.py
+
+import csv
+import numpy as np
+from bisect import bisect_left, insort
+from typing import Callable, Dict, List, TextIO, Tuple
+
+REPORT_COLUMNS = ('turn', 'player', 'regions', 'area', 'gained', 'lost')
+
+
+class TurnSummary:
+    def __init__(self, regions: np.ndarray, area: np.ndarray):
+        """
+        Initialize a TurnSummary with one entry per player id (index 0 = unowned).
+
+        Args:
+            regions (np.ndarray): Regions owned per player id.
+            area (np.ndarray): Pixel area owned per player id.
+        """
+        self.regions = regions
+        self.area = area
+        self.gained = np.zeros(0, dtype=np.int64)
+        self.lost = np.zeros(0, dtype=np.int64)
+
+
+class TurnReport:
+    def __init__(self, areas: np.ndarray):
+        """
+        Initialize an empty per-turn territory timeseries.
+
+        Each recorded turn keeps its owner raster (one player id per region)
+        and a cached TurnSummary of per-player regions and area, plus the
+        regions gained and lost since the previous recorded turn. Recording a
+        turn only computes that turn and refreshes its successor's diff, so
+        appending a turn costs O(regions) whatever the length of the game.
+
+        Args:
+            areas (np.ndarray): Pixel area of each region (RegionMap.areas).
+        """
+        self.areas = areas
+        self.turns: List[int] = []
+        self._owners: Dict[int, np.ndarray] = {}
+        self._summaries: Dict[int, TurnSummary] = {}
+
+    def __contains__(self, turn: int) -> bool:
+        return turn in self._owners
+
+    def record_turn(self, turn: int, owners: np.ndarray) -> TurnSummary:
+        """
+        Record (or replace) the ownership of the map at a turn.
+
+        Args:
+            turn (int): The turn number.
+            owners (np.ndarray): Player id per region, 0 for unowned.
+
+        Returns:
+            TurnSummary: The summary of the recorded turn.
+        """
+        owners = np.array(owners, dtype=np.int32)
+        size = int(owners.max(initial=0)) + 1
+        summary = TurnSummary(np.bincount(owners, minlength=size),
+                              np.bincount(owners, weights=self.areas, minlength=size).astype(np.int64))
+        if turn not in self._owners:
+            insort(self.turns, turn)
+        self._owners[turn] = owners
+        self._summaries[turn] = summary
+
+        index = bisect_left(self.turns, turn)
+        self._diff(index)
+        if index + 1 < len(self.turns):
+            self._diff(index + 1)
+        return summary
+
+    def _diff(self, index: int):
+        summary = self._summaries[self.turns[index]]
+        if index == 0:
+            summary.gained = summary.regions.copy()
+            summary.gained[0] = 0
+            summary.lost = np.zeros_like(summary.gained)
+            return
+        previous = self._owners[self.turns[index - 1]]
+        current = self._owners[self.turns[index]]
+        changed = previous != current
+        summary.gained = np.bincount(current[changed], minlength=1)
+        summary.lost = np.bincount(previous[changed], minlength=1)
+
+    def summary(self, turn: int) -> TurnSummary:
+        return self._summaries[turn]
+
+    def rows(self, player_name: Callable[[int], str]) -> List[Tuple[int, str, int, int, int, int]]:
+        """
+        Build the report rows: one per turn and player that owned, gained or lost anything.
+
+        Args:
+            player_name (Callable): Maps a player id to the name shown in the report.
+
+        Returns:
+            list: (turn, player, regions, area, gained, lost) tuples in turn order.
+        """
+        rows = []
+        for turn in self.turns:
+            summary = self._summaries[turn]
+            size = max(len(summary.regions), len(summary.gained), len(summary.lost))
+            columns = [np.pad(column, (0, size - len(column)))
+                       for column in (summary.regions, summary.area, summary.gained, summary.lost)]
+            active = np.flatnonzero(np.any(np.stack(columns), axis=0))
+            for player_id in active[active > 0].tolist():
+                rows.append((turn, player_name(player_id)) + tuple(int(column[player_id]) for column in columns))
+        return rows
+
+    def format_table(self, player_name: Callable[[int], str]) -> str:
+        """
+        Render the report as a fixed-width text table.
+        """
+        rows = [tuple(str(value) for value in row) for row in self.rows(player_name)]
+        widths = [max([len(column)] + [len(row[index]) for row in rows]) for index, column in enumerate(REPORT_COLUMNS)]
+        # Turn and player left-aligned, figures right-aligned
+        def align(values):
+            return '  '.join(value.ljust(width) if index < 2 else value.rjust(width)
+                             for index, (value, width) in enumerate(zip(values, widths)))
+        lines = [align(REPORT_COLUMNS), '  '.join('-' * width for width in widths)]
+        lines.extend(align(row) for row in rows)
+        return '\n'.join(lines)
+
+    def write_csv(self, file: TextIO, player_name: Callable[[int], str]) -> None:
+        """
+        Write the report as CSV with a header row.
+
+        Args:
+            file (TextIO): An open text file (opened with newline='').
+            player_name (Callable): Maps a player id to the name shown in the report.
+        """
+        writer = csv.writer(file)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(self.rows(player_name))
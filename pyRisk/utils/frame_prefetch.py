@@ -0,0 +1,125 @@
+# utils/frame_prefetch.py
+
+import queue
+import threading
+from collections import OrderedDict
+from PIL import Image
+from typing import List, Optional, Sequence, Tuple
+
+PREVIEW_CAPACITY = 48  # Downscaled frames kept in memory
+FULL_CAPACITY = 3  # Full resolution frames kept in memory
+PREFETCH_RADIUS = 4  # Turns either side of the current one decoded ahead of time
+
+FrameKey = Tuple[int, bool]  # (frame index, full resolution)
+
+
+class FramePrefetcher:
+    def __init__(self, paths: Sequence[str], preview_size: Tuple[int, int],
+                 preview_capacity: int = PREVIEW_CAPACITY, full_capacity: int = FULL_CAPACITY,
+                 radius: int = PREFETCH_RADIUS):
+        """
+        Initialize a FramePrefetcher that decodes map frames on a background thread.
+
+        Every request replaces the list of wanted frames, nearest first, so
+        when the user scrubs quickly the worker skips turns that have already
+        been scrolled past. Decoded frames are kept in two LRU caches, one
+        for previews shrunk to fit ``preview_size`` and a smaller one for
+        full resolution frames. Keys of newly decoded frames are put on
+        ``ready`` so the Tk thread can pick them up by polling; the worker
+        never touches Tk.
+
+        Args:
+            paths (sequence): Image path per frame, in turn order.
+            preview_size (tuple): (width, height) box previews are shrunk to fit.
+            preview_capacity (int): Most previews kept in memory.
+            full_capacity (int): Most full resolution frames kept in memory.
+            radius (int): Frames either side of the requested one to prefetch.
+        """
+        self.paths = list(paths)
+        self.preview_size = preview_size
+        self.capacities = {False: preview_capacity, True: full_capacity}
+        self.radius = radius
+        self.ready: "queue.Queue[FrameKey]" = queue.Queue()
+        self._frames = {False: OrderedDict(), True: OrderedDict()}
+        self._wanted: List[FrameKey] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="frame-prefetch", daemon=True)
+        self._worker.start()
+
+    def get(self, index: int, full: bool = False) -> Optional[Image.Image]:
+        """
+        Get a frame if it is decoded, and queue it and its neighbours otherwise.
+
+        Args:
+            index (int): Frame index.
+            full (bool): Whether the full resolution frame is wanted rather than the preview.
+
+        Returns:
+            Image.Image, optional: The frame, or None until it has been decoded.
+        """
+        wanted: List[FrameKey] = [(index, full)] if full else []
+        wanted.append((index, False))
+        for offset in range(1, self.radius + 1):
+            wanted += [(index + offset, False), (index - offset, False)]
+        with self._condition:
+            self._wanted = [(i, f) for i, f in wanted if 0 <= i < len(self.paths)]
+            frame = self._frames[full].get(index)
+            if frame is not None:
+                self._frames[full].move_to_end(index)
+            self._condition.notify()
+        return frame
+
+    def peek(self, index: int, full: bool = False) -> Optional[Image.Image]:
+        """
+        Get a frame if it is decoded, without changing what the worker decodes next.
+        """
+        with self._condition:
+            return self._frames[full].get(index)
+
+    def close(self) -> None:
+        """
+        Stop the worker thread once it finishes the frame it is decoding.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _next_wanted(self) -> Optional[FrameKey]:
+        while self._wanted:
+            index, full = self._wanted.pop(0)
+            if index not in self._frames[full]:
+                return index, full
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                key = self._next_wanted()
+                while key is None and not self._closed:
+                    self._condition.wait()
+                    key = self._next_wanted()
+                if self._closed:
+                    return
+            index, full = key
+            try:
+                frame = self.decode(self.paths[index], full)
+            except OSError:
+                continue  # A missing snapshot just stays blank
+            with self._condition:
+                frames = self._frames[full]
+                frames[index] = frame
+                while len(frames) > self.capacities[full]:
+                    frames.popitem(last=False)
+            self.ready.put(key)
+
+    def decode(self, path: str, full: bool) -> Image.Image:
+        """
+        Load one frame, shrinking it to the preview size unless the full frame is wanted.
+        """
+        with Image.open(path) as image:
+            if not full:
+                # Let the decoder skip detail where the format supports it (e.g. JPEG)
+                image.draft("RGB", self.preview_size)
+                image.thumbnail(self.preview_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            return image.convert("RGB")
@@ -0,0 +1,174 @@
+# utils/latency.py
+
+import json
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+BUCKETS_PER_DECADE = 20  # Bucket bounds grow by about 12%, which bounds the quantile error
+MIN_SECONDS = 1e-6
+DECADES = 9  # 1 us to 1000 s
+_NO_PHASE = nullcontext()
+
+
+class LatencyHistogram:
+    def __init__(self):
+        """
+        Initialize an empty LatencyHistogram with logarithmic buckets.
+
+        Memory is fixed however many samples are added; quantiles are read
+        off the bucket bounds, while count, total and max are exact.
+        """
+        self.counts = [0] * (BUCKETS_PER_DECADE * DECADES + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = 0
+        if seconds > MIN_SECONDS:
+            index = min(int(math.log10(seconds / MIN_SECONDS) * BUCKETS_PER_DECADE) + 1, len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @staticmethod
+    def upper_bound(index: int) -> float:
+        return MIN_SECONDS * 10 ** (index / BUCKETS_PER_DECADE)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket holding it, capped at the exact max.
+
+        Args:
+            q (float): Quantile between 0 and 1, e.g. 0.95.
+
+        Returns:
+            float: Seconds, or 0 with no samples.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets": [[self.upper_bound(index), count] for index, count in enumerate(self.counts) if count],
+        }
+
+
+class LatencyRecorder:
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize a LatencyRecorder that keeps a histogram of wall time per action and phase.
+
+        Actions are the names passed to the controller's handle_*_actions
+        methods. Phases are timed inside an action and recorded as
+        "action/phase", e.g. "canvas_click/overlay". While disabled, tracked
+        callbacks check one flag before calling straight through and
+        ``phase`` returns a shared no-op context manager.
+
+        Args:
+            enabled (bool): Whether to start recording straight away.
+        """
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._actions: List[str] = []
+
+    def record(self, name: str, seconds: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.add(seconds)
+
+    def track(self, handler: Callable) -> Callable:
+        """
+        Wrap a handle_*_actions callback so each call is timed under its action name.
+
+        The wrapper checks ``enabled`` on every call, so recording can be
+        switched on and off without rebuilding the views.
+
+        Args:
+            handler (Callable): Callback taking the action name first.
+
+        Returns:
+            Callable: The timed callback.
+        """
+        def timed(action: str, *args, **kwargs):
+            if not self.enabled:
+                return handler(action, *args, **kwargs)
+            self._actions.append(action)
+            start = time.perf_counter()
+            try:
+                return handler(action, *args, **kwargs)
+            finally:
+                self.record(action, time.perf_counter() - start)
+                self._actions.pop()
+        return timed
+
+    def phase(self, name: str):
+        """
+        Time a block as a phase of the current action, e.g. ``with latency.phase("fill"):``.
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        return self._timed_phase(name)
+
+    @contextmanager
+    def _timed_phase(self, name: str):
+        key = f"{self._actions[-1]}/{name}" if self._actions else name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(key, time.perf_counter() - start)
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        """
+        Record a phase that was timed elsewhere, e.g. the map preprocessing stages.
+        """
+        if self.enabled:
+            self.record(f"{self._actions[-1]}/{name}" if self._actions else name, seconds)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def format_table(self) -> str:
+        """
+        Render count, p50, p95 and max per action and phase as a text table, in milliseconds.
+        """
+        lines = [f"{'Action / phase':<44}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f"{name:<44}{histogram.count:>8}{histogram.quantile(0.5) * 1000:>10.2f}"
+                         f"{histogram.quantile(0.95) * 1000:>10.2f}{histogram.max * 1000:>10.2f}")
+        return "\n".join(lines)
+
+    def write_json(self, file_path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Export every histogram with its summary figures, in seconds.
+
+        Args:
+            file_path (str): JSON file to write.
+            extra (dict, optional): More top-level fields, e.g. the last import's stage timings.
+        """
+        data = {"created": datetime.now(timezone.utc).isoformat(timespec="seconds"), "unit": "s",
+                "actions": self.summary(), **(extra or {})}
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
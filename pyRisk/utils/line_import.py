@@ -0,0 +1,65 @@
+# utils/line_import.py
+
+import csv
+from typing import Iterable, Iterator, List, Tuple
+
+DELIMITERS = ',\t;'
+
+
+class LineImportResult:
+    def __init__(self):
+        """
+        Initialize an empty LineImportResult, the outcome of validating a delimited text import.
+
+        Subclasses add the list of accepted entries.
+
+        Attributes:
+            errors (list): (line_number, message) pairs for rejected lines.
+        """
+        self.errors: List[Tuple[int, str]] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def error_report(self) -> str:
+        """
+        Format the per-line errors for display.
+
+        Returns:
+            str: One line per error, e.g. "Line 4: Unknown player 'Bob'."
+        """
+        return "\n".join(f"Line {line_no}: {message}" for line_no, message in self.errors)
+
+
+def sniff_delimiter(line: str) -> str:
+    """
+    Pick the delimiter of an import from its first non-empty line.
+
+    Args:
+        line (str): The first non-empty line of the input.
+
+    Returns:
+        str: The first of ',', tab or ';' found in the line, defaulting to ','.
+    """
+    for delimiter in DELIMITERS:
+        if delimiter in line:
+            return delimiter
+    return ','
+
+
+def non_empty_lines(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (line_number, stripped line) for every line that isn't blank or a ``#`` comment.
+    """
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line_no, line
+
+
+def split_fields(line: str, delimiter: str) -> List[str]:
+    """
+    Split one line on the delimiter, honouring CSV quoting, and strip each field.
+    """
+    return [field.strip() for field in next(csv.reader([line], delimiter=delimiter))]
@@ -0,0 +1,111 @@
+# utils/map_cache.py
+
+import hashlib
+import os
+import tempfile
+import numpy as np
+from typing import Dict, Optional
+
+CACHE_DIR = "map_cache"
+CACHE_FORMAT = 2  # Bump when the stored arrays change so old entries are no longer matched
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+ENTRY_SUFFIX = ".npz"
+HASH_CHUNK = 1024 * 1024
+
+
+class MapCache:
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        """
+        Initialize a MapCache of preprocessed map artefacts on disk.
+
+        Each entry is one uncompressed ``.npz`` file of named arrays, keyed by
+        a hash of the source image file and the parameters used to process
+        it. Entries are written to a temporary file and renamed into place,
+        so readers never see a partial entry. Reading an entry refreshes its
+        modification time, and the least recently used entries are deleted
+        once the directory grows past ``max_bytes``.
+
+        Args:
+            directory (str): Directory holding the cache entries.
+            max_bytes (int): Size the cache is trimmed back to after each write.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(source_path: str, params: str) -> str:
+        """
+        Hash a source image file's bytes together with the processing parameters.
+
+        Args:
+            source_path (str): Path of the source image.
+            params (str): Description of the processing parameters.
+
+        Returns:
+            str: Hex digest identifying the cache entry.
+        """
+        digest = hashlib.sha256(f"{CACHE_FORMAT}:{params}".encode())
+        with open(source_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Load a cache entry and mark it as recently used.
+
+        Args:
+            key (str): Entry key from MapCache.key.
+
+        Returns:
+            dict, optional: The entry's arrays, or None on a miss or unreadable entry.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return arrays
+
+    def put(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Store a cache entry atomically and trim the cache to its size limit.
+
+        Args:
+            key (str): Entry key from MapCache.key.
+            arrays (dict): Named arrays to store.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used entries until the cache fits its size limit.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(ENTRY_SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
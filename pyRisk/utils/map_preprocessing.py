@@ -0,0 +1,192 @@
+# utils/map_preprocessing.py
+
+import time
+import numpy as np
+from PIL import Image
+from typing import List, Tuple
+from utils.ownership_reconstruction import nearest_palette_index
+from utils.segmentation import BORDER_LUMINANCE, image_to_color_ids, label_regions, luminance
+
+EXACT_PALETTE_COLORS = 256  # Maps with no more colours than this are kept exactly, without quantisation
+PALETTE_TOLERANCE = 24  # Colours closer than this to a more common colour are snapped to it
+MIN_PALETTE_SHARE = 1e-5  # Share of the map a colour needs to cover to join the palette
+MIN_ISLAND_AREA = 16  # Regions smaller than this are merged into their neighbours
+MERGE_PASSES = 3
+BORDER_COLOR = np.array([0, 0, 0, 255], dtype=np.uint8).view(np.uint32)[0]
+OPAQUE_ALPHA = np.array([0, 0, 0, 255], dtype=np.uint8).view(np.uint32)[0]
+# Every setting that changes the cleaned map; the map cache keys its entries on all of them
+PREPROCESS_PARAMS = {
+    "exact_colors": EXACT_PALETTE_COLORS,
+    "tolerance": PALETTE_TOLERANCE,
+    "min_share": MIN_PALETTE_SHARE,
+    "border_luminance": BORDER_LUMINANCE,
+    "min_island_area": MIN_ISLAND_AREA,
+    "merge_passes": MERGE_PASSES,
+}
+
+
+class PreprocessResult:
+    def __init__(self, image: Image.Image, labels: np.ndarray, timings: List[Tuple[str, float]]):
+        """
+        Initialize a PreprocessResult.
+
+        Args:
+            image (Image.Image): The cleaned RGBA base map.
+            labels (np.ndarray): Region labels of the cleaned map, from label_regions.
+            timings (list): (stage name, seconds) per pipeline stage, in order.
+        """
+        self.image = image
+        self.labels = labels
+        self.timings = timings
+
+
+def quantise_colors(color_ids: np.ndarray, exact_colors: int = EXACT_PALETTE_COLORS,
+                    tolerance: float = PALETTE_TOLERANCE, min_share: float = MIN_PALETTE_SHARE) -> np.ndarray:
+    """
+    Snap every pixel to a palette of the map's dominant colours.
+
+    Maps drawn with few colours are already clean and keep every colour, so
+    territories a shade apart stay apart. Otherwise the palette is built from
+    the colours covering at least ``min_share`` of the map, most common first,
+    skipping any within ``tolerance`` of a colour already chosen, so JPEG
+    noise and anti-aliased edges fold into the colour they surround. Its size
+    follows from the map rather than a fixed cap. Each distinct colour is then
+    mapped to its nearest palette entry once. Alpha is made opaque.
+
+    Args:
+        color_ids (np.ndarray): Packed RGBA colours from image_to_color_ids.
+        exact_colors (int): Most distinct colours a map can have and be kept as is.
+        tolerance (float): RGB distance under which colours count as the same.
+        min_share (float): Share of the pixels a colour needs to join the palette.
+
+    Returns:
+        np.ndarray: Packed colours of the quantised map, same shape as the input.
+    """
+    unique_colors, inverse, counts = np.unique(color_ids.ravel(), return_inverse=True, return_counts=True)
+    if len(unique_colors) <= exact_colors:
+        return color_ids | OPAQUE_ALPHA
+    rgb = unique_colors.view(np.uint8).reshape(-1, 4)[:, :3].astype(np.int32)
+    min_count = max(1, int(min_share * color_ids.size))
+    palette: List[np.ndarray] = []
+    for index in np.argsort(-counts, kind='stable'):
+        if counts[index] < min_count:
+            break
+        if not palette or np.min(np.sum((np.array(palette) - rgb[index]) ** 2, axis=1)) > tolerance * tolerance:
+            palette.append(rgb[index])
+    palette_rgb = np.array(palette, dtype=np.int32).reshape(-1, 3)
+    packed = np.zeros((len(palette_rgb), 4), dtype=np.uint8)
+    packed[:, :3] = palette_rgb
+    packed[:, 3] = 255
+    nearest = nearest_palette_index(rgb, palette_rgb, tolerance=np.inf)
+    return packed.view(np.uint32).ravel()[nearest][inverse].reshape(color_ids.shape)
+
+
+def classify_borders(color_ids: np.ndarray, border_luminance: int = BORDER_LUMINANCE) -> np.ndarray:
+    """
+    Turn every dark pixel into pure black so border lines form one colour.
+
+    Args:
+        color_ids (np.ndarray): Packed colours of the map.
+        border_luminance (int): Pixels darker than this are border lines.
+
+    Returns:
+        np.ndarray: Packed colours with border pixels set to black.
+    """
+    return np.where(luminance(color_ids) < border_luminance, BORDER_COLOR, color_ids)
+
+
+def merge_islands(color_ids: np.ndarray, min_area: int = MIN_ISLAND_AREA,
+                  passes: int = MERGE_PASSES) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recolour small non-border regions with their most common neighbouring colour.
+
+    Border lines are never merged: their diagonal steps form tiny regions
+    that must stay to keep territories apart. Islands with no larger
+    neighbour outside the border lines become part of the border. The pixels are scanned once to
+    build the region adjacency with contact counts; the merge passes then
+    work on that graph, so islands surrounded only by other islands are
+    resolved in later passes without rescanning the image.
+
+    Args:
+        color_ids (np.ndarray): Packed colours with borders already classified.
+        min_area (int): Regions smaller than this are merged.
+        passes (int): Most merge rounds to run.
+
+    Returns:
+        tuple: (color_ids, labels) of the merged map.
+    """
+    labels, region_count = label_regions(color_ids)
+    colors = np.zeros(region_count, dtype=np.uint32)
+    colors[labels.ravel()] = color_ids.ravel()
+    areas = np.bincount(labels.ravel(), minlength=region_count)
+    is_border = colors == BORDER_COLOR
+
+    # Every pair of touching regions, in both directions, with its contact length
+    keys = []
+    for a, b in ((labels[:, :-1], labels[:, 1:]), (labels[:-1], labels[1:])):
+        touching = (a != b) & ~is_border[a] & ~is_border[b]
+        a, b = a[touching].astype(np.int64), b[touching].astype(np.int64)
+        keys += [a * region_count + b, b * region_count + a]
+    keys, contacts = np.unique(np.concatenate(keys), return_counts=True)
+    sources, targets = keys // region_count, keys % region_count
+
+    root = np.arange(region_count)
+    for _ in range(passes):
+        merged_areas = np.bincount(root, weights=areas, minlength=region_count)
+        source_roots, target_roots = root[sources], root[targets]
+        small = (merged_areas < min_area) & ~is_border
+        usable = small[source_roots] & ~small[target_roots] & (source_roots != target_roots)
+        if not usable.any():
+            break
+        # Per island, the neighbour it shares the longest contact with
+        pair_keys, inverse = np.unique(source_roots[usable] * region_count + target_roots[usable], return_inverse=True)
+        pair_contacts = np.bincount(inverse, weights=contacts[usable])
+        islands = pair_keys // region_count
+        order = np.lexsort((-pair_contacts, islands))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = islands[order][1:] != islands[order][:-1]
+        best = order[first]
+        root[islands[best]] = pair_keys[best] % region_count
+        root = root[root]
+
+    # Islands walled in by border lines (e.g. the holes in map lettering) join the border
+    merged_colors = colors[root]
+    merged_areas = np.bincount(root, weights=areas, minlength=region_count)
+    merged_colors[(merged_areas[root] < min_area) & ~is_border[root]] = BORDER_COLOR
+    color_ids = merged_colors[labels]
+    labels, _ = label_regions(color_ids)
+    return color_ids, labels
+
+
+def preprocess_map(image: Image.Image, exact_colors: int = EXACT_PALETTE_COLORS,
+                   border_luminance: int = BORDER_LUMINANCE, min_island_area: int = MIN_ISLAND_AREA) -> PreprocessResult:
+    """
+    Clean an imported map so every territory is one flat colour.
+
+    Runs quantisation, border classification and island merging in turn,
+    timing each stage, and returns the cleaned image with its region labels.
+
+    Args:
+        image (Image.Image): The map as imported (any mode, e.g. a JPEG).
+        exact_colors (int): Maps with no more colours than this skip quantisation.
+        border_luminance (int): Pixels darker than this become border lines.
+        min_island_area (int): Regions smaller than this are merged into their neighbours.
+
+    Returns:
+        PreprocessResult: The clean base image, its labels and the stage timings.
+    """
+    timings: List[Tuple[str, float]] = []
+
+    def timed(stage: str, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        timings.append((stage, time.perf_counter() - start))
+        return result
+
+    color_ids = timed("decode", image_to_color_ids, image)
+    color_ids = timed("quantise", quantise_colors, color_ids, exact_colors)
+    color_ids = timed("borders", classify_borders, color_ids, border_luminance)
+    color_ids, labels = timed("merge islands", merge_islands, color_ids, min_island_area)
+    height, width = color_ids.shape
+    clean = Image.fromarray(np.ascontiguousarray(color_ids).view(np.uint8).reshape(height, width, 4), "RGBA")
+    return PreprocessResult(clean, labels, timings)
@@ -0,0 +1,272 @@
+# utils/memory_profile.py
+#
+# Compare two saved reports from the pyRisk directory:
+#     python -m utils.memory_profile memory_reports/0001_turn_1.json memory_reports/0009_turn_9.json
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+from PIL import Image
+
+REPORT_DIR = "memory_reports"
+TOP_ALLOCATORS = 25
+TRACE_FRAMES = 1  # Frames kept per allocation; more attribute better but cost more
+MAX_SIZE_DEPTH = 6  # Containers nested deeper than this aren't followed when sizing model fields
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_AREAS = {"controllers", "views", "utils", "models", "benchmarks"}
+
+
+def code_area(filename: str) -> str:
+    """
+    Name the part of the code a source file belongs to.
+
+    Returns:
+        str: A repo package such as "views/", a third-party package such as
+            "PIL", or "stdlib" for everything else.
+    """
+    path = os.path.abspath(filename)
+    if path.startswith(REPO_ROOT + os.sep):
+        first = os.path.relpath(path, REPO_ROOT).split(os.sep)[0]
+        return f"{first}/" if first in REPO_AREAS else first
+    parts = path.split(os.sep)
+    if "site-packages" in parts:
+        index = parts.index("site-packages")
+        return parts[index + 1] if index + 1 < len(parts) else "site-packages"
+    return "stdlib"
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None, depth: int = 0) -> int:
+    """
+    Estimate the bytes held by an object and everything it references.
+
+    Images count their pixel buffers and arrays their data, which
+    sys.getsizeof misses. Shared objects are counted once.
+
+    Args:
+        obj: The object to size.
+        seen (set, optional): Ids already counted.
+        depth (int): Current nesting level.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, Image.Image):
+        return sys.getsizeof(obj) + obj.width * obj.height * len(obj.getbands())
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) if obj.base is not None else obj.nbytes + sys.getsizeof(obj)
+    size = sys.getsizeof(obj)
+    if depth >= MAX_SIZE_DEPTH or isinstance(obj, (str, bytes, int, float, type)) or callable(obj):
+        return size
+    if isinstance(obj, dict):
+        items: Iterable = (part for pair in obj.items() for part in pair)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = obj
+    elif hasattr(obj, "__dict__"):
+        items = vars(obj).values()
+    else:
+        return size
+    return size + sum(deep_sizeof(item, seen, depth + 1) for item in items)
+
+
+def live_object_counts() -> Dict[str, int]:
+    """
+    Count live PIL images and Tk PhotoImages; a growing PhotoImage count points at a leaked reference.
+    """
+    counts: Counter = Counter()
+    for obj in gc.get_objects():
+        if isinstance(obj, Image.Image):
+            counts["PIL.Image.Image"] += 1
+        elif type(obj).__name__ == "PhotoImage":
+            counts[f"{type(obj).__module__}.PhotoImage"] += 1
+    return dict(counts)
+
+
+def resident_set_size() -> Optional[int]:
+    """
+    Get the process's resident memory in bytes, where the platform exposes it.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class MemoryProfiler:
+    def __init__(self, enabled: bool = False, actions: Iterable[str] = (), directory: str = REPORT_DIR,
+                 top: int = TOP_ALLOCATORS):
+        """
+        Initialize a MemoryProfiler that writes tracemalloc reports to disk.
+
+        Each report holds the traced and resident memory, allocations grouped
+        by code area (controllers/, views/, utils/, models/, libraries) with
+        the change since the previous report, the top allocating lines, the
+        estimated size of every model field and the number of live images.
+        Reports are numbered JSON files, so a session can be compared
+        offline turn by turn.
+
+        Args:
+            enabled (bool): Whether to start tracing straight away.
+            actions (iterable): Action names to snapshot before and after, e.g. "canvas_click".
+            directory (str): Where reports are written.
+            top (int): Allocating lines listed per report.
+        """
+        self.actions = set(actions)
+        self.directory = directory
+        self.top = top
+        self.sequence = 0
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self.enabled = False
+        if enabled:
+            self.start()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+        self.enabled = True
+
+    def stop(self) -> None:
+        self.enabled = False
+        self._previous = None
+        tracemalloc.stop()
+
+    def track(self, handler: Callable, model: Optional[Dict[str, Any]] = None) -> Callable:
+        """
+        Wrap a handle_*_actions callback so the chosen actions are snapshotted before and after.
+
+        Args:
+            handler (Callable): Callback taking the action name first.
+            model (dict, optional): The controller's model, sized in each report.
+
+        Returns:
+            Callable: The wrapped callback.
+        """
+        def profiled(action: str, *args, **kwargs):
+            if not self.enabled or action not in self.actions:
+                return handler(action, *args, **kwargs)
+            self.snapshot(f"{action}_before", model)
+            try:
+                return handler(action, *args, **kwargs)
+            finally:
+                self.snapshot(f"{action}_after", model)
+        return profiled
+
+    def _take(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def report(self, label: str, model: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Take a snapshot and build a report, diffed against the previous snapshot.
+
+        Args:
+            label (str): What the snapshot marks, e.g. "turn_3".
+            model (dict, optional): The controller's model, whose fields are sized.
+
+        Returns:
+            dict: The report.
+        """
+        snapshot = self._take()
+        areas: Dict[str, Dict[str, int]] = {}
+        for stat in snapshot.statistics("filename"):
+            area = areas.setdefault(code_area(stat.traceback[0].filename), {"size": 0, "count": 0, "size_diff": 0})
+            area["size"] += stat.size
+            area["count"] += stat.count
+        top_stats = snapshot.statistics("lineno")
+        if self._previous is not None:
+            for stat in snapshot.compare_to(self._previous, "filename"):
+                area = areas.setdefault(code_area(stat.traceback[0].filename), {"size": 0, "count": 0, "size_diff": 0})
+                area["size_diff"] += stat.size_diff
+            top_stats = snapshot.compare_to(self._previous, "lineno")
+        self._previous = snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        report = {
+            "label": label,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "traced_current": current,
+            "traced_peak": peak,
+            "rss": resident_set_size(),
+            "areas": dict(sorted(areas.items(), key=lambda item: -item[1]["size"])),
+            "top_allocators": [{
+                "location": f"{frame.filename}:{frame.lineno}",
+                "area": code_area(frame.filename),
+                "size": stat.size,
+                "size_diff": getattr(stat, "size_diff", stat.size),
+                "count": stat.count,
+            } for stat in top_stats[:self.top] for frame in stat.traceback[:1]],
+            "live_objects": live_object_counts(),
+        }
+        if model is not None:
+            seen: set = set()
+            sizes = {name: deep_sizeof(value, seen) for name, value in model.items()}
+            report["model_fields"] = dict(sorted(sizes.items(), key=lambda item: -item[1]))
+        return report
+
+    def snapshot(self, label: str, model: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Write a report to the report directory, if profiling is on.
+
+        Args:
+            label (str): What the snapshot marks, e.g. "turn_3".
+            model (dict, optional): The controller's model, whose fields are sized.
+
+        Returns:
+            str, optional: Path of the written report.
+        """
+        if not self.enabled:
+            return None
+        report = self.report(label, model)
+        os.makedirs(self.directory, exist_ok=True)
+        self.sequence += 1
+        path = os.path.join(self.directory, f"{self.sequence:04d}_{label}.json")
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return path
+
+
+def compare_reports(before: Dict[str, Any], after: Dict[str, Any]) -> str:
+    """
+    Describe how memory moved between two saved reports, largest changes first.
+
+    Returns:
+        str: A text table of traced memory, code areas and model fields.
+    """
+    def rows(title: str, old: Dict[str, int], new: Dict[str, int]) -> List[str]:
+        names = sorted(set(old) | set(new), key=lambda name: -abs(new.get(name, 0) - old.get(name, 0)))
+        lines = [f"{title:<36}{'before KB':>12}{'after KB':>12}{'change KB':>12}"]
+        for name in names:
+            lines.append(f"{name:<36}{old.get(name, 0) / 1024:>12.1f}{new.get(name, 0) / 1024:>12.1f}"
+                         f"{(new.get(name, 0) - old.get(name, 0)) / 1024:>+12.1f}")
+        return lines
+
+    lines = [f"{before['label']} -> {after['label']}"]
+    totals = ("traced_current", "traced_peak", "rss")
+    lines += rows("Total", {name: before.get(name) or 0 for name in totals},
+                  {name: after.get(name) or 0 for name in totals})
+    lines += [""] + rows("Code area", {name: area["size"] for name, area in before["areas"].items()},
+                         {name: area["size"] for name, area in after["areas"].items()})
+    if "model_fields" in before and "model_fields" in after:
+        lines += [""] + rows("Model field", before["model_fields"], after["model_fields"])
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m utils.memory_profile BEFORE.json AFTER.json")
+    with open(sys.argv[1]) as before_file, open(sys.argv[2]) as after_file:
+        print(compare_reports(json.load(before_file), json.load(after_file)))
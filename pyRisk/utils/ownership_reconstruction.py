@@ -0,0 +1,119 @@
+# utils/ownership_reconstruction.py
+
+import numpy as np
+from PIL import Image
+from typing import Dict, Tuple
+from utils.segmentation import image_to_color_ids
+
+COLOR_TOLERANCE = 48  # Largest RGB distance at which a pixel still matches a player colour
+MIN_REGION_COVERAGE = 0.5  # Share of a region's pixels that must match its owner's colour
+NEAREST_CHUNK = 65536  # Colours matched per vectorised step
+
+
+def nearest_palette_index(colors: np.ndarray, palette: np.ndarray, tolerance: float = COLOR_TOLERANCE) -> np.ndarray:
+    """
+    Find the nearest palette colour for each colour, by squared RGB distance.
+
+    Args:
+        colors (np.ndarray): (n, 3) RGB colours to match.
+        palette (np.ndarray): (p, 3) RGB palette colours.
+        tolerance (float): Colours further than this from every palette entry get no match.
+
+    Returns:
+        np.ndarray: Palette index per colour, or -1 where nothing is close enough.
+    """
+    nearest = np.full(len(colors), -1, dtype=np.int64)
+    if not len(palette):
+        return nearest
+    palette = palette.astype(np.int32)
+    # Chunked so the (colours x palette) distance table stays small for photos with many colours
+    for start in range(0, len(colors), NEAREST_CHUNK):
+        diff = colors[start:start + NEAREST_CHUNK, None, :].astype(np.int32) - palette[None, :, :]
+        distances = np.einsum('npc,npc->np', diff, diff)
+        best = distances.argmin(axis=1)
+        best[distances[np.arange(len(best)), best] > tolerance * tolerance] = -1
+        nearest[start:start + NEAREST_CHUNK] = best
+    return nearest
+
+
+def reconstruct_owners(labels: np.ndarray, ownable: np.ndarray, base_image: Image.Image,
+                       painted_image: Image.Image, player_colors: Dict[int, Tuple[int, int, int]],
+                       tolerance: float = COLOR_TOLERANCE,
+                       min_coverage: float = MIN_REGION_COVERAGE) -> np.ndarray:
+    """
+    Work out which player owns each region of a painted map.
+
+    Only pixels that differ from the base map are considered. Their distinct
+    colours are matched to the player palette once, and every region goes to
+    the player whose colour covers most of it, provided that covers at least
+    ``min_coverage`` of the region's area. Everything else is unowned.
+
+    Args:
+        labels (np.ndarray): Region label raster of the base map (RegionMap.labels).
+        ownable (np.ndarray): Boolean per region, False for border lines.
+        base_image (Image.Image): The unpainted base map.
+        painted_image (Image.Image): The painted map, same size as the base map.
+        player_colors (dict): Player id -> RGB colour.
+        tolerance (float): Largest RGB distance that still matches a player colour.
+        min_coverage (float): Share of a region that must match its owner's colour.
+
+    Returns:
+        np.ndarray: int32 player id per region, 0 for unowned.
+
+    Raises:
+        ValueError: If the painted map and base map differ in size.
+    """
+    if painted_image.size != base_image.size:
+        raise ValueError("The painted map must be the same size as the base map.")
+    region_count = len(ownable)
+    owners = np.zeros(region_count, dtype=np.int32)
+    if not player_colors:
+        return owners
+
+    painted = image_to_color_ids(painted_image).ravel()
+    flat_labels = labels.ravel()
+    changed = np.flatnonzero(painted != image_to_color_ids(base_image).ravel())
+    changed = changed[ownable[flat_labels[changed]]]
+    if not len(changed):
+        return owners
+
+    # Match each distinct painted colour once rather than every pixel
+    unique_colors, inverse = np.unique(painted[changed], return_inverse=True)
+    rgb = unique_colors.view(np.uint8).reshape(-1, 4)[:, :3]
+    player_ids = np.fromiter(player_colors, dtype=np.int32, count=len(player_colors))
+    palette = np.array([player_colors[player_id] for player_id in player_ids], dtype=np.int32).reshape(-1, 3)
+    pixel_match = nearest_palette_index(rgb, palette, tolerance)[inverse]
+
+    matched = pixel_match >= 0
+    votes = flat_labels[changed[matched]].astype(np.int64) * len(palette) + pixel_match[matched]
+    keys, counts = np.unique(votes, return_counts=True)
+    regions = keys // len(palette)
+    # Per region, keep the palette entry with the most matching pixels
+    order = np.lexsort((-counts, regions))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = regions[order][1:] != regions[order][:-1]
+    best = order[first]
+    areas = np.bincount(flat_labels, minlength=region_count)
+    covered = counts[best] >= min_coverage * areas[regions[best]]
+    owners[regions[best][covered]] = player_ids[keys[best][covered] % len(palette)]
+    return owners
+
+
+def count_painted_regions(colors: np.ndarray, ownable: np.ndarray,
+                          player_colors: Dict[int, Tuple[int, int, int]]) -> int:
+    """
+    Count the regions of a supposedly unpainted map that are already filled with a player colour.
+
+    Args:
+        colors (np.ndarray): Packed RGBA colour per region (RegionMap.colors).
+        ownable (np.ndarray): Boolean per region, False for border lines.
+        player_colors (dict): Player id -> RGB colour.
+
+    Returns:
+        int: Ownable regions whose colour is exactly a player's colour.
+    """
+    if not player_colors:
+        return 0
+    rgb = colors.astype(np.uint32).view(np.uint8).reshape(-1, 4)[:, :3]
+    palette = np.array(list(player_colors.values()), dtype=np.int32).reshape(-1, 3)
+    return int(np.count_nonzero((nearest_palette_index(rgb, palette, 0) >= 0) & ownable))
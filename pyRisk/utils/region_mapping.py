@@ -0,0 +1,83 @@
+# utils/region_mapping.py
+
+from itertools import chain
+from typing import Dict, Iterable, List, Tuple
+from models.player_registry import PlayerRegistry
+from utils.line_import import LineImportResult, non_empty_lines, sniff_delimiter, split_fields
+
+
+class RegionMappingResult(LineImportResult):
+    def __init__(self):
+        """
+        Initialize an empty RegionMappingResult.
+
+        Attributes:
+            assignments (list): Valid (region, player_name) pairs in input order.
+            errors (list): (line_number, message) pairs for rejected lines.
+        """
+        super().__init__()
+        self.assignments: List[Tuple[int, str]] = []
+
+
+def parse_region_mapping(lines: Iterable[str], region_map, players: PlayerRegistry) -> RegionMappingResult:
+    """
+    Parse ``region -> player`` lines in a single streaming pass.
+
+    Each line is either ``x,y,player`` (any pixel inside the region, which
+    stays valid across sessions) or ``region,player`` (a region index).
+    Accepts CSV, TSV or semicolon separated input, an optional header,
+    blank lines and ``#`` comments. Player names are matched with
+    PlayerRegistry.find: exactly first, then case-insensitively.
+
+    Args:
+        lines (iterable): Lines of text, e.g. an open file.
+        region_map (RegionMap): The segmented base map.
+        players (PlayerRegistry): The game's players.
+
+    Returns:
+        RegionMappingResult: The valid assignments and a per-line error report.
+    """
+    result = RegionMappingResult()
+    seen: Dict[int, Tuple[int, str]] = {}
+
+    numbered = non_empty_lines(lines)
+    first = next(numbered, None)
+    if first is None:
+        return result
+    delimiter = sniff_delimiter(first[1])
+
+    for line_no, line in chain((first,), numbered):
+        fields = split_fields(line, delimiter)
+        if line_no == first[0] and fields and not fields[0].isdigit():
+            continue  # Header line
+        if len(fields) not in (2, 3) or not all(field.isdigit() for field in fields[:-1]):
+            result.errors.append((line_no, f"Expected 'x{delimiter}y{delimiter}player' or 'region{delimiter}player'."))
+            continue
+        name = fields[-1]
+        player = players.find(name)
+        if player is None:
+            result.errors.append((line_no, f"Unknown player '{name}'."))
+            continue
+        player_name = player.name
+        if len(fields) == 3:
+            x, y = int(fields[0]), int(fields[1])
+            if x >= region_map.width or y >= region_map.height:
+                result.errors.append((line_no, f"Point ({x}, {y}) is outside the map."))
+                continue
+            region = region_map.region_at(x, y)
+        else:
+            region = int(fields[0])
+            if region >= region_map.region_count:
+                result.errors.append((line_no, f"Region {region} does not exist."))
+                continue
+        if not region_map.is_ownable(region):
+            if len(fields) == 3:
+                result.errors.append((line_no, "That point is on a border line."))
+            else:
+                result.errors.append((line_no, f"Region {region} is a border line and can't be owned."))
+        elif region in seen and seen[region][1] != player_name:
+            result.errors.append((line_no, f"Region already given to {seen[region][1]} on line {seen[region][0]}."))
+        elif region not in seen:
+            seen[region] = (line_no, player_name)
+            result.assignments.append((region, player_name))
+    return result
@@ -0,0 +1,75 @@
+# utils/roll_import.py
+
+from itertools import chain
+from typing import Dict, Iterable, List, Tuple
+from models.player_registry import PlayerRegistry
+from utils.line_import import LineImportResult, non_empty_lines, sniff_delimiter, split_fields
+
+MAX_ROLL_LENGTH = 20  # Max digits allowed
+
+
+class RollImportResult(LineImportResult):
+    def __init__(self):
+        """
+        Initialize an empty RollImportResult.
+
+        Attributes:
+            rolls (list): Valid (player_name, roll_str) pairs in input order.
+            errors (list): (line_number, message) pairs for rejected lines.
+        """
+        super().__init__()
+        self.rolls: List[Tuple[str, str]] = []
+
+
+def parse_roll_lines(lines: Iterable[str], players: PlayerRegistry,
+                     max_length: int = MAX_ROLL_LENGTH) -> RollImportResult:
+    """
+    Parse and validate ``name,roll`` lines in a single streaming pass.
+
+    Accepts CSV, TSV or semicolon separated input (detected from the first
+    line), an optional ``name,roll`` header, blank lines and ``#`` comments.
+    Player names are matched with PlayerRegistry.find: exactly first, then
+    case-insensitively.
+
+    Args:
+        lines (iterable): Lines of text, e.g. an open file or ``text.splitlines()``.
+        players (PlayerRegistry): The game's players.
+        max_length (int): Maximum number of digits allowed in a roll.
+
+    Returns:
+        RollImportResult: The valid rolls and a per-line error report.
+    """
+    result = RollImportResult()
+    seen: Dict[str, int] = {}
+
+    numbered = non_empty_lines(lines)
+    first = next(numbered, None)
+    if first is None:
+        return result
+    delimiter = sniff_delimiter(first[1])
+
+    for line_no, line in chain((first,), numbered):
+        fields = split_fields(line, delimiter)
+        if line_no == first[0] and len(fields) >= 2 and not fields[1].isdigit() \
+                and players.find(fields[0]) is None:
+            continue  # Header line
+        if len(fields) != 2:
+            result.errors.append((line_no, f"Expected 'name{delimiter}roll', got {len(fields)} field(s)."))
+            continue
+        name, roll_str = fields
+        player = players.find(name)
+        player_name = player.name if player else None
+        if player is None:
+            result.errors.append((line_no, f"Unknown player '{name}'."))
+        elif not roll_str:
+            result.errors.append((line_no, f"Roll number for {player_name} cannot be empty."))
+        elif not roll_str.isdigit():
+            result.errors.append((line_no, f"Invalid roll number for {player_name}. Must be digits only."))
+        elif len(roll_str) > max_length:
+            result.errors.append((line_no, f"Roll number for {player_name} exceeds maximum length of {max_length}."))
+        elif player_name in seen:
+            result.errors.append((line_no, f"Duplicate roll for {player_name} (first given on line {seen[player_name]})."))
+        else:
+            seen[player_name] = line_no
+            result.rolls.append((player_name, roll_str))
+    return result
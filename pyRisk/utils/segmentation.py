@@ -0,0 +1,136 @@
+# utils/segmentation.py
+
+import numpy as np
+from PIL import Image
+from typing import Dict, Tuple
+
+BORDER_LUMINANCE = 40  # Pixels darker than this are border lines
+
+
+def image_to_color_ids(image: Image.Image) -> np.ndarray:
+    """
+    Pack an image's RGBA pixels into one uint32 per pixel for fast comparisons.
+
+    Args:
+        image (Image.Image): The image to pack.
+
+    Returns:
+        np.ndarray: (height, width) uint32 array of packed colours.
+    """
+    rgba = np.ascontiguousarray(np.asarray(image.convert("RGBA"), dtype=np.uint8))
+    return rgba.view(np.uint32).reshape(rgba.shape[:2])
+
+
+def luminance(color_ids: np.ndarray) -> np.ndarray:
+    """
+    Get the perceived brightness (0-255) of packed colours.
+
+    Args:
+        color_ids (np.ndarray): Packed RGBA colours from image_to_color_ids.
+
+    Returns:
+        np.ndarray: int32 luminance per colour, same shape as the input.
+    """
+    rgba = np.ascontiguousarray(color_ids, dtype=np.uint32).view(np.uint8).reshape(color_ids.shape + (4,)).astype(np.int32)
+    return (rgba[..., 0] * 299 + rgba[..., 1] * 587 + rgba[..., 2] * 114) // 1000
+
+
+def _union_find(parent: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Merge the sets linked by the edges (a, b) with vectorised hook-and-compress rounds.
+
+    Each round hooks the larger root of every edge onto the smaller one and then
+    jumps pointers until every node points at its root, so the number of rounds
+    grows with the logarithm of the component size rather than its diameter.
+
+    Args:
+        parent (np.ndarray): Initial parent array, normally ``arange(n)``.
+        a (np.ndarray): First node of each edge.
+        b (np.ndarray): Second node of each edge.
+
+    Returns:
+        np.ndarray: Array mapping every node to the smallest node in its set.
+    """
+    while True:
+        root_a = parent[a]
+        root_b = parent[b]
+        unmerged = root_a != root_b
+        if not unmerged.any():
+            return parent
+        root_a = root_a[unmerged]
+        root_b = root_b[unmerged]
+        low = np.minimum(root_a, root_b)
+        np.minimum.at(parent, np.maximum(root_a, root_b), low)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+
+def label_regions(color_ids: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Label the 4-connected regions of identical colour in an image.
+
+    Rows are split into runs of equal colour, vertically touching runs of the
+    same colour are linked, and the links are merged with a vectorised
+    union-find, so the work is proportional to the number of runs.
+
+    Args:
+        color_ids (np.ndarray): (height, width) packed colours from image_to_color_ids.
+
+    Returns:
+        tuple: (labels, region_count) where labels is an int32 array of region
+            indices 0..region_count-1, numbered in row-major order of first pixel.
+    """
+    height, width = color_ids.shape
+    starts = np.ones((height, width), dtype=bool)
+    starts[:, 1:] = color_ids[:, 1:] != color_ids[:, :-1]
+    run_ids = (np.cumsum(starts.ravel(), dtype=np.int64) - 1).reshape(height, width)
+    run_count = int(run_ids[-1, -1]) + 1 if run_ids.size else 0
+
+    same = color_ids[1:] == color_ids[:-1]
+    edges = np.unique(run_ids[:-1][same] * run_count + run_ids[1:][same])
+    roots = _union_find(np.arange(run_count, dtype=np.int64), edges // run_count, edges % run_count)
+
+    unique_roots, run_region = np.unique(roots, return_inverse=True)
+    labels = run_region.astype(np.int32)[run_ids]
+    return labels, len(unique_roots)
+
+
+def region_adjacency(labels: np.ndarray, is_border: np.ndarray, max_border_width: int = 6) -> Dict[Tuple[int, int], int]:
+    """
+    Find which regions touch, directly or across a border line, and how long their shared border is.
+
+    Scanning each row and column, two non-border regions are neighbours where
+    they meet directly or are separated only by up to ``max_border_width``
+    border pixels. The number of such crossings approximates the length of
+    their shared border in pixels.
+
+    Args:
+        labels (np.ndarray): Region labels from label_regions.
+        is_border (np.ndarray): Boolean mask of border-line pixels.
+        max_border_width (int): Widest border line to look across.
+
+    Returns:
+        dict: (region_a, region_b) with region_a < region_b -> shared border length.
+    """
+    region_count = int(labels.max()) + 1 if labels.size else 0
+    keys = []
+    for lab, border in ((labels, is_border), (labels.T, is_border.T)):
+        width = lab.shape[1]
+        through = np.ones((lab.shape[0], width - 1), dtype=bool)
+        for gap in range(0, min(max_border_width, width - 2) + 1):
+            if gap:
+                through = through[:, :-1] & border[:, gap:width - 1]
+            left = lab[:, :width - gap - 1]
+            right = lab[:, gap + 1:]
+            mask = through & (left != right) & ~border[:, :width - gap - 1] & ~border[:, gap + 1:]
+            if mask.any():
+                a = left[mask].astype(np.int64)
+                b = right[mask].astype(np.int64)
+                keys.append(np.minimum(a, b) * region_count + np.maximum(a, b))
+    if not keys:
+        return {}
+    pairs, counts = np.unique(np.concatenate(keys), return_counts=True)
+    return {(int(key // region_count), int(key % region_count)): int(count) for key, count in zip(pairs, counts)}
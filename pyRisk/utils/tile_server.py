@@ -0,0 +1,300 @@
+# utils/tile_server.py
+
+import io
+import json
+import math
+import re
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+TILE_SIZE = 256
+TILE_CACHE_CAPACITY = 2048  # Encoded tiles kept in memory
+DEFAULT_HOST = "127.0.0.1"  # Only this computer can watch
+LAN_HOST = "0.0.0.0"  # Every interface; anyone on the network can watch, without a password
+DEFAULT_PORT = 8765
+BBox = Tuple[int, int, int, int]  # (x0, y0, x1, y1), exclusive of x1/y1
+
+TILE_PATH = re.compile(r"^/tiles/(\d+)/(\d+)/(\d+)\.png$")
+VERSIONS_PATH = re.compile(r"^/versions/(\d+)\.json$")
+
+
+class TileStore:
+    def __init__(self, source: Callable[[], Optional[Image.Image]], tile_size: int = TILE_SIZE,
+                 capacity: int = TILE_CACHE_CAPACITY):
+        """
+        Initialize a TileStore, which serves the editor's map image as XYZ tiles.
+
+        Zoom level max_zoom is full resolution and each level below halves
+        it, down to a single tile at level 0. Every tile of every level has a
+        version counter. ``on_map_changed`` runs on the Tk thread with the
+        editor's dirty rectangle and only bumps the counters of the tiles it
+        covers, so the editor never waits on copying or encoding. The store
+        keeps no pixels of its own: server threads cut a requested tile
+        straight from the editor's image and cache the encoded PNG by
+        version; versions also make the ETags. A tile read while the editor
+        is painting it is served, but not cached, if its version moved
+        meanwhile, so the next poll fetches it again.
+
+        Args:
+            source (Callable): Returns the editor's current map image.
+            tile_size (int): Tile side in pixels.
+            capacity (int): Most encoded tiles kept in memory.
+        """
+        self.source = source
+        self.tile_size = tile_size
+        self.capacity = capacity
+        self.generation = 0  # Bumped whenever the map is replaced by one of another size
+        self.size: Optional[Tuple[int, int]] = None  # (width, height) of the map the versions describe
+        self.max_zoom = 0
+        self.versions: list = []
+        self._encoded: "OrderedDict[Tuple[int, int, int], Tuple[int, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.on_map_changed(None)
+
+    def scale(self, zoom: int) -> int:
+        return 1 << (self.max_zoom - zoom)
+
+    def _grid(self, zoom: int) -> Tuple[int, int]:
+        span = self.tile_size * self.scale(zoom)
+        width, height = self.size
+        return -(-height // span), -(-width // span)
+
+    def on_map_changed(self, event) -> None:
+        """
+        Bump the versions of the tiles covering the changed part of the map.
+
+        Args:
+            event (MapChanged, optional): The change; None or a bbox of None means the whole map.
+        """
+        image = self.source()
+        if image is None:
+            return
+        bbox = getattr(event, "bbox", None)
+        width, height = image.size
+        with self._lock:
+            if self.size != (width, height):
+                self.size = (width, height)
+                self.max_zoom = max(0, math.ceil(math.log2(max(width, height) / self.tile_size)))
+                self.versions = [np.zeros(self._grid(zoom), dtype=np.int64) for zoom in range(self.max_zoom + 1)]
+                self.generation += 1
+                self._encoded.clear()
+                return
+            x0, y0, x1, y1 = bbox if bbox is not None else (0, 0, width, height)
+            x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)
+            if x0 >= x1 or y0 >= y1:
+                return
+            for zoom, versions in enumerate(self.versions):
+                span = self.tile_size * self.scale(zoom)
+                versions[y0 // span:-(-y1 // span), x0 // span:-(-x1 // span)] += 1
+
+    def etag(self, zoom: int, x: int, y: int) -> Optional[str]:
+        """
+        Get a tile's ETag, or None if the tile is outside the map.
+        """
+        with self._lock:
+            if self.size is None or not 0 <= zoom <= self.max_zoom:
+                return None
+            rows, cols = self.versions[zoom].shape
+            if not (0 <= y < rows and 0 <= x < cols):
+                return None
+            return f'"{self.generation}.{self.versions[zoom][y, x]}"'
+
+    def tile(self, zoom: int, x: int, y: int) -> Optional[Tuple[str, bytes]]:
+        """
+        Get a tile as PNG bytes, encoding it only if it changed since it was last served.
+
+        Args:
+            zoom (int): Zoom level, max_zoom being full resolution.
+            x, y (int): Tile column and row.
+
+        Returns:
+            tuple, optional: (etag, png bytes), or None if the tile is outside the map.
+        """
+        key = (zoom, x, y)
+        with self._lock:
+            if self.size is None or not 0 <= zoom <= self.max_zoom:
+                return None
+            rows, cols = self.versions[zoom].shape
+            if not (0 <= y < rows and 0 <= x < cols):
+                return None
+            version = (self.generation, int(self.versions[zoom][y, x]))
+            cached = self._encoded.get(key)
+            if cached and cached[0] == version:
+                self._encoded.move_to_end(key)
+                return f'"{version[0]}.{version[1]}"', cached[1]
+            width, height = self.size
+        image = self.source()
+        if image is None or image.size != (width, height):
+            return None  # The map is being replaced; the next poll sees the new one
+        scale = self.scale(zoom)
+        span = self.tile_size * scale
+        box = (x * span, y * span, min((x + 1) * span, width), min((y + 1) * span, height))
+        # Nearest sampling straight from the editor's image; the map is flat colours so it loses little
+        region = image.resize((-(-(box[2] - box[0]) // scale), -(-(box[3] - box[1]) // scale)),
+                              Image.NEAREST, box=box).convert("RGBA")
+        buffer = io.BytesIO()
+        region.save(buffer, "PNG", compress_level=1)
+        data = buffer.getvalue()
+        with self._lock:
+            if self.generation == version[0] and int(self.versions[zoom][y, x]) == version[1]:
+                self._encoded[key] = (version, data)
+                self._encoded.move_to_end(key)
+                while len(self._encoded) > self.capacity:
+                    self._encoded.popitem(last=False)
+        return f'"{version[0]}.{version[1]}"', data
+
+    def metadata(self) -> dict:
+        with self._lock:
+            width, height = self.size or (0, 0)
+            return {"width": width, "height": height, "tile_size": self.tile_size,
+                    "max_zoom": self.max_zoom, "generation": self.generation}
+
+    def version_grid(self, zoom: int) -> Optional[dict]:
+        """
+        Get every tile version of a zoom level, for viewers to poll for changes.
+        """
+        with self._lock:
+            if self.size is None or not 0 <= zoom <= self.max_zoom:
+                return None
+            return {"generation": self.generation, "versions": self.versions[zoom].tolist()}
+
+
+VIEWER_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>pyRisk map</title>
+<style>
+body { margin: 0; background: #777; font-family: sans-serif; }
+#bar { position: fixed; top: 0; left: 0; right: 0; padding: 4px; background: #ddd; z-index: 1; }
+#map { position: relative; margin-top: 32px; }
+#map img { position: absolute; image-rendering: pixelated; }
+</style></head>
+<body>
+<div id="bar"><button onclick="zoomBy(-1)">-</button> <button onclick="zoomBy(1)">+</button> <span id="status"></span></div>
+<div id="map"></div>
+<script>
+let meta = null, zoom = 0, versions = null;
+const map = document.getElementById("map");
+
+async function load() {
+  meta = await (await fetch("/meta.json", {cache: "no-store"})).json();
+  zoom = Math.min(zoom || Math.max(meta.max_zoom - 2, 0), meta.max_zoom);
+  versions = null;
+  map.innerHTML = "";
+  await refresh();
+}
+
+function zoomBy(step) {
+  zoom = Math.min(Math.max(zoom + step, 0), meta.max_zoom);
+  versions = null;
+  map.innerHTML = "";
+  refresh();
+}
+
+async function refresh() {
+  const grid = await (await fetch(`/versions/${zoom}.json`, {cache: "no-store"})).json();
+  if (grid.generation !== meta.generation) { return load(); }
+  const scale = 2 ** (meta.max_zoom - zoom);
+  map.style.width = Math.ceil(meta.width / scale) + "px";
+  map.style.height = Math.ceil(meta.height / scale) + "px";
+  grid.versions.forEach((row, y) => row.forEach((version, x) => {
+    if (versions && versions[y][x] === version) { return; }
+    let img = document.getElementById(`t${x}_${y}`);
+    if (!img) {
+      img = document.createElement("img");
+      img.id = `t${x}_${y}`;
+      img.style.left = x * meta.tile_size + "px";
+      img.style.top = y * meta.tile_size + "px";
+      map.appendChild(img);
+    }
+    img.src = `/tiles/${zoom}/${x}/${y}.png?v=${grid.generation}.${version}`;
+  }));
+  versions = grid.versions;
+  document.getElementById("status").textContent = `zoom ${zoom}/${meta.max_zoom}, updated ${new Date().toLocaleTimeString()}`;
+}
+
+load();
+setInterval(refresh, 3000);
+</script></body></html>
+"""
+
+
+class TileRequestHandler(BaseHTTPRequestHandler):
+    store: TileStore  # Set on the subclass made by TileServer
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path in ("/", "/index.html"):
+            self.send_body(VIEWER_HTML.encode(), "text/html; charset=utf-8", "no-cache")
+        elif path == "/meta.json":
+            self.send_body(json.dumps(self.store.metadata()).encode(), "application/json", "no-cache")
+        elif VERSIONS_PATH.match(path):
+            grid = self.store.version_grid(int(VERSIONS_PATH.match(path).group(1)))
+            if grid is None:
+                self.send_error(404)
+            else:
+                self.send_body(json.dumps(grid).encode(), "application/json", "no-cache")
+        elif TILE_PATH.match(path):
+            zoom, x, y = (int(part) for part in TILE_PATH.match(path).groups())
+            etag = self.store.etag(zoom, x, y)
+            if etag is None:
+                self.send_error(404)
+            elif etag in self.headers.get("If-None-Match", ""):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+            else:
+                tile = self.store.tile(zoom, x, y)
+                if tile is None:
+                    self.send_error(404)
+                else:
+                    # Clients must revalidate, which costs a 304 for tiles that haven't changed
+                    self.send_body(tile[1], "image/png", "no-cache", etag=tile[0])
+        else:
+            self.send_error(404)
+
+    def send_body(self, body: bytes, content_type: str, cache_control: str, etag: Optional[str] = None):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", cache_control)
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Spectators polling every few seconds would flood the console
+
+
+class TileServer:
+    def __init__(self, store: TileStore, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """
+        Initialize a TileServer that serves a TileStore and the HTML viewer over HTTP.
+
+        Requests are handled on server threads, never the Tk thread.
+
+        Args:
+            store (TileStore): The tiles to serve.
+            host (str): Interface to listen on.
+            port (int): Port to listen on; 0 picks a free port.
+        """
+        self.store = store
+        handler = type("BoundTileRequestHandler", (TileRequestHandler,), {"store": store})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="tile-server", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
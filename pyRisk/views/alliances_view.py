@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Callable, Optional
 from models.player import Player
+from controllers.event_bus import EventBus, DiplomacyChanged, OwnershipChanged, PlayerUpdated, RollAppended
 
 
 class AlliancesView:
@@ -88,14 +89,38 @@ class AlliancesView:
         self.naps_text = tk.Text(self.frame, height=10, state=tk.DISABLED)
         self.naps_text.pack(fill=tk.BOTH, expand=True, padx=10)
 
+        # Bloc Overview
+        tk.Label(self.frame, text="Bloc Overview:", font=("Arial", 14)).pack(pady=10)
+        self.blocs_text = tk.Text(self.frame, height=10, state=tk.DISABLED)
+        self.blocs_text.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        self.update_displays()
+
+    def bind_events(self, events: EventBus):
+        """
+        Subscribe to the changes this view shows.
+
+        Args:
+            events (EventBus): The controller's event bus.
+        """
+        events.subscribe(DiplomacyChanged, self.on_relations_changed)
+        events.subscribe(PlayerUpdated, self.on_relations_changed)
+        events.subscribe(OwnershipChanged, self.on_territory_changed)
+        events.subscribe(RollAppended, self.on_territory_changed)
+
+    def on_relations_changed(self, event):
         self.update_displays()
 
+    def on_territory_changed(self, event):
+        self.update_blocs_text()
+
     def update_displays(self):
         """
-        Update the alliances and NAPs display areas.
+        Update the alliances, NAPs and bloc display areas.
         """
         self.update_alliances_text()
         self.update_naps_text()
+        self.update_blocs_text()
 
     def update_alliances_text(self):
         """
@@ -103,12 +128,7 @@ class AlliancesView:
         """
         self.alliances_text.config(state=tk.NORMAL)
         self.alliances_text.delete(1.0, tk.END)
-        alliances = []
-        players = self.controller("get_players")
-        for player in players:
-            for ally in player.allies:
-                if player.name < ally.name:
-                    alliances.append(f"{player.name} ↔ {ally.name}")
+        alliances = [f"{name1} ↔ {name2}" for name1, name2 in self.controller("get_relations", "alliance")]
         if alliances:
             self.alliances_text.insert(tk.END, '\n'.join(alliances))
         else:
@@ -121,21 +141,34 @@ class AlliancesView:
         """
         self.naps_text.config(state=tk.NORMAL)
         self.naps_text.delete(1.0, tk.END)
-        naps = []
-        players = self.controller("get_players")
-        for player in players:
-            for nap in player.naps:
-                if player.name < nap.name:
-                    naps.append(f"{player.name} ↔ {nap.name}")
+        naps = [f"{name1} ↔ {name2}" for name1, name2 in self.controller("get_relations", "nap")]
         if naps:
             self.naps_text.insert(tk.END, '\n'.join(naps))
         else:
             self.naps_text.insert(tk.END, "No Non-Aggression Pacts.")
         self.naps_text.config(state=tk.DISABLED)
 
+    def update_blocs_text(self):
+        """
+        Update the bloc overview text widget.
+        """
+        self.blocs_text.config(state=tk.NORMAL)
+        self.blocs_text.delete(1.0, tk.END)
+        lines = []
+        for bloc in self.controller("get_bloc_summary"):
+            lines.append(f"{' + '.join(bloc['members'])}: {bloc['regions']} regions, "
+                         f"{bloc['area']} px, {bloc['tiles_rolled']} tiles rolled this turn")
+            for rivals, length in bloc['borders']:
+                lines.append(f"    borders {' + '.join(rivals)}: {length} px")
+        if lines:
+            self.blocs_text.insert(tk.END, '\n'.join(lines))
+        else:
+            self.blocs_text.insert(tk.END, "No map imported.")
+        self.blocs_text.config(state=tk.DISABLED)
+
     def refresh(self):
         """
-        Refresh the alliances and NAPs displays.
+        Refresh the alliances, NAPs and bloc displays.
         """
         self.update_displays()
 
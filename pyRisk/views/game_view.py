@@ -5,6 +5,7 @@ from tkinter import messagebox, colorchooser
 from PIL import ImageTk
 from typing import Callable, Optional
 from utils.utils import flood_fill
+from controllers.event_bus import EventBus, MapChanged, PlayerUpdated, RollAppended, TurnAdvanced
 
 
 class GameView:
@@ -56,6 +57,68 @@ class GameView:
         )
         self.undo_button.pack(pady=5)
 
+        # Lasso Tool Button
+        self.lasso_mode = False
+        self.lasso_button = tk.Button(
+            self.sidebar, text="Lasso Tool: Off", command=self.toggle_lasso
+        )
+        self.lasso_button.pack(pady=5)
+
+        # Batch Fill Buttons
+        tk.Label(
+            self.sidebar, text="Shift-click or Ctrl-drag\nto select regions", bg='lightgrey'
+        ).pack(pady=(10, 0))
+        self.apply_selection_button = tk.Button(
+            self.sidebar, text="Fill Selection", command=lambda: self.controller("apply_selection")
+        )
+        self.apply_selection_button.pack(pady=2)
+        self.clear_selection_button = tk.Button(
+            self.sidebar, text="Clear Selection", command=lambda: self.controller("clear_selection")
+        )
+        self.clear_selection_button.pack(pady=2)
+        self.load_mapping_button = tk.Button(
+            self.sidebar, text="Load Region Mapping...", command=lambda: self.controller("load_region_mapping")
+        )
+        self.load_mapping_button.pack(pady=2)
+
+        # Turn Report Button
+        self.report_button = tk.Button(
+            self.sidebar, text="Turn Report", command=lambda: self.controller("show_turn_report")
+        )
+        self.report_button.pack(pady=5)
+
+        # Replay Button
+        self.replay_button = tk.Button(
+            self.sidebar, text="Replay Turns", command=lambda: self.controller("show_replay")
+        )
+        self.replay_button.pack(pady=5)
+
+        # Spectator Server Button
+        self.server_button = tk.Button(
+            self.sidebar, text="Start Spectator Server", command=lambda: self.controller("toggle_tile_server")
+        )
+        self.server_button.pack(pady=5)
+        self.server_lan = tk.BooleanVar(value=bool(self.controller("get_tile_server_lan")))
+        self.server_lan_check = tk.Checkbutton(
+            self.sidebar, text="Share on local network", variable=self.server_lan,
+            command=lambda: self.controller("set_tile_server_lan", self.server_lan.get())
+        )
+        self.server_lan_check.pack()
+        self.server_label = tk.Label(self.sidebar, text="", font=("Arial", 10))
+        self.server_label.pack()
+
+        # Latency Monitor Button
+        self.latency_button = tk.Button(
+            self.sidebar, text="Latency Monitor", command=lambda: self.controller("show_latency_monitor")
+        )
+        self.latency_button.pack(pady=5)
+
+        # Selected Player Statistics
+        self.stats_label = tk.Label(
+            self.sidebar, text="", font=("Arial", 11), bg='lightgrey', justify=tk.LEFT
+        )
+        self.stats_label.pack(pady=5)
+
         # Player Selection
         self.select_player_label = tk.Label(
             self.sidebar, text="Select Player:", font=("Arial", 12)
@@ -85,8 +148,19 @@ class GameView:
         # Bind resize event
         self.canvas.bind('<Configure>', self.on_canvas_configure)
 
-        # Bind click event
-        self.canvas.bind("<Button-1>", lambda event: self.controller("canvas_click", event))
+        # Bind click event; with the lasso tool on, dragging draws a lasso instead
+        self.lasso_points: list = []
+        self.lasso_photo = None
+        self.canvas.bind("<Button-1>", self.on_canvas_press)
+        self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+
+        # Batch selection: shift-click toggles a region, ctrl-drag selects a box
+        self.drag_start = None
+        self.canvas.bind("<Shift-Button-1>", lambda event: self.controller("toggle_region_selection", event))
+        self.canvas.bind("<Control-ButtonPress-1>", self.on_box_start)
+        self.canvas.bind("<Control-B1-Motion>", self.on_box_drag)
+        self.canvas.bind("<Control-ButtonRelease-1>", self.on_box_end)
 
     def display_map_image(self, map_image: Optional['PIL.Image.Image'] = None):
         """
@@ -101,6 +175,118 @@ class GameView:
             self.canvas.create_image(0, 0, image=self.map_photo, anchor=tk.NW)
             self.canvas.config(scrollregion=self.canvas.bbox(tk.ALL))
             self.canvas.config(width=800, height=600)
+        else:
+            self.map_photo = None
+            self.canvas.delete("all")
+
+    def bind_events(self, events: EventBus):
+        """
+        Subscribe to the changes this view shows.
+
+        Args:
+            events (EventBus): The controller's event bus.
+        """
+        events.subscribe(MapChanged, self.on_map_changed)
+        events.subscribe(PlayerUpdated, self.on_stats_changed)
+        events.subscribe(RollAppended, self.on_stats_changed)
+        events.subscribe(TurnAdvanced, self.on_turn_advanced)
+
+    def on_map_changed(self, event: MapChanged):
+        """
+        Repaint the map in place, keeping the canvas item and scroll region.
+
+        Only the event's box is copied into the photo; the whole map is pasted
+        when the box is None.
+        """
+        map_image = self.controller("get_map_image")
+        if not (self.map_photo and map_image and (self.map_photo.width(), self.map_photo.height()) == map_image.size):
+            self.display_map_image(map_image)
+        elif event.bbox is None:
+            self.map_photo.paste(map_image)
+        else:
+            x0, y0, x1, y1 = event.bbox
+            if x1 > x0 and y1 > y0:
+                # ImageTk can only paste a whole image, so the box goes through Tk's photo copy
+                patch = ImageTk.PhotoImage(map_image.crop(event.bbox))
+                self.canvas.tk.call(str(self.map_photo), "copy", str(patch), "-to", x0, y0,
+                                    "-compositingrule", "set")
+
+    def on_stats_changed(self, event):
+        self.refresh()
+
+    def on_turn_advanced(self, event: TurnAdvanced):
+        self.update_turn_label(event.turn)
+        self.refresh()
+
+    def toggle_lasso(self):
+        self.lasso_mode = not self.lasso_mode
+        self.lasso_button.config(text=f"Lasso Tool: {'On' if self.lasso_mode else 'Off'}")
+
+    def on_canvas_press(self, event):
+        if not self.lasso_mode:
+            self.controller("canvas_click", event)
+            return
+        self.lasso_points = [self.get_canvas_click_coordinates(event)]
+        self.canvas.delete("lasso")
+
+    def on_canvas_drag(self, event):
+        if self.lasso_mode and self.lasso_points:
+            point = self.get_canvas_click_coordinates(event)
+            self.canvas.create_line(*self.lasso_points[-1], *point, fill='black', width=2, tags="lasso")
+            self.lasso_points.append(point)
+
+    def on_canvas_release(self, event):
+        if self.lasso_mode and self.lasso_points:
+            points, self.lasso_points = self.lasso_points, []
+            if len(points) >= 3:
+                self.canvas.create_line(*points[-1], *points[0], fill='black', width=2, tags="lasso")
+                self.controller("lasso_select", points)
+            self.canvas.delete("lasso")
+
+    def show_lasso_preview(self, overlay: 'PIL.Image.Image', position: tuple):
+        """
+        Draw a translucent overlay of the regions a lasso would change.
+
+        Args:
+            overlay (PIL.Image.Image): RGBA overlay image.
+            position (tuple): (x, y) of the overlay's top-left corner on the map.
+        """
+        self.lasso_photo = ImageTk.PhotoImage(overlay)
+        self.canvas.create_image(*position, image=self.lasso_photo, anchor=tk.NW, tags="lasso_preview")
+        self.canvas.update_idletasks()
+
+    def clear_lasso_preview(self):
+        self.canvas.delete("lasso_preview")
+        self.lasso_photo = None
+
+    def on_box_start(self, event):
+        self.drag_start = self.get_canvas_click_coordinates(event)
+        self.canvas.delete("rubber_band")
+        x, y = self.drag_start
+        self.canvas.create_rectangle(x, y, x, y, outline='black', dash=(4, 2), tags="rubber_band")
+
+    def on_box_drag(self, event):
+        if self.drag_start:
+            x, y = self.get_canvas_click_coordinates(event)
+            self.canvas.coords("rubber_band", *self.drag_start, x, y)
+
+    def on_box_end(self, event):
+        if self.drag_start:
+            x, y = self.get_canvas_click_coordinates(event)
+            self.canvas.delete("rubber_band")
+            self.controller("box_select", self.drag_start + (x, y))
+            self.drag_start = None
+
+    def show_selection(self, boxes: list):
+        """
+        Outline the regions selected for a batch fill.
+
+        Args:
+            boxes (list): (x0, y0, x1, y1) bounding box per selected region.
+        """
+        self.canvas.delete("selection")
+        for x0, y0, x1, y1 in boxes:
+            self.canvas.create_rectangle(x0, y0, x1 - 1, y1 - 1, outline='red', tags="selection")
 
     def update_turn_label(self, turn: int):
         """
@@ -111,6 +297,21 @@ class GameView:
         """
         self.turn_label.config(text=f"Turn: {turn}")
 
+    def update_tile_server_button(self, url: Optional[str], lan: bool = False):
+        """
+        Show whether the spectator server is running, where, and who can reach it.
+
+        Args:
+            url (str, optional): The viewer's address, or None when the server is stopped.
+            lan (bool): Whether the server is open to the local network.
+        """
+        self.server_button.config(text="Stop Spectator Server" if url else "Start Spectator Server")
+        # The interface is chosen on start, so the setting is locked while the server runs
+        self.server_lan_check.config(state=tk.DISABLED if url else tk.NORMAL)
+        if url:
+            url += "\nOpen to the local network, no password" if lan else "\nThis computer only"
+        self.server_label.config(text=url or "")
+
     def update_mode_button(self, current_mode: str):
         """
         Update the mode toggle button text based on the current mode.
@@ -123,6 +324,41 @@ class GameView:
         else:
             self.mode_button.config(text="Switch to Color Mode")
 
+    def update_player_stats(self, stats: Optional[tuple]):
+        """
+        Show the selected player's territory and remaining tiles.
+
+        Args:
+            stats (tuple, optional): (regions, area, remaining_tiles), or None to clear.
+        """
+        if stats is None:
+            self.stats_label.config(text="")
+            return
+        regions, area, remaining_tiles = stats
+        self.stats_label.config(text=f"Regions: {regions}\nArea: {area} px\nTiles left: {remaining_tiles}")
+
+    def refresh(self):
+        """
+        Refresh the selected player's statistics.
+        """
+        self.update_player_stats(self.controller("get_selected_player_stats"))
+
+    def show_turn_report(self, table: str):
+        """
+        Show the per-turn territory report in its own window.
+
+        Args:
+            table (str): The report rendered as a text table.
+        """
+        window = tk.Toplevel(self.frame)
+        window.title("Turn Report")
+        text = tk.Text(window, wrap=tk.NONE, font=("Courier", 10), width=80, height=25)
+        text.insert(tk.END, table)
+        text.config(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        tk.Button(window, text="Export CSV...",
+                  command=lambda: self.controller("export_turn_report")).pack(pady=5)
+
     def update_player_buttons(self, players: list, selected_player: Optional['Player'] = None):
         """
         Update the player selection buttons based on the current list of players.
@@ -5,5 +5,7 @@ from .game_view import GameView
 from .players_view import PlayersView
 from .alliances_view import AlliancesView
 from .roll_view import RollView
+from .replay_view import ReplayView
+from .latency_view import LatencyView
 
-__all__ = ['StartView', 'GameView', 'PlayersView', 'AlliancesView', 'RollView']
+__all__ = ['StartView', 'GameView', 'PlayersView', 'AlliancesView', 'RollView', 'ReplayView', 'LatencyView']
@@ -0,0 +1,69 @@
+# views/latency_view.py
+
+import tkinter as tk
+from typing import Callable
+
+REFRESH_MS = 1000
+
+
+class LatencyView:
+    def __init__(self, parent: tk.Misc, controller: Callable):
+        """
+        Initialize the LatencyView, a debug window listing p50/p95/max per action and phase.
+
+        The table refreshes once a second while the window is open. Its own
+        callbacks aren't timed, so watching the numbers doesn't change them.
+
+        Args:
+            parent (tk.Misc): The parent window, e.g. a Toplevel.
+            controller (Callable): The controller callback to handle user actions.
+        """
+        self.parent = parent
+        self.controller = controller
+        self.frame = tk.Frame(parent)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.refresh_job = None
+        self.setup_widgets()
+        self.refresh()
+
+    def setup_widgets(self):
+        """
+        Set up the timing table and the recording controls.
+        """
+        buttons = tk.Frame(self.frame)
+        buttons.pack(fill=tk.X, padx=10, pady=5)
+        self.toggle_button = tk.Button(buttons, command=self.toggle_recording)
+        self.toggle_button.pack(side=tk.LEFT)
+        tk.Button(buttons, text="Reset", command=lambda: self.controller("reset_latency")).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Export JSON...",
+                  command=lambda: self.controller("export_latency")).pack(side=tk.LEFT)
+        self.update_toggle_button(self.controller("is_latency_enabled"))
+
+        self.text = tk.Text(self.frame, wrap=tk.NONE, font=("Courier", 10), width=82, height=25)
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    def toggle_recording(self):
+        self.update_toggle_button(self.controller("toggle_latency"))
+
+    def update_toggle_button(self, enabled: bool):
+        self.toggle_button.config(text="Stop Recording" if enabled else "Start Recording")
+
+    def refresh(self):
+        """
+        Redraw the timing table, keeping the scroll position, and schedule the next refresh.
+        """
+        position = self.text.yview()[0]
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, self.controller("get_latency_table"))
+        self.text.config(state=tk.DISABLED)
+        self.text.yview_moveto(position)
+        self.refresh_job = self.frame.after(REFRESH_MS, self.refresh)
+
+    def destroy(self):
+        """
+        Stop refreshing and destroy the LatencyView frame.
+        """
+        if self.refresh_job:
+            self.frame.after_cancel(self.refresh_job)
+        self.frame.destroy()
@@ -1,9 +1,12 @@
 # views/players_view.py
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import simpledialog, colorchooser, messagebox
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 from models.player import Player
+from views.virtual_list import VirtualRowList
+from controllers.event_bus import EventBus, PlayerUpdated, RollAppended, TurnAdvanced
 
 
 class PlayersView:
@@ -20,7 +23,9 @@ class PlayersView:
         self.frame = tk.Frame(parent)
         self.frame.pack(fill=tk.BOTH, expand=True)
         self.selected_player: Optional[Player] = None
-        self.selected_player_label: Optional[tk.Label] = None
+        self.selected_index: Optional[int] = None
+        self.players: List[Player] = []
+        self.rows: List[tuple] = []  # Display values per player, compared to find changed rows
         self.setup_widgets()
 
     def setup_widgets(self):
@@ -33,9 +38,12 @@ class PlayersView:
         )
         title_label.pack(pady=10)
 
-        # Players List Frame
-        self.player_list_frame = tk.Frame(self.frame)
-        self.player_list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        # Players List, only the visible rows have widgets
+        self.large_font = ('TkDefaultFont', 12)
+        self.empty_label = tk.Label(self.frame, text="No players added.", font=("Arial", 12))
+        row_height = tkfont.Font(font=self.large_font).metrics('linespace') + 10
+        self.player_list = VirtualRowList(self.frame, self.create_player_row, self.fill_player_row, row_height)
+        self.player_list.pack(fill=tk.BOTH, expand=True, pady=5)
 
         # Buttons Frame
         buttons_frame = tk.Frame(self.frame)
@@ -61,75 +69,101 @@ class PlayersView:
 
         self.update_player_list()
 
-    def update_player_list(self, players: list = []):
+    def update_player_list(self):
         """
         Update the list of players displayed.
 
-        Args:
-            players (list, optional): List of Player objects. Defaults to [].
+        Fetches every player's row in one call and refills only the visible
+        rows whose values changed.
         """
-        # Clear existing widgets
-        for widget in self.player_list_frame.winfo_children():
-            widget.destroy()
-
-        # If no players are provided, request from controller
-        if not players:
-            players = self.controller("get_players")
+        rows = self.controller("get_player_rows")
+        players = [row[0] for row in rows]
+        values = [(player.name, player.faction) + tuple(info) for player, *info in rows]
+        changed = [index for index, row in enumerate(values)
+                   if index >= len(self.rows) or row != self.rows[index] or players[index] is not self.players[index]]
+        self.players = players
+        self.rows = values
+        previous = self.selected_index
+        self.selected_index = next((index for index, player in enumerate(players)
+                                    if player is self.selected_player), None)
+        if self.selected_index is None:
+            self.selected_player = None
+        if previous != self.selected_index:
+            changed += [index for index in (previous, self.selected_index) if index is not None]
+
+        if players:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(before=self.player_list.frame)
+        self.player_list.set_row_count(len(values))
+        self.player_list.update_rows(changed)
 
-        if not players:
-            no_players_label = tk.Label(
-                self.player_list_frame, text="No players added.", font=("Arial", 12)
-            )
-            no_players_label.pack()
-            return
+    def bind_events(self, events: EventBus):
+        """
+        Subscribe to the changes this view shows; each refreshes only the rows that changed.
 
-        # Define a larger font for player entries
-        large_font = ('TkDefaultFont', 12)
+        Args:
+            events (EventBus): The controller's event bus.
+        """
+        for event_type in (PlayerUpdated, RollAppended, TurnAdvanced):
+            events.subscribe(event_type, self.on_players_changed)
 
-        for player in players:
-            # Create a frame for each player
-            player_entry = tk.Frame(self.player_list_frame)
-            player_entry.pack(anchor='w', padx=10, pady=5)
+    def on_players_changed(self, event):
+        self.update_player_list()
 
-            # Player Information
-            roll_info = self.controller("get_player_roll_info", player.name)
-            roll_value, total_tiles, remaining_tiles = roll_info
+    def create_player_row(self, parent: tk.Frame) -> dict:
+        """
+        Build the widgets of one recycled player row.
 
-            display_text = f"{player.name} - Roll: {roll_value}, Tiles: {remaining_tiles}/{total_tiles}"
+        Args:
+            parent (tk.Frame): The row's slot frame.
 
-            # Player Label
-            player_label = tk.Label(
-                player_entry, text=display_text, font=large_font
-            )
-            player_label.pack(anchor='w')
-            player_label.bind(
-                '<Button-1>',
-                lambda e, p=player, l=player_label: self.on_player_select(p, l)
-            )
+        Returns:
+            dict: The row's widgets and the index of the player it shows.
+        """
+        row = {"index": None}
+        row["label"] = tk.Label(parent, font=self.large_font, anchor='w')
+        row["label"].pack(side=tk.LEFT, padx=(10, 0))
+        # Faction shown in red after the player's details
+        row["faction"] = tk.Label(parent, font=self.large_font, fg='red', anchor='w')
+        row["faction"].pack(side=tk.LEFT, padx=20)
+        for widget in (parent, row["label"], row["faction"]):
+            widget.bind('<Button-1>', lambda e, r=row: self.on_player_select(r["index"]))
+        return row
+
+    def fill_player_row(self, row: dict, index: int):
+        """
+        Show a player's details in a recycled row.
 
-            # Faction Label in red if exists
-            if player.faction:
-                faction_label = tk.Label(
-                    player_entry, text=player.faction, font=large_font, fg='red'
-                )
-                faction_label.pack(anchor='w', padx=20)
+        Args:
+            row (dict): Widgets returned by create_player_row.
+            index (int): Index of the player in the list.
+        """
+        row["index"] = index
+        name, faction, roll_value, total_tiles, remaining_tiles = self.rows[index]
+        background = 'lightblue' if index == self.selected_index else self.frame.cget('bg')
+        row["label"].config(text=f"{name} - Roll: {roll_value}, Tiles: {remaining_tiles}/{total_tiles}", bg=background)
+        row["faction"].config(text=faction or "")
 
-    def on_player_select(self, player: Player, label: tk.Label):
+    def on_player_select(self, index: Optional[int]):
         """
         Handle the selection of a player.
 
         Args:
-            player (Player): The selected Player object.
-            label (tk.Label): The label widget associated with the player.
+            index (int): Index of the selected player in the list.
         """
-        # Deselect previous selection
-        if self.selected_player_label:
-            self.selected_player_label.config(bg=self.player_list_frame.cget('bg'))
+        if index is None:
+            return
+        previous = self.selected_index
+        self.selected_index = index
+        self.selected_player = self.players[index]
+        self.player_list.update_rows([index] if previous is None else [previous, index])
 
-        # Select new player
-        self.selected_player = player
-        self.selected_player_label = label
-        label.config(bg='lightblue')  # Highlight selected player
+    def refresh(self):
+        """
+        Refresh the players list.
+        """
+        self.update_player_list()
 
     def add_player_dialog(self) -> Optional[dict]:
         """
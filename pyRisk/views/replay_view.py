@@ -0,0 +1,137 @@
+# views/replay_view.py
+
+import queue
+import tkinter as tk
+from PIL import ImageTk
+from typing import Callable, Optional
+from utils.frame_prefetch import FramePrefetcher
+
+PREVIEW_SIZE = (960, 600)  # Box scrubbing previews are shrunk to fit
+POLL_MS = 15  # How often decoded frames are picked up from the worker
+SETTLE_MS = 200  # Slider rest time before the full resolution frame is shown
+
+
+class ReplayView:
+    def __init__(self, parent: tk.Misc, controller: Callable):
+        """
+        Initialize the ReplayView, a turn slider over the saved map snapshots.
+
+        While the slider moves, downscaled previews are shown; once it rests
+        the full resolution frame replaces the preview. Frames are decoded by
+        a FramePrefetcher, and this view polls it for finished frames so all
+        Tk calls stay on the main thread.
+
+        Args:
+            parent (tk.Misc): The parent window, e.g. a Toplevel.
+            controller (Callable): The controller callback to handle user actions.
+        """
+        self.parent = parent
+        self.controller = controller
+        self.frame = tk.Frame(parent)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        frames = self.controller("get_replay_frames")
+        self.turns = [turn for turn, _ in frames]
+        self.prefetcher = FramePrefetcher([path for _, path in frames], PREVIEW_SIZE)
+        self.index = len(self.turns) - 1
+        self.showing: Optional[tuple] = None  # (index, full) of the frame on screen
+        self.photo = None
+        self.settle_job = None
+        self.poll_job = None
+        self.setup_widgets()
+        self.show_frame(self.index)
+        self.poll_frames()
+
+    def setup_widgets(self):
+        """
+        Set up the frame canvas, turn slider and step buttons.
+        """
+        canvas_frame = tk.Frame(self.frame)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(canvas_frame, bg='grey', width=PREVIEW_SIZE[0], height=PREVIEW_SIZE[1])
+        h_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        v_scrollbar = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        controls = tk.Frame(self.frame)
+        controls.pack(fill=tk.X, padx=10, pady=5)
+        tk.Button(controls, text="<", command=lambda: self.step(-1)).pack(side=tk.LEFT)
+        self.slider = tk.Scale(
+            controls, from_=0, to=max(len(self.turns) - 1, 0), orient=tk.HORIZONTAL,
+            showvalue=False, command=lambda value: self.show_frame(int(value))
+        )
+        self.slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        tk.Button(controls, text=">", command=lambda: self.step(1)).pack(side=tk.LEFT)
+        self.turn_label = tk.Label(controls, text="", font=("Arial", 12), width=12)
+        self.turn_label.pack(side=tk.LEFT, padx=5)
+        self.slider.set(self.index)
+
+    def step(self, offset: int):
+        if self.turns:
+            self.slider.set(min(max(self.index + offset, 0), len(self.turns) - 1))
+
+    def show_frame(self, index: int):
+        """
+        Switch to a turn: show its preview if decoded, and ask for the full frame once the slider rests.
+
+        Args:
+            index (int): Index into the saved snapshots.
+        """
+        if not self.turns:
+            self.turn_label.config(text="No turns")
+            return
+        self.index = index
+        self.turn_label.config(text=f"Turn {self.turns[index]}")
+        if self.settle_job:
+            self.frame.after_cancel(self.settle_job)
+        self.settle_job = self.frame.after(SETTLE_MS, self.on_settled)
+        frame = self.prefetcher.get(index)
+        if frame is not None and self.showing != (index, True):
+            self.draw(frame, (index, False))
+
+    def on_settled(self):
+        self.settle_job = None
+        frame = self.prefetcher.get(self.index, full=True)
+        if frame is not None:
+            self.draw(frame, (self.index, True))
+
+    def poll_frames(self):
+        """
+        Draw newly decoded frames for the current turn, then poll again shortly.
+        """
+        try:
+            while True:
+                index, full = self.prefetcher.ready.get_nowait()
+                # A preview never replaces the full frame of the same turn
+                if index == self.index and self.showing != (index, True):
+                    frame = self.prefetcher.peek(index, full)
+                    if frame is not None:
+                        self.draw(frame, (index, full))
+        except queue.Empty:
+            pass
+        self.poll_job = self.frame.after(POLL_MS, self.poll_frames)
+
+    def draw(self, frame, key: tuple):
+        """
+        Put a decoded frame on the canvas, reusing the PhotoImage when the size matches.
+        """
+        if self.photo and (self.photo.width(), self.photo.height()) == frame.size:
+            self.photo.paste(frame)
+        else:
+            self.photo = ImageTk.PhotoImage(frame)
+            self.canvas.delete("all")
+            self.canvas.create_image(0, 0, image=self.photo, anchor=tk.NW)
+            self.canvas.config(scrollregion=(0, 0, *frame.size))
+        self.showing = key
+
+    def destroy(self):
+        """
+        Stop polling and the decoder thread, then destroy the ReplayView frame.
+        """
+        for job in (self.settle_job, self.poll_job):
+            if job:
+                self.frame.after_cancel(job)
+        self.prefetcher.close()
+        self.frame.destroy()
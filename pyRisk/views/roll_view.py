@@ -1,9 +1,12 @@
 # views/roll_view.py
 
 import tkinter as tk
-from tkinter import messagebox
-from typing import Callable, Optional
+from tkinter import messagebox, filedialog
+from typing import Callable, List, Optional
 from models.roll_table import RollTable
+from models.roll_history import RollHistory
+from views.virtual_list import VirtualTextList
+from controllers.event_bus import EventBus, RollAppended, TurnAdvanced
 
 
 class RollView:
@@ -20,6 +23,7 @@ class RollView:
         self.frame = tk.Frame(parent)
         self.frame.pack(fill=tk.BOTH, expand=True)
         self.roll_table: Optional[RollTable] = None
+        self.roll_history: RollHistory = self.controller("get_roll_history")
         self.setup_widgets()
 
     def setup_widgets(self):
@@ -43,13 +47,20 @@ class RollView:
         )
         roll_btn.pack(pady=5)
 
+        if self.controller("get_roll_mode") == "external":
+            import_btn = tk.Button(
+                self.frame, text="Import External Rolls",
+                command=self.import_rolls_dialog
+            )
+            import_btn.pack(pady=5)
+
         # Current Turn's Roll Results
         self.current_roll_label = tk.Label(
             self.frame, text="Roll Results for Turn 0:", font=("Arial", 14)
         )
         self.current_roll_label.pack(pady=10)
 
-        self.roll_results_text = tk.Text(self.frame, height=10, state=tk.DISABLED)
+        self.roll_results_text = VirtualTextList(self.frame, self.get_current_roll_lines, height=10)
         self.roll_results_text.pack(fill=tk.BOTH, expand=True, padx=10)
 
         # All Roll Results
@@ -58,11 +69,27 @@ class RollView:
         )
         self.all_rolls_label.pack(pady=10)
 
-        self.all_rolls_text = tk.Text(self.frame, height=10, state=tk.DISABLED)
+        self.all_rolls_text = VirtualTextList(self.frame, self.get_all_roll_lines, height=10)
         self.all_rolls_text.pack(fill=tk.BOTH, expand=True, padx=10)
 
         self.update_roll_displays()
 
+    def bind_events(self, events: EventBus):
+        """
+        Subscribe to the changes this view shows.
+
+        Args:
+            events (EventBus): The controller's event bus.
+        """
+        events.subscribe(RollAppended, self.on_rolls_appended)
+        events.subscribe(TurnAdvanced, self.on_turn_advanced)
+
+    def on_rolls_appended(self, event: RollAppended):
+        self.update_roll_displays()
+
+    def on_turn_advanced(self, event: TurnAdvanced):
+        self.current_roll_label.config(text=f"Roll Results for Turn {event.turn}:")
+
     def update_roll_displays(self):
         """
         Update the current and all roll results displays.
@@ -74,32 +101,115 @@ class RollView:
         """
         Update the current turn's roll results.
         """
-        turn, roll_results = self.controller("get_current_roll")
+        turn = self.controller("get_current_turn")
         self.current_roll_label.config(text=f"Roll Results for Turn {turn}:")
-        self.roll_results_text.config(state=tk.NORMAL)
-        self.roll_results_text.delete(1.0, tk.END)
-        for name, roll, tiles in roll_results:
-            self.roll_results_text.insert(tk.END, f"{name} rolled {roll} and gets {tiles} tiles.\n")
-        self.roll_results_text.config(state=tk.DISABLED)
+        if self.roll_history.batch_count():
+            start, end = self.roll_history.batch_range(-1)
+        else:
+            start = end = 0
+        self.roll_results_text.set_line_count(end - start)
 
     def update_all_rolls(self):
         """
         Update the all roll results display.
+
+        Each batch of rolls shows as a "Turn N:" header, one line per roll and
+        a blank separator, so the pane has len(history) + 2 * batches lines.
+        """
+        history = self.roll_history
+        self.all_rolls_text.set_line_count(len(history) + 2 * history.batch_count())
+
+    def get_current_roll_lines(self, start: int, end: int) -> List[str]:
+        """
+        Format lines of the latest roll batch for the current roll pane.
+
+        Args:
+            start (int): First line within the batch.
+            end (int): Line after the last within the batch.
+
+        Returns:
+            list: The formatted lines.
+        """
+        batch_start, _ = self.roll_history.batch_range(-1)
+        return [f"{name} rolled {roll} and gets {tiles} tiles."
+                for _, name, roll, tiles in self.roll_history.rows(batch_start + start, batch_start + end)]
+
+    def get_all_roll_lines(self, start: int, end: int) -> List[str]:
+        """
+        Format display lines of the whole roll history for the all rolls pane.
+
+        Args:
+            start (int): First display line.
+            end (int): Line after the last display line.
+
+        Returns:
+            list: The formatted lines.
+        """
+        history = self.roll_history
+        batch_starts = history.batch_starts
+        # Binary search for the batch containing the first line; batch b starts at line batch_starts[b] + 2 * b
+        low, high = 0, len(batch_starts) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if batch_starts[mid] + 2 * mid <= start:
+                low = mid
+            else:
+                high = mid - 1
+        lines = []
+        batch = low
+        while start + len(lines) < end and batch < len(batch_starts):
+            row_start, row_end = history.batch_range(batch)
+            offset = start + len(lines) - (row_start + 2 * batch)
+            if offset == 0:
+                turn = history.turns[row_start] if row_end > row_start else ""
+                lines.append(f"Turn {turn}:")
+                offset = 1
+            first_row = row_start + offset - 1
+            last_row = min(row_end, first_row + end - start - len(lines))
+            for _, name, roll, tiles in history.rows(first_row, last_row):
+                lines.append(f"  {name} rolled {roll} and gets {tiles} tiles.")
+            if start + len(lines) < end:
+                lines.append("")
+            batch += 1
+        return lines
+
+    def import_rolls_dialog(self):
+        """
+        Open a dialog to paste or load ``name,roll`` lines for a bulk submission.
         """
-        all_rolls = self.controller("get_all_rolls")
-        self.all_rolls_text.config(state=tk.NORMAL)
-        self.all_rolls_text.delete(1.0, tk.END)
-        for turn, roll_results in all_rolls:
-            self.all_rolls_text.insert(tk.END, f"Turn {turn}:\n")
-            for name, roll, tiles in roll_results:
-                self.all_rolls_text.insert(tk.END, f"  {name} rolled {roll} and gets {tiles} tiles.\n")
-            self.all_rolls_text.insert(tk.END, "\n")
-        self.all_rolls_text.config(state=tk.DISABLED)
+        dialog = tk.Toplevel(self.frame)
+        dialog.title("Import External Rolls")
+        tk.Label(dialog, text="Paste rolls, one 'name,roll' per line (CSV or TSV):").pack(padx=10, pady=5)
+        rolls_text = tk.Text(dialog, height=20, width=50)
+        rolls_text.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def load_file():
+            file_path = filedialog.askopenfilename(
+                parent=dialog, filetypes=[("Roll files", "*.csv;*.tsv;*.txt"), ("All files", "*.*")]
+            )
+            if file_path:
+                try:
+                    with open(file_path, newline='', encoding='utf-8-sig') as f:
+                        if self.controller("import_external_rolls", f):
+                            dialog.destroy()
+                except OSError as e:
+                    messagebox.showerror("Import Error", f"Could not read {file_path}:\n{e}", parent=dialog)
+
+        def submit():
+            if self.controller("import_external_rolls", rolls_text.get(1.0, tk.END).splitlines()):
+                dialog.destroy()
+
+        btn_frame = tk.Frame(dialog)
+        btn_frame.pack(pady=5)
+        tk.Button(btn_frame, text="Submit", command=submit).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Load File...", command=load_file).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
 
     def refresh(self):
         """
         Refresh the roll results displays.
         """
+        self.roll_history = self.controller("get_roll_history")
         self.update_roll_displays()
 
     def destroy(self):
@@ -0,0 +1,242 @@
+# views/virtual_list.py
+
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Any, Callable, List, Optional
+
+
+class VirtualTextList:
+    def __init__(self, parent: tk.Widget, get_lines: Callable[[int, int], List[str]], height: int = 10):
+        """
+        Initialize a read-only text pane that only renders the visible lines.
+
+        The pane holds no text of its own: it keeps a line count and asks
+        ``get_lines(start, end)`` for the lines in view whenever it scrolls or
+        the count changes, so refreshing costs the same for ten lines or a
+        hundred thousand. While scrolled to the bottom it follows new lines.
+
+        Args:
+            parent (tk.Widget): The parent Tkinter widget.
+            get_lines (Callable): Returns the lines in the [start, end) range.
+            height (int): Initial height of the pane in lines.
+        """
+        self.get_lines = get_lines
+        self.line_count = 0
+        self.top = 0
+        self.visible_lines = height
+
+        self.frame = tk.Frame(parent)
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(self.frame, height=height, wrap=tk.NONE, state=tk.DISABLED)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.line_height = max(1, tkfont.Font(font=self.text['font']).metrics('linespace'))
+
+        self.text.bind('<Configure>', self.on_configure)
+        self.text.bind('<MouseWheel>', self.on_mouse_wheel)
+        self.text.bind('<Button-4>', lambda event: self.scroll_by(-3))
+        self.text.bind('<Button-5>', lambda event: self.scroll_by(3))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_line_count(self, line_count: int):
+        """
+        Update the number of lines and redraw the visible window.
+
+        Args:
+            line_count (int): The new total number of lines.
+        """
+        at_bottom = self.top + self.visible_lines >= self.line_count
+        self.line_count = line_count
+        if at_bottom:
+            self.top = max(0, line_count - self.visible_lines)
+        self.render()
+
+    def render(self):
+        """
+        Replace the pane's text with the lines currently in view.
+        """
+        self.top = max(0, min(self.top, self.line_count - self.visible_lines))
+        end = min(self.line_count, self.top + self.visible_lines)
+        lines = self.get_lines(self.top, end) if end > self.top else []
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, '\n'.join(lines))
+        self.text.config(state=tk.DISABLED)
+        if self.line_count:
+            self.scrollbar.set(self.top / self.line_count, end / self.line_count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_by(self, lines: int):
+        self.top += lines
+        self.render()
+
+    def on_scrollbar(self, *args):
+        """
+        Handle scrollbar commands ('moveto', fraction) and ('scroll', n, 'units'/'pages').
+        """
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * self.line_count)
+            self.render()
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self.scroll_by(step * self.visible_lines if args[2] == 'pages' else step)
+
+    def on_mouse_wheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def on_configure(self, event):
+        visible_lines = max(1, event.height // self.line_height)
+        if visible_lines != self.visible_lines:
+            self.visible_lines = visible_lines
+            self.set_line_count(self.line_count)
+
+
+class VirtualRowList:
+    def __init__(self, parent: tk.Widget, create_row: Callable[[tk.Frame], Any],
+                 fill_row: Callable[[Any, int], None], row_height: int, height: int = 10):
+        """
+        Initialize a scrolling list of widget rows that only builds the visible rows.
+
+        The list keeps a pool of row slots, one per visible line, created with
+        ``create_row(slot_frame)``. Scrolling or resizing reassigns data rows to
+        the existing slots with ``fill_row(row, index)`` instead of creating
+        widgets, and update_rows refills only the slots showing changed rows.
+
+        Args:
+            parent (tk.Widget): The parent Tkinter widget.
+            create_row (Callable): Builds the widgets of one slot inside a frame and returns them.
+            fill_row (Callable): Shows data row ``index`` in a slot's widgets.
+            row_height (int): Height of each row in pixels.
+            height (int): Initial number of visible rows.
+        """
+        self.create_row = create_row
+        self.fill_row = fill_row
+        self.row_height = row_height
+        self.row_count = 0
+        self.top = 0
+        self.slots: List[Any] = []
+        self.slot_frames: List[tk.Frame] = []
+        self.slot_indices: List[Optional[int]] = []
+
+        self.frame = tk.Frame(parent)
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.body = tk.Frame(self.frame, height=row_height * height)
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.body.pack_propagate(False)
+
+        self.body.bind('<Configure>', self.on_configure)
+        self.bind_scroll(self.body)
+        self.resize_pool(height)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def bind_scroll(self, widget: tk.Widget):
+        widget.bind('<MouseWheel>', self.on_mouse_wheel)
+        widget.bind('<Button-4>', lambda event: self.scroll_by(-3))
+        widget.bind('<Button-5>', lambda event: self.scroll_by(3))
+
+    def resize_pool(self, visible_rows: int):
+        """
+        Grow or shrink the slot pool to the number of visible rows.
+
+        Args:
+            visible_rows (int): Number of rows that fit in the list.
+        """
+        while len(self.slots) < visible_rows:
+            slot_frame = tk.Frame(self.body, height=self.row_height)
+            slot_frame.pack_propagate(False)
+            slot = self.create_row(slot_frame)
+            self.bind_scroll(slot_frame)
+            for child in slot_frame.winfo_children():
+                self.bind_scroll(child)
+            self.slots.append(slot)
+            self.slot_frames.append(slot_frame)
+            self.slot_indices.append(None)
+        while len(self.slots) > visible_rows:
+            self.slots.pop()
+            self.slot_frames.pop().destroy()
+            self.slot_indices.pop()
+
+    def slot_row(self, slot_number: int) -> Optional[int]:
+        """
+        Get the data row index a slot is currently showing.
+        """
+        return self.slot_indices[slot_number]
+
+    def set_row_count(self, row_count: int):
+        """
+        Update the number of data rows and redraw the slots whose row moved.
+
+        Args:
+            row_count (int): The new total number of rows.
+        """
+        self.row_count = row_count
+        self.render()
+
+    def update_rows(self, indices):
+        """
+        Refill the visible slots that show any of the given data rows.
+
+        Args:
+            indices (iterable): Indices of the rows whose data changed.
+        """
+        changed = set(indices)
+        for slot_number, index in enumerate(self.slot_indices):
+            if index is not None and index in changed:
+                self.fill_row(self.slots[slot_number], index)
+
+    def render(self):
+        """
+        Assign the rows in view to the slots, filling only slots whose row changed.
+        """
+        visible_rows = len(self.slots)
+        self.top = max(0, min(self.top, self.row_count - visible_rows))
+        for slot_number in range(visible_rows):
+            index = self.top + slot_number
+            slot_frame = self.slot_frames[slot_number]
+            if index >= self.row_count:
+                if self.slot_indices[slot_number] is not None:
+                    slot_frame.pack_forget()
+                    self.slot_indices[slot_number] = None
+                continue
+            if self.slot_indices[slot_number] is None:
+                slot_frame.pack(fill=tk.X)
+            if self.slot_indices[slot_number] != index:
+                self.slot_indices[slot_number] = index
+                self.fill_row(self.slots[slot_number], index)
+        if self.row_count:
+            end = min(self.row_count, self.top + visible_rows)
+            self.scrollbar.set(self.top / self.row_count, end / self.row_count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_by(self, rows: int):
+        self.top += rows
+        self.render()
+
+    def on_scrollbar(self, *args):
+        """
+        Handle scrollbar commands ('moveto', fraction) and ('scroll', n, 'units'/'pages').
+        """
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * self.row_count)
+            self.render()
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self.scroll_by(step * len(self.slots) if args[2] == 'pages' else step)
+
+    def on_mouse_wheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def on_configure(self, event):
+        visible_rows = max(1, event.height // self.row_height)
+        if visible_rows != len(self.slots):
+            self.resize_pool(visible_rows)
+            self.render()